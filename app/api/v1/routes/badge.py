@@ -5,9 +5,14 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.core.auth import get_current_active_user, get_current_admin_user
+from app.core.fields import FieldSelection, field_selection
+from app.core.pagination import Page, pagination
+from app.core.responses import ModelResponse
 from app.db.session import get_session
 from app.services.badge_service import BadgeService
 from app.schemas.badge import (
+    BadgeBatchAssign,
+    BadgeBatchAssignResult,
     BadgeCreate,
     BadgeUpdate,
     BadgeRead,
@@ -15,8 +20,9 @@ from app.schemas.badge import (
     MemberBadgeUpdate,
     MemberBadgeRead
 )
+from app.schemas.member import MemberBadgeRanking
 from app.models.user import User
-from app.models.badge import MemberBadge
+from app.models.badge import Badge, MemberBadge
 
 router = APIRouter()
 
@@ -36,9 +42,9 @@ async def create_badge(
 
 @router.get("/", response_model=List[BadgeRead])
 async def list_badges(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(pagination(max_limit=200)),
     active_only: bool = Query(False, description="Filter only active badges"),
+    fields: Optional[FieldSelection] = Depends(field_selection(Badge, BadgeRead)),
     current_user: User = Depends(get_current_active_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -47,8 +53,27 @@ async def list_badges(
     All authenticated users can access this endpoint.
     """
     badge_service = BadgeService(session)
-    badges = await badge_service.get_all(skip=skip, limit=limit, active_only=active_only)
-    return badges
+    badges = await badge_service.get_all(
+        skip=page.skip, limit=page.limit, active_only=active_only, fields=fields
+    )
+    headers = await page.total_headers(lambda: badge_service.count_all(active_only=active_only))
+    if fields:
+        return fields.response(badges, headers=headers)
+    return ModelResponse(List[BadgeRead], badges, headers=headers)
+
+@router.get("/leaderboard", response_model=List[MemberBadgeRanking])
+async def badge_leaderboard(
+    limit: int = Query(default=10, ge=1, le=100),
+    current_user: User = Depends(get_current_active_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Members holding the most active badges.
+    All authenticated users can access this endpoint.
+    """
+    badge_service = BadgeService(session)
+    members = await badge_service.get_leaderboard(limit=limit)
+    return ModelResponse(List[MemberBadgeRanking], members)
 
 @router.get("/{badge_id}", response_model=BadgeRead)
 async def get_badge(
@@ -119,6 +144,26 @@ async def assign_badge(
     )
     return member_badge
 
+@router.post("/{badge_id}/assign:batch", response_model=BadgeBatchAssignResult)
+async def assign_badge_batch(
+    badge_id: UUID,
+    selection: BadgeBatchAssign,
+    current_user: User = Depends(get_current_admin_user),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Assign a badge to a list of members, every member of a company or every
+    registered attendee of an event. Members who already hold the badge are
+    skipped.
+    Only admin users can access this endpoint.
+    """
+    badge_service = BadgeService(session)
+    return await badge_service.assign_badge_batch(
+        badge_id=badge_id,
+        selection=selection,
+        issued_by_id=current_user.id
+    )
+
 @router.put("/member-badges/{member_badge_id}", response_model=MemberBadgeRead)
 async def update_member_badge(
     member_badge_id: UUID,
@@ -147,8 +192,7 @@ async def update_member_badge(
 @router.get("/members/{member_id}/badges", response_model=List[MemberBadgeRead])
 async def get_member_badges(
     member_id: UUID,
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(pagination(max_limit=200)),
     active_only: bool = Query(False, description="Filter only active badges"),
     current_user: User = Depends(get_current_active_user),
     session: AsyncSession = Depends(get_session)
@@ -160,17 +204,19 @@ async def get_member_badges(
     badge_service = BadgeService(session)
     member_badges = await badge_service.get_member_badges(
         member_id=member_id,
-        skip=skip,
-        limit=limit,
+        skip=page.skip,
+        limit=page.limit,
         active_only=active_only
     )
-    return member_badges
+    headers = await page.total_headers(
+        lambda: badge_service.count_member_badges(member_id=member_id, active_only=active_only)
+    )
+    return ModelResponse(List[MemberBadgeRead], member_badges, headers=headers)
 
 @router.get("/{badge_id}/holders", response_model=List[MemberBadgeRead])
 async def get_badge_holders(
     badge_id: UUID,
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(pagination(max_limit=200)),
     active_only: bool = Query(False, description="Filter only active badge holders"),
     current_user: User = Depends(get_current_active_user),
     session: AsyncSession = Depends(get_session)
@@ -182,11 +228,14 @@ async def get_badge_holders(
     badge_service = BadgeService(session)
     badge_holders = await badge_service.get_badge_holders(
         badge_id=badge_id,
-        skip=skip,
-        limit=limit,
+        skip=page.skip,
+        limit=page.limit,
         active_only=active_only
     )
-    return badge_holders
+    headers = await page.total_headers(
+        lambda: badge_service.count_badge_holders(badge_id=badge_id, active_only=active_only)
+    )
+    return ModelResponse(List[MemberBadgeRead], badge_holders, headers=headers)
 
 @router.delete("/members/{member_id}/badges/{badge_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_member_badge(
@@ -215,7 +264,7 @@ async def remove_member_badge(
         )
     
     # Delete the member badge
-    await session.delete(member_badge)
-    await session.commit()
+    badge_service = BadgeService(session)
+    await badge_service.remove_member_badge(member_badge)
     
     return None 
\ No newline at end of file
@@ -1,37 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging 
 
 from app.core.auth import get_current_active_user, get_current_admin_user, get_current_moderator_user
-from app.schemas.company import CompanyCreate, CompanyRead, CompanyUpdate
+from app.core.fields import FieldSelection, field_selection
+from app.core.pagination import Page, pagination
+from app.core.responses import ModelResponse
+from app.schemas.company import CompanyCreate, CompanyDetailRead, CompanyRead, CompanyUpdate
+from app.schemas.member import MemberSummary
 from app.services.company_service import CompanyService
 from app.db.session import get_session
+from app.models.company import Company
 from app.models.user import User
 
 router = APIRouter()
 
 @router.get("/", response_model=List[CompanyRead])
 async def read_companies(
+    page: Page = Depends(pagination(max_limit=100)),
+    fields: Optional[FieldSelection] = Depends(field_selection(Company, CompanyRead)),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     service = CompanyService(session)
-    companies = await service.get_all()
-    return companies
+    companies = await service.get_all(skip=page.skip, limit=page.limit, fields=fields)
+    headers = await page.total_headers(service.count_all)
+    if fields:
+        return fields.response(companies, headers=headers)
+    return ModelResponse(List[CompanyRead], companies, headers=headers)
 
-@router.get("/{company_id}", response_model=CompanyRead)
+@router.get("/{company_id}", response_model=CompanyDetailRead)
 async def read_company(
     company_id: UUID,
+    recent_members: int = Query(default=5, ge=0, le=20, description="Number of recent members to include"),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     service = CompanyService(session)
-    company = await service.get(company_id)
-    if not company:
+    detail = await service.get_detail(company_id, recent_members=recent_members)
+    if not detail:
         raise HTTPException(status_code=404, detail="Company not found")
-    return company
+    company, member_count, upcoming_event_count, members = detail
+    return CompanyDetailRead(
+        **CompanyRead.model_validate(company).model_dump(),
+        member_count=member_count,
+        upcoming_event_count=upcoming_event_count,
+        recent_members=[MemberSummary.model_validate(member) for member in members],
+    )
 
 @router.post("/", response_model=CompanyRead, status_code=status.HTTP_201_CREATED)
 async def create_company(
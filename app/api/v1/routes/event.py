@@ -1,24 +1,156 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from typing import List, Optional
 from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_active_user, get_current_admin_user, get_current_moderator_user
-from app.schemas.event import EventCreate, EventRead, EventUpdate
-from app.services.event_service import EventService
+from app.core.fields import FieldSelection, field_selection
+from app.core.pagination import CursorPage, Page, cursor_pagination, pagination
+from app.core.recurrence import as_utc
+from app.core.responses import ModelResponse
+from app.schemas.event import (
+    EventCalendar,
+    EventCreate,
+    EventDayCount,
+    EventOccurrenceRead,
+    EventOccurrenceUpdate,
+    EventRead,
+    EventRegistrationRead,
+    EventUpdate,
+)
+from app.services.event_service import (
+    EventService,
+    event_calendar_cache,
+    event_list_cache,
+    is_hot_window,
+)
+from app.services.registration_service import RegistrationService
 from app.db.session import get_session
+from app.models.event import Event
 from app.models.user import User
 
 router = APIRouter()
 
 @router.get("/", response_model=List[EventRead])
 async def read_events(
+    start_from: Optional[datetime] = Query(None, alias="from", description="Events starting at or after this time"),
+    start_to: Optional[datetime] = Query(None, alias="to", description="Events starting before this time"),
+    company_id: Optional[UUID] = None,
+    is_virtual: Optional[bool] = None,
+    page: CursorPage = Depends(cursor_pagination(max_limit=200)),
+    fields: Optional[FieldSelection] = Depends(field_selection(Event, EventRead)),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
+    """
+    Retrieve events, newest first, or those starting in a `from`/`to` window
+    in chronological order. Pages are linked by the X-Next-Cursor header.
+    """
+    cache_key = None
+    if is_hot_window(start_from or start_to):
+        cache_key = (
+            start_from, start_to, company_id, is_virtual, page.cursor, page.limit,
+            fields.key if fields else None,
+        )
+        cached = event_list_cache.get(cache_key)
+        if cached is not None:
+            body, headers = cached
+            return Response(content=body, media_type="application/json", headers=headers)
+
     service = EventService(session)
-    events = await service.get_all()
-    return events
+    events = await service.get_all(
+        fields=fields,
+        start_from=start_from,
+        start_to=start_to,
+        company_id=company_id,
+        is_virtual=is_virtual,
+        cursor=page.cursor,
+        limit=page.limit,
+    )
+    next_cursor = service.next_cursor(events, page.limit)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if fields:
+        response = fields.response(events, headers=headers)
+    else:
+        response = ModelResponse(List[EventRead], events, headers=headers)
+    if cache_key is not None:
+        event_list_cache.set(cache_key, (response.body, headers))
+    return response
+
+
+@router.get("/occurrences", response_model=List[EventOccurrenceRead])
+async def read_event_occurrences(
+    start_from: datetime = Query(..., alias="from", description="Occurrences starting at or after this time"),
+    start_to: datetime = Query(..., alias="to", description="Occurrences starting before this time, at most a year later"),
+    company_id: Optional[UUID] = None,
+    is_virtual: Optional[bool] = None,
+    limit: int = Query(default=500, ge=1, le=1000),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Everything happening in a time window: single events plus the occurrences
+    of recurring series, in start order.
+    """
+    start_from, start_to = as_utc(start_from), as_utc(start_to)
+    if start_to <= start_from or start_to - start_from > timedelta(days=366):
+        raise HTTPException(status_code=400, detail="The window must be positive and at most 366 days")
+
+    cache_key = None
+    if is_hot_window(start_from):
+        cache_key = ("occurrences", start_from, start_to, company_id, is_virtual, limit)
+        cached = event_list_cache.get(cache_key)
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+
+    service = EventService(session)
+    occurrences = await service.get_occurrences(
+        start_from, start_to, company_id=company_id, is_virtual=is_virtual, limit=limit
+    )
+    response = ModelResponse(List[EventOccurrenceRead], occurrences)
+    if cache_key is not None:
+        event_list_cache.set(cache_key, response.body)
+    return response
+
+
+@router.get("/calendar", response_model=EventCalendar)
+async def read_event_calendar(
+    year: int = Query(..., ge=1970, le=2100),
+    month: int = Query(..., ge=1, le=12),
+    tz: str = Query("UTC", alias="timezone", description="IANA time zone the days are counted in"),
+    company_id: Optional[UUID] = None,
+    is_virtual: Optional[bool] = None,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Number of events starting on each day of a month.
+    """
+    try:
+        ZoneInfo(tz)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise HTTPException(status_code=400, detail=f"Unknown time zone '{tz}'")
+
+    cache_key = None
+    if is_hot_window(datetime(year, month, 1, tzinfo=timezone.utc)):
+        cache_key = (year, month, tz, company_id, is_virtual)
+        cached = event_calendar_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    service = EventService(session)
+    days = await service.calendar(year, month, tz=tz, company_id=company_id, is_virtual=is_virtual)
+    calendar = EventCalendar(
+        year=year,
+        month=month,
+        timezone=tz,
+        days=[EventDayCount(day=day, count=count) for day, count in days],
+    )
+    if cache_key is not None:
+        event_calendar_cache.set(cache_key, calendar)
+    return calendar
 
 
 @router.get("/{event_id}", response_model=EventRead)
@@ -72,3 +204,93 @@ async def delete_event(
         raise HTTPException(status_code=404, detail="Event not found")
     await service.delete(event)
     return None
+
+
+@router.put("/{event_id}/occurrences/{occurrence_start}", response_model=EventOccurrenceRead)
+async def update_event_occurrence(
+    event_id: UUID,
+    occurrence_start: datetime,
+    occurrence_in: EventOccurrenceUpdate,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_moderator_user)
+):
+    """
+    Change one occurrence of a recurring event (identified by its original start).
+    """
+    service = EventService(session)
+    event = await service.get(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    occurrence = await service.update_occurrence(event, occurrence_start, occurrence_in)
+    if occurrence is None:
+        raise HTTPException(status_code=409, detail="Occurrence is cancelled")
+    return occurrence
+
+
+@router.delete("/{event_id}/occurrences/{occurrence_start}", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_event_occurrence(
+    event_id: UUID,
+    occurrence_start: datetime,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_moderator_user)
+):
+    """
+    Cancel one occurrence of a recurring event.
+    """
+    service = EventService(session)
+    event = await service.get(event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+    await service.update_occurrence(event, occurrence_start, EventOccurrenceUpdate(is_cancelled=True))
+    return None
+
+
+@router.post("/{event_id}/registrations", response_model=EventRegistrationRead, status_code=status.HTTP_201_CREATED)
+async def register_for_event(
+    event_id: UUID,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Register the current member, or waitlist them when the event is full.
+    Repeating the request returns the existing registration with 200.
+    """
+    service = RegistrationService(session)
+    registration, created = await service.register(event_id, current_user.member_id)
+    if not created:
+        response.status_code = status.HTTP_200_OK
+    return registration
+
+
+@router.delete("/{event_id}/registrations/me", status_code=status.HTTP_204_NO_CONTENT)
+async def cancel_event_registration(
+    event_id: UUID,
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Cancel the current member's registration; the seat goes to the waitlist.
+    """
+    service = RegistrationService(session)
+    await service.cancel(event_id, current_user.member_id)
+    return None
+
+
+@router.get("/{event_id}/registrations", response_model=List[EventRegistrationRead])
+async def read_event_registrations(
+    event_id: UUID,
+    status: Optional[str] = Query(None, pattern="^(registered|waitlisted|cancelled)$"),
+    page: Page = Depends(pagination(max_limit=200)),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_moderator_user)
+):
+    """
+    Registrations of an event in queue order.
+    """
+    service = RegistrationService(session)
+    registrations = await service.get_registrations(
+        event_id, status=status, skip=page.skip, limit=page.limit
+    )
+    headers = await page.total_headers(lambda: service.count_registrations(event_id, status=status))
+    return ModelResponse(List[EventRegistrationRead], registrations, headers=headers)
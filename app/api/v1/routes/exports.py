@@ -0,0 +1,59 @@
+from typing import AsyncIterator, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.core.auth import get_current_admin_user
+from app.core.config import settings
+from app.core.exports import EXPORT_MEDIA_TYPES, encode_csv, encode_ndjson, encode_parquet, PARQUET_AVAILABLE
+from app.db.session import async_session
+from app.models.user import User
+from app.schemas.exports import ExportEntityType, ExportFormat
+from app.services.export_service import ExportService
+
+router = APIRouter()
+
+
+@router.get("/{entity}")
+async def export_rows(
+    entity: ExportEntityType,
+    format: ExportFormat = Query(default="ndjson"),
+    after: Optional[UUID] = Query(
+        default=None, description="Resume after this id (the last one received)"
+    ),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Stream every member, follower relationship or badge assignment as CSV,
+    NDJSON or Parquet, ordered by id from one consistent snapshot.
+    """
+    if format == "parquet" and not PARQUET_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Parquet exports are not available on this server",
+        )
+    return StreamingResponse(
+        _export_body(entity, format, after),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
+
+
+async def _export_body(
+    entity: ExportEntityType, fmt: ExportFormat, after: Optional[UUID]
+) -> AsyncIterator[bytes]:
+    # Request-scoped dependencies are closed before a streamed body is sent,
+    # so the export runs on its own session
+    async with async_session() as session:
+        service = ExportService(session)
+        columns, python_types = service.columns(entity)
+        batches = service.stream(entity, after=after, batch_size=settings.EXPORT_BATCH_SIZE)
+        if fmt == "csv":
+            body = encode_csv(columns, batches)
+        elif fmt == "parquet":
+            body = encode_parquet(columns, python_types, batches)
+        else:
+            body = encode_ndjson(columns, batches)
+        async for chunk in body:
+            yield chunk
@@ -0,0 +1,71 @@
+import tempfile
+from typing import AsyncIterator, BinaryIO, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from app.core.auth import get_current_moderator_user
+from app.core.config import settings
+from app.db.session import async_session
+from app.models.user import User
+from app.schemas.imports import ImportEntityType, ImportFormat, ImportProgress
+from app.services.import_service import ImportService
+
+router = APIRouter()
+
+CONTENT_TYPE_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+@router.post("/", response_model=ImportProgress)
+async def import_rows(
+    request: Request,
+    entity: ImportEntityType = Query(..., description="Kind of rows in the upload"),
+    format: Optional[ImportFormat] = Query(
+        default=None, description="Upload format, taken from Content-Type when omitted"
+    ),
+    chunk_size: int = Query(default=settings.IMPORT_CHUNK_SIZE, ge=1, le=10000),
+    current_user: User = Depends(get_current_moderator_user)
+):
+    """
+    Bulk create members or companies from a CSV (with a header row) or NDJSON
+    request body.
+
+    The response is NDJSON: one ImportProgress line per chunk with the
+    cumulative counts and that chunk's row errors, then a final line with
+    `done: true`. Chunks are committed as they go.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    fmt = format or CONTENT_TYPE_FORMATS.get(content_type)
+    if fmt is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send text/csv or application/x-ndjson, or set the format parameter",
+        )
+
+    # Spool the upload before responding: the body cannot be read once the
+    # response has started streaming
+    upload = tempfile.SpooledTemporaryFile(max_size=settings.IMPORT_SPOOL_BYTES)
+    async for chunk in request.stream():
+        upload.write(chunk)
+    upload.seek(0)
+    return StreamingResponse(
+        _progress_lines(entity, fmt, upload, chunk_size), media_type="application/x-ndjson"
+    )
+
+
+async def _progress_lines(
+    entity: ImportEntityType, fmt: ImportFormat, upload: BinaryIO, chunk_size: int
+) -> AsyncIterator[str]:
+    # Request-scoped dependencies are closed before a streamed body is sent,
+    # so the import runs on its own session
+    try:
+        async with async_session() as session:
+            async for progress in ImportService(session).run(entity, fmt, upload, chunk_size):
+                yield progress.model_dump_json() + "\n"
+    finally:
+        upload.close()
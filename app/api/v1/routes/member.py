@@ -1,14 +1,27 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import get_current_active_user, get_current_admin_user, get_current_moderator_user
-from app.schemas.member import MemberCreate, MemberRead, MemberUpdate, MemberPublicRead
+from app.core.fields import FieldSelection, field_selection
+from app.core.pagination import Page, pagination
+from app.core.responses import ModelResponse
+from app.schemas.member import (
+    MemberCreate,
+    MemberRead,
+    MemberUpdate,
+    MemberPublicRead,
+    MemberSearchHit,
+    MemberSearchResults,
+    MemberSuggestion,
+    MemberSummary,
+)
 from app.schemas.social_link import SocialLinkCreate, SocialLinkRead
 from app.schemas.external_link import ExternalLinkCreate, ExternalLinkRead
 from app.services.member_service import MemberService
 from app.db.session import get_session
+from app.models.member import Member
 from app.models.user import User
 
 router = APIRouter()
@@ -16,17 +29,56 @@ router = APIRouter()
 
 @router.get("/", response_model=List[MemberRead])
 async def read_members(
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=100, ge=1, le=100),
+    page: Page = Depends(pagination(max_limit=100)),
+    fields: Optional[FieldSelection] = Depends(field_selection(Member, MemberRead)),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
     """
     Retrieve all members with pagination.
+    Use `fields` to return (and load) only a subset of fields.
+    """
+    service = MemberService(session)
+    members = await service.get_all(skip=page.skip, limit=page.limit, fields=fields)
+    headers = await page.total_headers(service.count_all)
+    if fields:
+        return fields.response(members, headers=headers)
+    return ModelResponse(List[MemberRead], members, headers=headers)
+
+
+@router.get("/search", response_model=MemberSearchResults)
+async def search_members(
+    q: str = Query(..., min_length=2, max_length=200, description="Search text"),
+    limit: int = Query(default=20, ge=1, le=50),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Full-text and fuzzy search over member names, user name, position and bio.
     """
     service = MemberService(session)
-    members = await service.get_all(skip=skip, limit=limit)
-    return members
+    rows, next_cursor = await service.search(q, limit=limit, cursor=cursor)
+    items = [
+        MemberSearchHit(**MemberSummary.model_validate(member).model_dump(), rank=rank)
+        for member, rank in rows
+    ]
+    return MemberSearchResults(items=items, next_cursor=next_cursor)
+
+
+@router.get("/autocomplete", response_model=List[MemberSuggestion])
+async def autocomplete_members(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Start of a user name or slug"),
+    limit: int = Query(default=10, ge=1, le=20),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Prefix completion on user name and slug for mention and follow pickers.
+    """
+    service = MemberService(session)
+    suggestions = await service.autocomplete(prefix, limit=limit)
+    return ModelResponse(List[MemberSuggestion], suggestions)
 
 
 @router.get("/{member_id}", response_model=MemberRead)
@@ -147,8 +199,7 @@ async def delete_member(
 @router.get("/company/{company_id}", response_model=List[MemberRead])
 async def read_company_members(
     company_id: UUID,
-    skip: int = Query(default=0, ge=0),
-    limit: int = Query(default=100, ge=1, le=100),
+    page: Page = Depends(pagination(max_limit=100)),
     session: AsyncSession = Depends(get_session),
     current_user: User = Depends(get_current_active_user)
 ):
@@ -156,8 +207,9 @@ async def read_company_members(
     Retrieve all members of a specific company with pagination.
     """
     service = MemberService(session)
-    members = await service.get_by_company(company_id, skip=skip, limit=limit)
-    return members
+    members = await service.get_by_company(company_id, skip=page.skip, limit=page.limit)
+    headers = await page.total_headers(lambda: service.count_by_company(company_id))
+    return ModelResponse(List[MemberRead], members, headers=headers)
 
 
 @router.post("/{member_id}/social-links", response_model=SocialLinkRead)
@@ -264,7 +316,7 @@ async def get_member_followers(
     """
     service = MemberService(session)
     followers = await service.get_followers(member_id, skip=skip, limit=limit)
-    return followers
+    return ModelResponse(List[MemberPublicRead], followers)
 
 
 @router.get("/{member_id}/following", response_model=List[MemberPublicRead])
@@ -280,4 +332,4 @@ async def get_member_following(
     """
     service = MemberService(session)
     following = await service.get_following(member_id, skip=skip, limit=limit)
-    return following 
\ No newline at end of file
+    return ModelResponse(List[MemberPublicRead], following) 
\ No newline at end of file
@@ -4,9 +4,13 @@ from typing import List, Optional
 from uuid import UUID
 
 from app.core.auth import get_current_active_user, get_current_admin_user
+from app.core.fields import FieldSelection, field_selection
+from app.core.pagination import Page, pagination
+from app.core.responses import ModelResponse
 from app.db.session import get_session
 from app.services.notification_service import NotificationService
 from app.schemas.notification import NotificationCreate, NotificationUpdate, NotificationRead
+from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.notification import NotificationType, NotificationPriority
 
@@ -14,11 +18,11 @@ router = APIRouter()
 
 @router.get("/", response_model=List[NotificationRead])
 async def list_notifications(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(pagination(max_limit=200)),
     active_only: bool = Query(False, description="Filter only active notifications"),
     type: Optional[NotificationType] = Query(None, description="Filter by notification type"),
     priority: Optional[NotificationPriority] = Query(None, description="Filter by priority"),
+    fields: Optional[FieldSelection] = Depends(field_selection(Notification, NotificationRead)),
     current_user: User = Depends(get_current_active_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -28,20 +32,30 @@ async def list_notifications(
     """
     notification_service = NotificationService(session)
     notifications = await notification_service.get_all(
-        skip=skip,
-        limit=limit,
+        skip=page.skip,
+        limit=page.limit,
         active_only=active_only,
         type=type.value if type else None,
-        priority=priority.value if priority else None
+        priority=priority.value if priority else None,
+        fields=fields
     )
-    return notifications
+    headers = await page.total_headers(
+        lambda: notification_service.count_all(
+            active_only=active_only,
+            type=type.value if type else None,
+            priority=priority.value if priority else None
+        )
+    )
+    if fields:
+        return fields.response(notifications, headers=headers)
+    return ModelResponse(List[NotificationRead], notifications, headers=headers)
 
 @router.get("/active", response_model=List[NotificationRead])
 async def list_active_notifications(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(pagination(max_limit=200)),
     type: Optional[NotificationType] = Query(None, description="Filter by notification type"),
     priority: Optional[NotificationPriority] = Query(None, description="Filter by priority"),
+    fields: Optional[FieldSelection] = Depends(field_selection(Notification, NotificationRead)),
     current_user: User = Depends(get_current_active_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -51,12 +65,21 @@ async def list_active_notifications(
     """
     notification_service = NotificationService(session)
     notifications = await notification_service.get_active_notifications(
-        skip=skip,
-        limit=limit,
+        skip=page.skip,
+        limit=page.limit,
         type=type.value if type else None,
-        priority=priority.value if priority else None
+        priority=priority.value if priority else None,
+        fields=fields
+    )
+    headers = await page.total_headers(
+        lambda: notification_service.count_active_notifications(
+            type=type.value if type else None,
+            priority=priority.value if priority else None
+        )
     )
-    return notifications
+    if fields:
+        return fields.response(notifications, headers=headers)
+    return ModelResponse(List[NotificationRead], notifications, headers=headers)
 
 @router.get("/{notification_id}", response_model=NotificationRead)
 async def get_notification(
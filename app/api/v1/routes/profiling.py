@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.core.auth import get_current_admin_user
+from app.core.config import settings
+from app.core.profiling import ProfilerBusy, profile_response, sample_stacks
+from app.models.user import User
+from app.schemas.profiling import ProfileFormat
+
+router = APIRouter()
+
+
+@router.get("/cpu")
+async def profile_cpu(
+    seconds: float = Query(default=10, gt=0, le=settings.PROFILING_MAX_SECONDS),
+    format: ProfileFormat = Query(default="speedscope"),
+    interval_ms: float = Query(default=settings.PROFILING_INTERVAL_MS, ge=1, le=100),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Sample the stacks of the worker serving this request for `seconds` and
+    return them as a speedscope file or collapsed stacks (flamegraph input).
+    Each worker is a separate process: repeat to cover several.
+    """
+    try:
+        sampler = await sample_stacks(seconds, interval_ms / 1000)
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc))
+    return profile_response(sampler, format, f"{seconds:g} s")
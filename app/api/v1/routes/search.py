@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import get_current_active_user
+from app.schemas.search import EntityType, SearchHit, SearchResults
+from app.services.search_service import FACETS, SearchIndexService
+from app.db.session import get_session
+from app.models.user import User
+
+router = APIRouter()
+
+
+@router.get("/", response_model=SearchResults)
+async def search(
+    q: str = Query(..., min_length=1, max_length=200, description="Search text"),
+    type: Optional[List[EntityType]] = Query(default=None, description="Restrict to entity types"),
+    facet: Optional[List[str]] = Query(
+        default=None, description="Facet filters as key:value, e.g. industry:Fintech"
+    ),
+    prefix: bool = Query(default=True, description="Match the last word as a prefix (typeahead)"),
+    skip: int = Query(default=0, ge=0),
+    limit: int = Query(default=20, ge=1, le=50),
+    session: AsyncSession = Depends(get_session),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Search members, companies and events with facet counts.
+    """
+    facets = {}
+    for item in facet or []:
+        key, separator, value = item.partition(":")
+        if not separator or key not in FACETS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid facet '{item}'. Use key:value with key one of: {', '.join(FACETS)}",
+            )
+        facets[key] = value
+
+    service = SearchIndexService(session)
+    hits, total, facet_counts = await service.search(
+        q, entity_types=type, facets=facets, prefix=prefix, skip=skip, limit=limit
+    )
+    return SearchResults(
+        items=[SearchHit(**hit) for hit in hits], total=total, facets=facet_counts
+    )
@@ -4,6 +4,8 @@ from typing import List
 from uuid import UUID
 
 from app.core.auth import get_current_active_user, get_current_admin_user
+from app.core.pagination import Page, pagination
+from app.core.responses import ModelResponse
 from app.db.session import get_session
 from app.services.user_service import UserService
 from app.schemas.user import UserRead, UserUpdate
@@ -13,8 +15,7 @@ router = APIRouter()
 
 @router.get("/", response_model=List[UserRead])
 async def list_users(
-    skip: int = 0,
-    limit: int = 100,
+    page: Page = Depends(pagination(max_limit=100)),
     current_user: User = Depends(get_current_admin_user),
     session: AsyncSession = Depends(get_session)
 ):
@@ -22,8 +23,9 @@ async def list_users(
     Retrieve users. Only accessible by admin users.
     """
     user_service = UserService(session)
-    users = await user_service.get_all(skip=skip, limit=limit)
-    return users
+    users = await user_service.get_all(skip=page.skip, limit=page.limit)
+    headers = await page.total_headers(user_service.count_all)
+    return ModelResponse(List[UserRead], users, headers=headers)
 
 @router.get("/{user_id}", response_model=UserRead)
 async def get_user(
@@ -6,12 +6,14 @@ from jose import JWTError, jwt
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.core.tracing import traced_function
 from app.db.session import get_session
 from app.services.user_service import UserService
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+@traced_function("auth.get_current_user")
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_session)
@@ -0,0 +1,70 @@
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from cachetools import LRUCache, TTLCache
+
+
+class StatsCache:
+    """
+    Thin wrapper around a cachetools cache that keeps hit/miss counters.
+    Every cache created through `create_cache` is registered by name so its
+    statistics can be reported in one place.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: Optional[float] = None,
+        getsizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.name = name
+        if ttl is not None:
+            self._cache = TTLCache(maxsize=maxsize, ttl=ttl, getsizeof=getsizeof)
+        else:
+            self._cache = LRUCache(maxsize=maxsize, getsizeof=getsizeof)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        try:
+            self._cache[key] = value
+        except ValueError:
+            # Value is larger than the whole cache budget, don't store it
+            pass
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def currsize(self) -> float:
+        return self._cache.currsize
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+caches: Dict[str, StatsCache] = {}
+
+
+def create_cache(
+    name: str,
+    maxsize: int,
+    ttl: Optional[float] = None,
+    getsizeof: Optional[Callable[[Any], int]] = None,
+) -> StatsCache:
+    cache = StatsCache(name, maxsize=maxsize, ttl=ttl, getsizeof=getsizeof)
+    caches[name] = cache
+    return cache
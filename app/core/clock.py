@@ -0,0 +1,36 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+
+class Clock:
+    """Source of the current time for time-based rules; swap in a FrozenClock in tests."""
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    async def sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+class FrozenClock(Clock):
+    """
+    Deterministic clock: time only moves through `advance` or `sleep`, and
+    sleeping returns immediately after moving the clock forward.
+    """
+
+    def __init__(self, now: datetime):
+        self._now = now
+
+    def now(self) -> datetime:
+        return self._now
+
+    def advance(self, delta: timedelta) -> datetime:
+        self._now += delta
+        return self._now
+
+    async def sleep(self, seconds: float) -> None:
+        self._now += timedelta(seconds=seconds)
+        await asyncio.sleep(0)
+
+
+system_clock = Clock()
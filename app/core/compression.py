@@ -0,0 +1,207 @@
+import gzip
+import hashlib
+import zlib
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import create_cache
+
+try:
+    import brotli
+except ImportError:  # brotli is optional, gzip is always available
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+    "text/",
+)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best supported encoding from an Accept-Encoding header,
+    honouring q-values. Brotli wins ties over gzip.
+    """
+    supported = ["br", "gzip"] if brotli is not None else ["gzip"]
+    weights = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[token] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in supported:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def _is_compressible(content_type: str) -> bool:
+    content_type = content_type.lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type
+
+
+class _StreamCompressor:
+    """Incremental compressor for gzip or brotli bodies."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31 selects the gzip container
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        # Flush after every chunk so streamed responses reach the client promptly
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.finish()
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    Negotiated gzip/brotli response compression.
+
+    Single-message responses below `minimum_size` are sent untouched. Larger
+    ones are compressed once and the result is kept in a size-bounded cache
+    keyed by the digest of the uncompressed body, so hot responses that keep
+    producing the same bytes are not compressed again. Streaming responses
+    are compressed chunk by chunk without buffering the whole body.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        cache_bytes: int = 16 * 1024 * 1024,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.cache = (
+            create_cache("compressed_responses", maxsize=cache_bytes, getsizeof=len)
+            if cache_bytes > 0
+            else None
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        key: Optional[Tuple[str, bytes]] = None
+        if self.cache is not None:
+            key = (encoding, hashlib.blake2b(body, digest_size=16).digest())
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=self.brotli_quality)
+        else:
+            compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+        if key is not None:
+            self.cache.set(key, compressed)
+        return compressed
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_StreamCompressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or not _is_compressible(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self._send(message)
+            else:
+                # Hold the start message until we know the body size
+                self.start_message = message
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start_message, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start_message["headers"])
+
+            if not more_body:
+                if len(body) < self.middleware.minimum_size:
+                    self.passthrough = True
+                    await self._send(start_message)
+                    await self._send(message)
+                    return
+                body = self.middleware.compress(self.encoding, body)
+                self._set_encoding_headers(headers)
+                headers["Content-Length"] = str(len(body))
+                await self._send(start_message)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            # Streaming response: size unknown, compress incrementally
+            self.compressor = _StreamCompressor(
+                self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality
+            )
+            self._set_encoding_headers(headers)
+            del headers["Content-Length"]
+            await self._send(start_message)
+
+        if more_body:
+            chunk = self.compressor.compress(body)
+        else:
+            chunk = self.compressor.finish(body)
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    def _set_encoding_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
@@ -2,27 +2,105 @@ from typing import Optional, List
 from pydantic_settings import BaseSettings
 from pydantic import EmailStr, validator, PostgresDsn
 import secrets
-from dotenv import load_dotenv
-import os
-
-# Load .env file explicitly
-load_dotenv(override=True)
 
 class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "BCSL API"
+    # Adds X-DB-Queries and Server-Timing headers to responses
+    DEBUG: bool = False
     
     # Authentication
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # Threads hashing and verifying passwords
+    BCRYPT_WORKERS: int = 4
     
     # Database
     DATABASE_URI: PostgresDsn
+    # Statements slower than this are logged; a sample of them with their plan
+    SLOW_QUERY_MS: int = 200
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.1
     
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
+
+    # Pagination
+    PAGINATION_EXACT_COUNT_THRESHOLD: int = 10000
+
+    # Search
+    MEMBER_SEARCH_CANDIDATES: int = 500
+    # In-memory user name/slug autocomplete (per process, two keys per member)
+    AUTOCOMPLETE_INDEX_ENABLED: bool = True
+    AUTOCOMPLETE_MAX_ENTRIES: int = 500_000
+    AUTOCOMPLETE_REFRESH_SECONDS: int = 300
+
+    # Event listings
+    EVENT_CACHE_TTL: int = 60
+    # Windows starting within this many days of today are cached
+    EVENT_CACHE_HORIZON_DAYS: int = 62
+
+    # Bulk imports
+    IMPORT_CHUNK_SIZE: int = 1000
+    # Uploads larger than this are spooled to a temporary file
+    IMPORT_SPOOL_BYTES: int = 8 * 1024 * 1024
+
+    # Bulk exports (rows fetched per server-side cursor round trip)
+    EXPORT_BATCH_SIZE: int = 2000
+
+    # Badge validity scheduler (activates and expires badges at their window boundaries)
+    BADGE_SCHEDULER_ENABLED: bool = True
+    BADGE_SCHEDULER_MAX_SLEEP_SECONDS: int = 300
+    BADGE_SYNC_BATCH_SIZE: int = 1000
+
+    # OpenTelemetry tracing (needs the opentelemetry-sdk and OTLP exporter packages)
+    TRACING_ENABLED: bool = False
+    TRACING_SERVICE_NAME: str = "bcsl-api"
+    # Share of new traces sampled at the root; callers' sampling decisions are followed
+    TRACING_SAMPLE_RATE: float = 0.1
+    OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+
+    # Prometheus metrics at /metrics
+    METRICS_ENABLED: bool = True
+
+    # Sampling CPU profiler: admin endpoint, X-Profile header and SIGUSR1 (per worker)
+    PROFILING_ENABLED: bool = True
+    PROFILING_MAX_SECONDS: int = 60
+    PROFILING_INTERVAL_MS: float = 5
+    # SIGUSR1 profiles the worker for this long and writes the file to PROFILING_DIR
+    PROFILING_SIGNAL_SECONDS: int = 30
+    PROFILING_DIR: str = "/tmp"
+
+    # Response compression
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_CACHE_BYTES: int = 16 * 1024 * 1024
     
+    # Startup
+    # Create missing tables on startup; turn off where the schema is created
+    # separately (python -m app.db.init_db) to skip the DDL round trips
+    DB_CREATE_ALL_ON_STARTUP: bool = True
+    # Startups slower than this are logged as a warning
+    STARTUP_BUDGET_MS: int = 3000
+    # Warm-up before serving: pool connections opened (at most the pool size)
+    # with the hottest queries prepared on each, caches optionally filled
+    WARMUP_ENABLED: bool = True
+    WARMUP_CONNECTIONS: int = 5
+    WARMUP_CACHES: bool = True
+    WARMUP_TIMEOUT_SECONDS: float = 30
+
+    # Readiness (/health/ready) and load shedding
+    READINESS_MAX_LOOP_LAG_MS: int = 500
+    LOAD_SHEDDING_ENABLED: bool = True
+    # Requests handled at once per worker, adapted between the bounds from latency
+    CONCURRENCY_LIMIT_INITIAL: int = 50
+    CONCURRENCY_LIMIT_MIN: int = 10
+    CONCURRENCY_LIMIT_MAX: int = 500
+    # Share of the limit only priority requests (authenticated writes, the paths below) may use
+    CONCURRENCY_PRIORITY_RESERVE: float = 0.2
+    LOAD_SHEDDING_PRIORITY_PATHS: List[str] = ["/api/v1/auth/me", "/api/v1/members/autocomplete"]
+
     # Email
     SMTP_TLS: bool = True
     SMTP_PORT: Optional[int] = None
@@ -0,0 +1,112 @@
+import csv
+import importlib
+import importlib.util
+import io
+from datetime import datetime
+from typing import AsyncIterator, List, Sequence
+from uuid import UUID
+
+from pydantic_core import to_json
+
+# pyarrow is optional (Parquet exports are disabled without it) and takes a
+# good part of a second to import, so it is loaded by the first Parquet export
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+pyarrow = None
+
+
+def _load_pyarrow() -> None:
+    global pyarrow
+    if pyarrow is None:
+        importlib.import_module("pyarrow.parquet")
+        pyarrow = importlib.import_module("pyarrow")
+
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Batches of rows, each row a tuple in column order
+RowBatches = AsyncIterator[Sequence[tuple]]
+
+
+def _csv_value(value: object) -> object:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+async def encode_csv(columns: List[str], batches: RowBatches) -> AsyncIterator[bytes]:
+    """CSV with a header row, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    async for batch in batches:
+        writer.writerows([_csv_value(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Header of an empty export
+        yield buffer.getvalue().encode()
+
+
+async def encode_ndjson(columns: List[str], batches: RowBatches) -> AsyncIterator[bytes]:
+    """One JSON object per row, one chunk per batch."""
+    async for batch in batches:
+        yield b"".join(to_json(dict(zip(columns, row))) + b"\n" for row in batch)
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out whatever was written since the last call."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data, self._chunks = b"".join(self._chunks), []
+        return data
+
+
+def _arrow_type(python_type: type) -> "pyarrow.DataType":
+    if python_type is bool:
+        return pyarrow.bool_()
+    if python_type is int:
+        return pyarrow.int64()
+    if python_type is datetime:
+        return pyarrow.timestamp("us", tz="UTC")
+    return pyarrow.string()
+
+
+async def encode_parquet(
+    columns: List[str], python_types: List[type], batches: RowBatches
+) -> AsyncIterator[bytes]:
+    """Parquet file with one row group per batch; UUIDs are written as strings."""
+    _load_pyarrow()
+    schema = pyarrow.schema(
+        [(name, _arrow_type(python_type)) for name, python_type in zip(columns, python_types)]
+    )
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    async for batch in batches:
+        arrays = [
+            pyarrow.array(
+                [str(value) if isinstance(value, UUID) else value for value in values],
+                type=field.type,
+            )
+            for field, values in zip(schema, zip(*batch))
+        ]
+        writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+        yield sink.take()
+    writer.close()
+    yield sink.take()
@@ -0,0 +1,186 @@
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Type, get_args
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, load_only, noload, selectinload
+
+from app.core.responses import ModelResponse
+
+_selection_models: Dict[Tuple[Any, ...], Type[BaseModel]] = {}
+
+
+class FieldSelection:
+    """
+    Sparse fieldset parsed from `?fields=id,first_name,avatar.thumbnail`.
+
+    The selection is turned into loader options so only the requested columns
+    are selected and only the requested relationships are loaded; everything
+    else, including the models' default eager loads, is switched off. The
+    response is validated into a model holding just the selected fields of
+    the read schema.
+    """
+
+    def __init__(
+        self,
+        model: Type[Any],
+        schema: Type[BaseModel],
+        columns: List[str],
+        relations: Dict[str, List[str]],
+    ):
+        self.model = model
+        self.schema = schema
+        self.columns = columns
+        self.relations = relations
+
+    def loader_options(self, *required: str) -> List[Any]:
+        """
+        Loader options for the selection. `required` names extra columns the
+        caller reads itself (e.g. for a cursor); they are loaded but not dumped.
+        """
+        mapper = inspect(self.model)
+        options: List[Any] = [noload("*")]
+        columns = list(self.columns) or [mapper.get_property_by_column(c).key for c in mapper.primary_key]
+        columns += [c for c in required if c not in columns]
+        options.append(load_only(*[getattr(self.model, c) for c in columns]))
+
+        for name, sub_columns in self.relations.items():
+            relationship = mapper.relationships[name]
+            target = relationship.mapper.class_
+            loader = selectinload if relationship.uselist else joinedload
+            attribute = getattr(self.model, name)
+            options.append(loader(attribute).load_only(*[getattr(target, c) for c in sub_columns]))
+            options.append(loader(attribute).noload("*"))
+        return options
+
+    @property
+    def key(self) -> Tuple[Any, ...]:
+        """Hashable description of the selection, for response cache keys."""
+        relations = tuple((name, tuple(columns)) for name, columns in sorted(self.relations.items()))
+        return (self.model.__name__, tuple(self.columns), relations)
+
+    def response(
+        self, objs: Iterable[Any], headers: Optional[Mapping[str, str]] = None
+    ) -> ModelResponse:
+        return ModelResponse(List[self._response_model()], objs, headers=headers)
+
+    def _response_model(self) -> Type[BaseModel]:
+        """The read schema cut down to the selection, built once per selection."""
+        cache_key = (self.schema, self.key)
+        model = _selection_models.get(cache_key)
+        if model is None:
+            mapper = inspect(self.model)
+            definitions: Dict[str, Any] = {
+                name: _field_definition(self.schema, name) for name in self.columns
+            }
+            for name, sub_columns in self.relations.items():
+                nested = _nested_schema(self.schema.model_fields[name].annotation)
+                sub_model = create_model(
+                    f"{nested.__name__}Fields",
+                    __config__={"from_attributes": True},
+                    **{c: _field_definition(nested, c) for c in sub_columns},
+                )
+                if mapper.relationships[name].uselist:
+                    definitions[name] = (List[sub_model], ...)
+                else:
+                    definitions[name] = (Optional[sub_model], ...)
+            model = _selection_models[cache_key] = create_model(
+                f"{self.schema.__name__}Fields",
+                __config__={"from_attributes": True},
+                **definitions,
+            )
+        return model
+
+
+def _field_definition(schema: Type[BaseModel], name: str) -> Tuple[Any, Any]:
+    return (schema.model_fields[name].annotation, ...)
+
+
+def _nested_schema(annotation: Any) -> Optional[Type[BaseModel]]:
+    """The model inside a read schema annotation such as Optional[List[ImageRead]]."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in get_args(annotation):
+        nested = _nested_schema(arg)
+        if nested is not None:
+            return nested
+    return None
+
+
+def parse_fields(
+    raw: Optional[str], model: Type[Any], schema: Type[BaseModel]
+) -> Optional[FieldSelection]:
+    """
+    Validate a comma separated field list against the read schema and the
+    ORM mapping. Sub-fields of a relationship are validated against the
+    nested read schema, so columns it hides cannot be selected either.
+    Returns None when no selection was requested.
+    """
+    if not raw:
+        return None
+
+    mapper = inspect(model)
+    column_names = set(mapper.column_attrs.keys())
+    sub_fields: Dict[str, List[str]] = {}
+    for name, relationship in mapper.relationships.items():
+        nested = _nested_schema(schema.model_fields[name].annotation) if name in schema.model_fields else None
+        if nested is not None:
+            target_columns = set(relationship.mapper.column_attrs.keys())
+            sub_fields[name] = [c for c in nested.model_fields if c in target_columns]
+    allowed = [
+        name
+        for name in schema.model_fields
+        if name in column_names or sub_fields.get(name)
+    ]
+
+    columns: List[str] = []
+    relations: Dict[str, List[str]] = {}
+    for field in (f.strip() for f in raw.split(",")):
+        if not field:
+            continue
+        name, _, sub_field = field.partition(".")
+        if name not in allowed:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown field '{field}'. Allowed fields: {', '.join(allowed)}",
+            )
+
+        if name in column_names:
+            if sub_field:
+                raise HTTPException(status_code=400, detail=f"Field '{name}' has no sub-fields")
+            if name not in columns:
+                columns.append(name)
+            continue
+
+        if not sub_field:
+            relations[name] = list(sub_fields[name])
+            continue
+        if sub_field not in sub_fields[name]:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown field '{field}'. Allowed sub-fields of '{name}': "
+                f"{', '.join(sub_fields[name])}",
+            )
+        selected = relations.setdefault(name, [])
+        if sub_field not in selected:
+            selected.append(sub_field)
+
+    if not columns and not relations:
+        return None
+    return FieldSelection(model, schema, columns, relations)
+
+
+def field_selection(
+    model: Type[Any], schema: Type[BaseModel]
+) -> Callable[[Optional[str]], Optional[FieldSelection]]:
+    """Dependency factory for the `fields` query parameter of a list endpoint."""
+
+    def dependency(
+        fields: Optional[str] = Query(
+            None,
+            description="Comma separated fields to return, e.g. id,first_name,avatar.thumbnail",
+        )
+    ) -> Optional[FieldSelection]:
+        return parse_fields(fields, model, schema)
+
+    return dependency
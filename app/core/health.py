@@ -0,0 +1,107 @@
+import asyncio
+from typing import Any, Dict, Optional
+
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from app.core.config import settings
+from app.core.load_shedding import concurrency_limit
+from app.core.metrics import registry
+from app.db.session import engine
+
+
+class LoopLagMonitor:
+    """
+    Measures event loop lag: how late a sleep of `interval` seconds wakes
+    up. Anything blocking the loop (CPU-bound work, sync I/O) shows here.
+    """
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.lag = max(0.0, loop.time() - started - self.interval)
+
+    def start(self) -> asyncio.Task:
+        self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+loop_lag = LoopLagMonitor()
+registry.gauge("event_loop_lag_seconds", "Delay of the event loop waking up a timer", lambda: loop_lag.lag)
+
+# Set once the lifespan has finished starting up (tables, warm-up), cleared
+# when shutdown begins so load balancers stop routing here first
+_ready = False
+
+
+def set_ready(ready: bool) -> None:
+    global _ready
+    _ready = ready
+
+
+def pool_state() -> Dict[str, Any]:
+    pool = engine.pool
+    capacity = pool.capacity()
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "capacity": capacity,
+        "checked_out": checked_out,
+        "waiting": pool.waiting,
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+def pool_saturated() -> bool:
+    """Every connection is in use and checkouts are queueing for one."""
+    pool = engine.pool
+    capacity = pool.capacity()
+    return capacity is not None and pool.checkedout() >= capacity and pool.waiting > 0
+
+
+async def liveness_endpoint(request: Request) -> Response:
+    return JSONResponse({"status": "alive"})
+
+
+async def readiness_endpoint(request: Request) -> Response:
+    """
+    200 while this worker should get traffic; 503 before startup has
+    finished, during shutdown, while the pool is saturated or while the
+    event loop lags more than READINESS_MAX_LOOP_LAG_MS.
+    """
+    pool = pool_state()
+    lag_ms = loop_lag.lag * 1000
+    problems = []
+    if not _ready:
+        problems.append("starting or stopping")
+    if pool_saturated():
+        problems.append("database pool saturated")
+    if lag_ms > settings.READINESS_MAX_LOOP_LAG_MS:
+        problems.append("event loop lagging")
+    return JSONResponse(
+        {
+            "status": "unavailable" if problems else "ready",
+            "problems": problems,
+            "pool": pool,
+            "event_loop_lag_ms": round(lag_ms, 1),
+            "concurrency": {"limit": round(concurrency_limit.limit), "in_flight": concurrency_limit.in_flight},
+        },
+        status_code=503 if problems else 200,
+    )
@@ -0,0 +1,156 @@
+import math
+import time
+from typing import Callable, List, Sequence
+
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+# Probes and scrapes are never shed
+EXEMPT_PATHS = {"/health/live", "/health/ready", "/metrics"}
+
+
+class GradientLimit:
+    """
+    Concurrency limit adapted from observed latency, after the gradient
+    limiter of Netflix's concurrency-limits. Every `window` seconds the mean
+    time to first byte of the window is compared with a slow moving average:
+    while they agree the limit grows by about sqrt(limit) per window, when
+    latency rises the limit shrinks in proportion (by at most half).
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        window: float = 0.5,
+        tolerance: float = 1.5,
+        smoothing: float = 0.2,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.window = window
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self._long_latency = 0.0
+        self._window_started = time.monotonic()
+        self._window_total = 0.0
+        self._window_count = 0
+        self._window_peak = 0
+
+    def acquire(self) -> None:
+        self.in_flight += 1
+        self._window_peak = max(self._window_peak, self.in_flight)
+
+    def release(self, latency: float) -> None:
+        self.in_flight -= 1
+        self._window_total += latency
+        self._window_count += 1
+        now = time.monotonic()
+        if now - self._window_started >= self.window:
+            self._update(self._window_total / self._window_count, self._window_peak)
+            self._window_started = now
+            self._window_total = 0.0
+            self._window_count = 0
+            self._window_peak = self.in_flight
+
+    def _update(self, latency: float, peak: int) -> None:
+        if not self._long_latency:
+            self._long_latency = latency
+            return
+        self._long_latency = self._long_latency * 0.95 + latency * 0.05
+        if self._long_latency > 2 * latency:
+            # Recover the baseline faster after a slow period
+            self._long_latency *= 0.9
+        gradient = max(0.5, min(1.0, self.tolerance * self._long_latency / latency))
+        target = self.limit * gradient + math.sqrt(self.limit)
+        limit = self.limit * (1 - self.smoothing) + target * self.smoothing
+        if limit > self.limit and peak < self.limit / 2:
+            # The limit was not what held requests back; don't grow it idle
+            return
+        self.limit = max(self.minimum, min(self.maximum, limit))
+
+
+concurrency_limit = GradientLimit(
+    settings.CONCURRENCY_LIMIT_INITIAL,
+    settings.CONCURRENCY_LIMIT_MIN,
+    settings.CONCURRENCY_LIMIT_MAX,
+)
+_shed = {"priority": 0, "normal": 0}
+
+registry.gauge("concurrency_limit", "Adaptive limit on requests handled at once", lambda: concurrency_limit.limit)
+registry.collector(
+    "requests_shed_total", "counter", "Requests rejected with 503 by the concurrency limit",
+    lambda: [({"priority": name}, count) for name, count in _shed.items()],
+)
+
+
+class LoadSheddingMiddleware:
+    """
+    Admits requests up to the adaptive concurrency limit and answers the
+    rest with 503 and Retry-After at once, before any auth or database work,
+    rather than letting them queue for a pool connection. Priority requests
+    (writes carrying a bearer token, and `priority_paths`) may use the whole
+    limit; others only `1 - reserve` of it, and none of it while the pool
+    is saturated. The token is not validated here, that would be the work
+    shedding is meant to avoid.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        priority_paths: Sequence[str] = (),
+        reserve: float = 0.2,
+        pool_saturated: Callable[[], bool] = lambda: False,
+    ):
+        self.app = app
+        self.priority_paths: List[str] = list(priority_paths)
+        self.reserve = reserve
+        self.pool_saturated = pool_saturated
+
+    def _is_priority(self, scope: Scope) -> bool:
+        if scope["method"] in WRITE_METHODS:
+            scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+            if scheme.lower() == "bearer" and token:
+                return True
+        return any(scope["path"].startswith(path) for path in self.priority_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        priority = self._is_priority(scope)
+        capacity = concurrency_limit.limit if priority else concurrency_limit.limit * (1 - self.reserve)
+        if concurrency_limit.in_flight >= capacity or (not priority and self.pool_saturated()):
+            _shed["priority" if priority else "normal"] += 1
+            response = JSONResponse(
+                {"detail": "Server is overloaded, retry shortly"},
+                status_code=503,
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        first_byte = None
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal first_byte
+            if message["type"] == "http.response.start":
+                first_byte = time.perf_counter()
+            await send(message)
+
+        concurrency_limit.acquire()
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            # Time to first byte, so long streamed bodies don't read as slowness
+            concurrency_limit.release((first_byte or time.perf_counter()) - started)
@@ -0,0 +1,162 @@
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import caches
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A sample of a collected metric: (labels, value)
+Sample = Tuple[Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+class Histogram:
+    """
+    Per-process histogram. Observations come from the event loop thread
+    only, so plain counters are enough: no locks on the hot path, just a
+    bisect and two additions. Buckets are made cumulative when rendered.
+    """
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # label values -> [per-bucket counts (last is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        series = self._series.get(labelvalues)
+        if series is None:
+            series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labelvalues, (counts, total) in list(self._series.items()):
+            labels = dict(zip(self.labelnames, labelvalues))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': le})} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Histograms observed as things happen, plus collectors that read gauges
+    and counters (pool state, cache statistics, ...) only when scraped.
+    """
+
+    def __init__(self) -> None:
+        self.histograms: List[Histogram] = []
+        # name -> (type, help, collector returning its samples)
+        self.collectors: Dict[str, Tuple[str, str, Callable[[], Iterable[Sample]]]] = {}
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        histogram = Histogram(name, help, labelnames, buckets)
+        self.histograms.append(histogram)
+        return histogram
+
+    def collector(self, name: str, metric_type: str, help: str, collect: Callable[[], Iterable[Sample]]) -> None:
+        self.collectors[name] = (metric_type, help, collect)
+
+    def gauge(self, name: str, help: str, read: Callable[[], float]) -> None:
+        """Unlabelled gauge read at scrape time."""
+        self.collector(name, "gauge", help, lambda: [({}, read())])
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for histogram in self.histograms:
+            lines.extend(histogram.render())
+        for name, (metric_type, help, collect) in self.collectors.items():
+            lines.append(f"# HELP {name} {help}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in collect():
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+request_latency = registry.histogram(
+    "http_request_duration_seconds",
+    "Time to handle a request, including a streamed body, by route template",
+    labelnames=("method", "route", "status"),
+)
+_in_flight = 0
+registry.gauge("http_requests_in_flight", "Requests being handled", lambda: _in_flight)
+
+
+registry.collector(
+    "cache_hits_total", "counter", "Lookups answered by an in-process cache",
+    lambda: [({"cache": name}, cache.hits) for name, cache in caches.items()],
+)
+registry.collector(
+    "cache_misses_total", "counter", "Lookups an in-process cache could not answer",
+    lambda: [({"cache": name}, cache.misses) for name, cache in caches.items()],
+)
+registry.collector(
+    "cache_hit_ratio", "gauge", "Share of lookups answered by an in-process cache",
+    lambda: [({"cache": name}, cache.hit_ratio) for name, cache in caches.items()],
+)
+
+
+class MetricsMiddleware:
+    """
+    Records request latency labelled by route template (`/members/{member_id}`,
+    not the raw path) so ids do not multiply the series. Paths that match no
+    route share the `unmatched` label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        global _in_flight
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        _in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            _in_flight -= 1
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            request_latency.observe(time.perf_counter() - started, scope["method"], route, status)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    return Response(registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,65 @@
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import Query
+
+
+class Page:
+    def __init__(self, skip: int, limit: int, include_total: bool):
+        self.skip = skip
+        self.limit = limit
+        self.include_total = include_total
+
+    async def total_headers(
+        self, count: Callable[[], Awaitable[Tuple[int, bool]]]
+    ) -> Dict[str, str]:
+        """Build the X-Total-Count headers, counting only when the client asked for it."""
+        if not self.include_total:
+            return {}
+        total, is_estimate = await count()
+        headers = {"X-Total-Count": str(total)}
+        if is_estimate:
+            headers["X-Total-Count-Estimated"] = "true"
+        return headers
+
+
+def pagination(default_limit: int = 100, max_limit: int = 100) -> Callable[..., Page]:
+    """
+    Dependency factory for skip/limit pagination. Each endpoint sizes
+    `max_limit` to the weight of its rows; larger limits are rejected with 422.
+    """
+
+    def dependency(
+        skip: int = Query(default=0, ge=0),
+        limit: int = Query(
+            default=default_limit, ge=1, le=max_limit, description=f"Page size, at most {max_limit}"
+        ),
+        include_total: bool = Query(
+            False, description="Return the total number of rows in the X-Total-Count header"
+        ),
+    ) -> Page:
+        return Page(skip=skip, limit=limit, include_total=include_total)
+
+    return dependency
+
+
+class CursorPage:
+    def __init__(self, cursor: Optional[str], limit: int):
+        self.cursor = cursor
+        self.limit = limit
+
+
+def cursor_pagination(default_limit: int = 100, max_limit: int = 200) -> Callable[..., CursorPage]:
+    """
+    Dependency factory for keyset pagination: the page continues after
+    `cursor`, taken from the X-Next-Cursor header of the previous page.
+    """
+
+    def dependency(
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor header of the previous page"),
+        limit: int = Query(
+            default=default_limit, ge=1, le=max_limit, description=f"Page size, at most {max_limit}"
+        ),
+    ) -> CursorPage:
+        return CursorPage(cursor=cursor, limit=limit)
+
+    return dependency
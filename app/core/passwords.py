@@ -0,0 +1,36 @@
+from typing import Optional
+
+import anyio
+from passlib.context import CryptContext
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+# bcrypt is deliberately slow (tens to hundreds of ms); hashing runs on a
+# bounded set of worker threads so it does not block the event loop
+_limiter: Optional[anyio.CapacityLimiter] = None
+# Calls waiting for a worker or running on one
+_pending = 0
+registry.gauge("bcrypt_queue_depth", "Password hash/verify calls queued or running", lambda: _pending)
+
+
+async def _run(func, *args):
+    global _limiter, _pending
+    if _limiter is None:
+        # Created lazily: a limiter needs the running event loop
+        _limiter = anyio.CapacityLimiter(settings.BCRYPT_WORKERS)
+    _pending += 1
+    try:
+        return await anyio.to_thread.run_sync(func, *args, limiter=_limiter)
+    finally:
+        _pending -= 1
+
+
+async def hash_password(password: str) -> str:
+    return await _run(pwd_context.hash, password)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await _run(pwd_context.verify, plain_password, hashed_password)
@@ -0,0 +1,117 @@
+import time
+from bisect import bisect_left, insort
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+
+class PrefixIndex:
+    """
+    Per-process prefix index: a sorted array of (key, id) pairs searched with
+    bisect, plus the payload returned for each id.
+
+    The index holds at most `max_entries` keys. Loading or growing past the
+    budget disables it for the life of the process (`ready` becomes False and
+    it is never stale again) so callers fall back to SQL instead of using a
+    partial index or reloading it over and over. A loaded index is considered
+    stale after `refresh_seconds`, which bounds how long writes made by other
+    processes stay invisible.
+
+    Loading is split in two: `build` does the normalizing and sorting without
+    touching the index, so it can run in a worker thread, and `install` swaps
+    the result in.
+    """
+
+    def __init__(self, name: str, max_entries: int, refresh_seconds: float):
+        self.name = name
+        self.max_entries = max_entries
+        self.refresh_seconds = refresh_seconds
+        self.ready = False
+        self.disabled = False
+        self.loaded_at: Optional[float] = None
+        self._entries: List[Tuple[str, Hashable]] = []
+        self._items: Dict[Hashable, Tuple[Sequence[str], Any]] = {}
+
+    @property
+    def stale(self) -> bool:
+        if self.disabled:
+            return False
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.refresh_seconds
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def build(
+        self, items: Iterable[Tuple[Hashable, Sequence[str], Any]]
+    ) -> Optional[Tuple[List[Tuple[str, Hashable]], Dict[Hashable, Tuple[Sequence[str], Any]]]]:
+        """Sorted entries and payloads for (id, keys, payload) items; None when over budget."""
+        entries: List[Tuple[str, Hashable]] = []
+        payloads: Dict[Hashable, Tuple[Sequence[str], Any]] = {}
+        for item_id, keys, payload in items:
+            keys = self._normalize(keys)
+            entries.extend((key, item_id) for key in keys)
+            payloads[item_id] = (keys, payload)
+            if len(entries) > self.max_entries:
+                return None
+        entries.sort()
+        return entries, payloads
+
+    def install(self, built) -> bool:
+        """Replace the contents with the result of `build`; False when it was over budget."""
+        if built is None:
+            self._disable()
+            return False
+        self._entries, self._items = built
+        self.ready = True
+        self.loaded_at = time.monotonic()
+        return True
+
+    def upsert(self, item_id: Hashable, keys: Sequence[str], payload: Any) -> None:
+        if not self.ready:
+            return
+        self.discard(item_id)
+        keys = self._normalize(keys)
+        if len(self._entries) + len(keys) > self.max_entries:
+            self._disable()
+            return
+        for key in keys:
+            insort(self._entries, (key, item_id))
+        self._items[item_id] = (keys, payload)
+
+    def discard(self, item_id: Hashable) -> None:
+        if not self.ready:
+            return
+        existing = self._items.pop(item_id, None)
+        if existing is None:
+            return
+        for key in existing[0]:
+            index = bisect_left(self._entries, (key, item_id))
+            if index < len(self._entries) and self._entries[index] == (key, item_id):
+                del self._entries[index]
+
+    def search(self, prefix: str, limit: int) -> List[Any]:
+        """Payloads of the first `limit` ids with a key starting with `prefix`, in key order."""
+        prefix = prefix.lower()
+        results: List[Any] = []
+        seen = set()
+        index = bisect_left(self._entries, (prefix,))
+        while index < len(self._entries) and len(results) < limit:
+            key, item_id = self._entries[index]
+            if not key.startswith(prefix):
+                break
+            if item_id not in seen:
+                seen.add(item_id)
+                results.append(self._items[item_id][1])
+            index += 1
+        return results
+
+    def clear(self) -> None:
+        self.ready = False
+        self._entries = []
+        self._items = {}
+
+    def _disable(self) -> None:
+        self.clear()
+        self.disabled = True
+
+    @staticmethod
+    def _normalize(keys: Sequence[str]) -> Tuple[str, ...]:
+        return tuple(sorted({key.lower() for key in keys if key}))
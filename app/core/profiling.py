@@ -0,0 +1,293 @@
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from jose import JWTError, jwt
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Threads whose innermost frame is in one of these are parked (idle executor
+# workers, the sampler's own timer) and are left out of the samples
+IDLE_FILES = ("threading.py", "queue.py")
+MEDIA_TYPES = {"speedscope": "application/json", "collapsed": "text/plain; charset=utf-8"}
+
+
+class ProfilerBusy(RuntimeError):
+    """A profile is already being taken in this process."""
+
+
+class StackSampler:
+    """
+    Statistical CPU profiler: a daemon thread reads the stack of every other
+    thread each `interval` seconds (sys._current_frames) and counts the
+    collapsed stacks. Nothing is installed on the profiled threads, so the
+    cost is the sampling itself, roughly proportional to the sample rate.
+    The event loop thread shows every coroutine that ran while sampling,
+    not only one request's; worker threads (bcrypt) have their own root.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self.duration = 0.0
+        self._started = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._locations: Dict[str, str] = {}
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own or frame.f_code.co_filename.endswith(IDLE_FILES):
+                    continue
+                self.stacks[self._collapse(names.get(ident, str(ident)), frame)] += 1
+            self.samples += 1
+
+    def _collapse(self, thread_name: str, frame) -> str:
+        """`thread;outermost frame;...;innermost frame`, the collapsed-stack format."""
+        parts: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            name = getattr(code, "co_qualname", code.co_name)
+            parts.append(f"{name} ({self._location(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        parts.append(thread_name)
+        return ";".join(part.replace(";", ":") for part in reversed(parts))
+
+    def _location(self, filename: str) -> str:
+        # Shortened to the package path: app/services/x.py, sqlalchemy/orm/y.py
+        location = self._locations.get(filename)
+        if location is None:
+            location = filename
+            for marker in ("site-packages" + os.sep, os.getcwd() + os.sep):
+                if marker in filename:
+                    location = filename.split(marker, 1)[1]
+                    break
+            self._locations[filename] = location
+        return location
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's folded format, for flamegraph.pl, speedscope or inferno."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def speedscope(self, name: str) -> Dict[str, Any]:
+        """Sampled profile in the speedscope file format, one profile per thread."""
+        frames: List[Dict[str, str]] = []
+        frame_ids: Dict[str, int] = {}
+        profiles: Dict[str, Dict[str, Any]] = {}
+        for stack, count in self.stacks.most_common():
+            thread_name, *stack_frames = stack.split(";")
+            profile = profiles.get(thread_name)
+            if profile is None:
+                profile = profiles[thread_name] = {
+                    "type": "sampled",
+                    "name": thread_name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": 0,
+                    "samples": [],
+                    "weights": [],
+                }
+            ids = []
+            for frame in stack_frames:
+                if frame not in frame_ids:
+                    frame_ids[frame] = len(frames)
+                    frames.append({"name": frame})
+                ids.append(frame_ids[frame])
+            profile["samples"].append(ids)
+            profile["weights"].append(count * self.interval)
+            profile["endValue"] += count * self.interval
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": settings.PROJECT_NAME,
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+        }
+
+    def render(self, format: str, name: str) -> str:
+        return self.collapsed() if format == "collapsed" else json.dumps(self.speedscope(name))
+
+
+# One profile at a time per worker: concurrent samplers would double the cost
+_profiling = False
+
+
+def _start(interval: float) -> StackSampler:
+    global _profiling
+    if _profiling:
+        raise ProfilerBusy("A profile is already running on this worker")
+    _profiling = True
+    sampler = StackSampler(interval)
+    try:
+        sampler.start()
+    except BaseException:
+        _profiling = False
+        raise
+    return sampler
+
+
+def _finish(sampler: StackSampler) -> None:
+    global _profiling
+    try:
+        sampler.stop()
+    finally:
+        _profiling = False
+
+
+async def sample_stacks(seconds: float, interval: float) -> StackSampler:
+    """Profile this worker for `seconds`. Raises ProfilerBusy if a profile is running."""
+    sampler = _start(interval)
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        # Joining the sampler waits at most one interval
+        _finish(sampler)
+    return sampler
+
+
+def profile_name(label: str) -> str:
+    return f"{settings.PROJECT_NAME} pid {os.getpid()} {label}"
+
+
+def profile_response(
+    sampler: StackSampler, format: str, label: str, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    extension = "txt" if format == "collapsed" else "speedscope.json"
+    return Response(
+        sampler.render(format, profile_name(label)),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{os.getpid()}.{extension}"',
+            "X-Profile-Samples": str(sampler.samples),
+            **(headers or {}),
+        },
+    )
+
+
+# Signal-triggered profiles, referenced until written so they are not garbage collected
+_signal_tasks: Set[asyncio.Task] = set()
+
+
+async def _profile_to_file() -> None:
+    try:
+        sampler = await sample_stacks(settings.PROFILING_SIGNAL_SECONDS, settings.PROFILING_INTERVAL_MS / 1000)
+    except ProfilerBusy:
+        logger.warning("SIGUSR1 ignored, a profile is already running on pid %s", os.getpid())
+        return
+    path = Path(settings.PROFILING_DIR) / f"profile-{os.getpid()}-{int(time.time())}.speedscope.json"
+    content = sampler.render("speedscope", profile_name("signal"))
+    await asyncio.to_thread(path.write_text, content)
+    logger.warning("CPU profile of pid %s written to %s (%s samples)", os.getpid(), path, sampler.samples)
+
+
+def _on_signal() -> None:
+    task = asyncio.get_running_loop().create_task(_profile_to_file())
+    _signal_tasks.add(task)
+    task.add_done_callback(_signal_tasks.discard)
+
+
+def install_signal_handler() -> None:
+    """
+    `kill -USR1 <worker pid>` profiles that worker for PROFILING_SIGNAL_SECONDS
+    and writes a speedscope file to PROFILING_DIR. Call from the running loop.
+    """
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, _on_signal)
+    except (AttributeError, NotImplementedError, RuntimeError):
+        # No SIGUSR1 or loop signal handlers (Windows), or not the main thread
+        logger.info("CPU profiling signal handler not installed")
+
+
+def remove_signal_handler() -> None:
+    try:
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGUSR1)
+    except (AttributeError, NotImplementedError, RuntimeError):
+        pass
+
+
+async def _is_admin(scope: Scope) -> bool:
+    # Imported here: the user service pulls in the models and the database engine
+    from app.db.session import async_session
+    from app.services.user_service import UserService
+
+    scheme, _, token = Headers(scope=scope).get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    try:
+        user_id = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]).get("sub")
+    except JWTError:
+        return False
+    if user_id is None:
+        return False
+    async with async_session() as session:
+        user = await UserService(session).get(user_id)
+    return user is not None and user.is_active and user.role == "admin"
+
+
+class ProfilingMiddleware:
+    """
+    Per-request profiling: an admin request carrying `X-Profile: speedscope`
+    (or `collapsed`) is handled as usual, but answered with the CPU profile
+    taken while it ran; the original status is in `X-Profiled-Status`. The
+    header is ignored for everyone else and while another profile runs.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        format = Headers(scope=scope).get("x-profile", "").lower()
+        if format not in MEDIA_TYPES or not await _is_admin(scope):
+            await self.app(scope, receive, send)
+            return
+        try:
+            sampler = _start(settings.PROFILING_INTERVAL_MS / 1000)
+        except ProfilerBusy:
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def discard_response(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        try:
+            await self.app(scope, receive, discard_response)
+        finally:
+            _finish(sampler)
+        response = profile_response(
+            sampler, format, f"{scope['method']} {scope['path']}", headers={"X-Profiled-Status": str(status)}
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,149 @@
+import asyncio
+import logging
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, List, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Statements that can be explained without running them
+EXPLAINABLE = ("select", "with", "insert", "update", "delete")
+MAX_LOGGED_STATEMENT = 2000
+
+
+class QueryStats:
+    """Statements run and time spent in the database while handling one request."""
+
+    def __init__(self, scope: Scope):
+        self.scope = scope
+        self.count = 0
+        self.duration = 0.0
+
+    @property
+    def route(self) -> str:
+        # The router stores the matched route in the scope once it has matched
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path", "")
+
+
+# Running EXPLAIN tasks, referenced until done so they are not garbage collected
+_plan_tasks: Set[asyncio.Task] = set()
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def _parameters_shape(parameters: Any, executemany: bool) -> str:
+    """Types (and sizes of collections) of the bound parameters, never their values."""
+    if executemany:
+        rows = list(parameters)
+        return f"{len(rows)} x {_parameters_shape(rows[0], False)}" if rows else "0 rows"
+    if isinstance(parameters, dict):
+        parameters = parameters.values()
+    shape: List[str] = []
+    for value in parameters or ():
+        if isinstance(value, (list, tuple, set)):
+            shape.append(f"{type(value).__name__}[{len(value)}]")
+        else:
+            shape.append(type(value).__name__)
+    return "(" + ", ".join(shape) + ")"
+
+
+def instrument_engine(
+    engine: AsyncEngine, slow_query_ms: float, explain_sample_rate: float
+) -> None:
+    """
+    Count statements and DB time into the current request's QueryStats and
+    log statements slower than `slow_query_ms`. A `explain_sample_rate`
+    share of slow statements is also EXPLAINed on a separate connection.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._query_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._query_started
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.count += 1
+            stats.duration += elapsed
+        if elapsed * 1000 < slow_query_ms or statement.lstrip().lower().startswith("explain"):
+            return
+
+        route = stats.route if stats is not None else "-"
+        logger.warning(
+            "Slow query (%.1f ms) on %s, parameters %s: %s",
+            elapsed * 1000,
+            route,
+            _parameters_shape(parameters, executemany),
+            statement[:MAX_LOGGED_STATEMENT],
+        )
+        explainable = statement.lstrip().lower().startswith(EXPLAINABLE)
+        if explainable and not executemany and random.random() < explain_sample_rate:
+            try:
+                task = asyncio.get_running_loop().create_task(
+                    _log_plan(engine, route, statement, parameters)
+                )
+            except RuntimeError:
+                return
+            _plan_tasks.add(task)
+            task.add_done_callback(_plan_tasks.discard)
+
+
+async def _log_plan(engine: AsyncEngine, route: str, statement: str, parameters: Any) -> None:
+    # Runs as its own task: the plan is not counted against the request
+    _current_stats.set(None)
+    try:
+        async with engine.connect() as conn:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar_one()
+        logger.warning("Plan of slow query on %s: %s", route, plan[0]["Plan"])
+    except Exception:
+        # e.g. statements on temporary tables of the original connection
+        logger.debug("Could not explain slow query on %s", route, exc_info=True)
+
+
+class QueryStatsMiddleware:
+    """
+    Collects QueryStats for each request. With `emit_headers` (debug mode)
+    the response carries `X-DB-Queries` and a `Server-Timing` db entry;
+    statements run after the response has started (streamed bodies) are
+    not included in them.
+    """
+
+    def __init__(self, app: ASGIApp, emit_headers: bool = False):
+        self.app = app
+        self.emit_headers = emit_headers
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = _current_stats.set(stats)
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.emit_headers:
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Queries"] = str(stats.count)
+                headers.append(
+                    "Server-Timing", f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current_stats.reset(token)
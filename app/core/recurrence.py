@@ -0,0 +1,114 @@
+import calendar
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, Optional
+from zoneinfo import ZoneInfo
+
+FREQUENCIES = ("daily", "weekly", "monthly")
+
+
+def as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Timestamps sent without an offset are taken as UTC."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class RecurrenceRule:
+    """
+    Occurrence arithmetic for a repeating event.
+
+    Occurrences repeat every `interval` days, weeks or months from `start`,
+    in the wall-clock time of `tz` (a weekly 18:00 meetup stays at 18:00
+    across DST changes), until `until` and/or for `count` occurrences.
+
+    The n-th occurrence is computed directly rather than by stepping through
+    the series, so listing a window costs O(occurrences in the window) no
+    matter how long the series has been running.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        freq: str,
+        interval: int = 1,
+        until: Optional[datetime] = None,
+        count: Optional[int] = None,
+        tz: str = "UTC",
+    ):
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Unknown recurrence frequency '{freq}'")
+        self.zone = ZoneInfo(tz)
+        self.start = as_utc(start)
+        self.freq = freq
+        self.interval = max(1, interval)
+        self.until = as_utc(until)
+        self.count = count
+        self._local_start = self.start.astimezone(self.zone).replace(tzinfo=None)
+
+    def nth(self, n: int) -> datetime:
+        """Start of the n-th occurrence (0-based), in UTC."""
+        local = self._local_start
+        if self.freq == "monthly":
+            year, month = divmod(local.month - 1 + n * self.interval, 12)
+            year += local.year
+            day = min(local.day, calendar.monthrange(year, month + 1)[1])
+            local = local.replace(year=year, month=month + 1, day=day)
+        else:
+            days = 7 if self.freq == "weekly" else 1
+            local = local + timedelta(days=n * self.interval * days)
+        return local.replace(tzinfo=self.zone).astimezone(timezone.utc)
+
+    def index_at_or_after(self, moment: datetime) -> int:
+        """Index of the first occurrence starting at or after `moment` (ignores count/until)."""
+        moment = as_utc(moment)
+        local = moment.astimezone(self.zone).replace(tzinfo=None)
+        if self.freq == "monthly":
+            months = (local.year - self._local_start.year) * 12 + local.month - self._local_start.month
+            n = months // self.interval
+        else:
+            step = timedelta(days=(7 if self.freq == "weekly" else 1) * self.interval)
+            n = math.ceil((local - self._local_start) / step)
+        n = max(0, n)
+        # The estimate can be off by one around DST changes and month-end clamping
+        while n > 0 and self.nth(n - 1) >= moment:
+            n -= 1
+        while self.nth(n) < moment:
+            n += 1
+        return n
+
+    def _in_series(self, n: int, when: datetime) -> bool:
+        if self.count is not None and n >= self.count:
+            return False
+        return self.until is None or when <= self.until
+
+    def between(self, window_start: datetime, window_end: datetime) -> Iterator[datetime]:
+        """Lazily yield occurrence starts in [window_start, window_end)."""
+        window_start, window_end = as_utc(window_start), as_utc(window_end)
+        n = self.index_at_or_after(max(window_start, self.start))
+        while True:
+            when = self.nth(n)
+            if when >= window_end or not self._in_series(n, when):
+                return
+            yield when
+            n += 1
+
+    def last(self) -> Optional[datetime]:
+        """Start of the final occurrence, or None for a series without end."""
+        candidates = []
+        if self.count is not None:
+            candidates.append(self.nth(self.count - 1))
+        if self.until is not None:
+            n = self.index_at_or_after(self.until)
+            if self.nth(n) > self.until:
+                n -= 1
+            candidates.append(self.nth(max(0, n)))
+        return min(candidates) if candidates else None
+
+    def contains(self, when: datetime) -> bool:
+        """Whether an occurrence starts exactly at `when`."""
+        when = as_utc(when)
+        if when < self.start:
+            return False
+        n = self.index_at_or_after(when)
+        return self.nth(n) == when and self._in_series(n, when)
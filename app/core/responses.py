@@ -0,0 +1,55 @@
+from typing import Any, Dict, Mapping, Optional
+
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse, Response
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def get_adapter(model_type: Any) -> TypeAdapter:
+    """Return a cached TypeAdapter; building one compiles a pydantic-core schema."""
+    adapter = _adapters.get(model_type)
+    if adapter is None:
+        adapter = _adapters[model_type] = TypeAdapter(model_type)
+    return adapter
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse that encodes with pydantic-core instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class ModelResponse(Response):
+    """
+    Serialize trusted service output straight to JSON bytes.
+
+    FastAPI validates a route's return value into `response_model`, turns the
+    result back into Python primitives and then runs json.dumps over them.
+    Returning a ModelResponse skips that path: the ORM objects are read once
+    into the schema and dumped to bytes by pydantic-core in a single call.
+    Routes keep their `response_model` so the OpenAPI schema is unchanged.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        model_type: Any,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ):
+        adapter = get_adapter(model_type)
+        body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+        super().__init__(
+            content=body,
+            status_code=status_code,
+            headers=headers,
+            media_type=self.media_type,
+            background=background,
+        )
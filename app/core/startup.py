@@ -0,0 +1,46 @@
+import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StartupReport:
+    """
+    Wall time of each startup phase, logged once the app is ready to serve.
+    `mark` closes a phase that ran since the previous mark (module imports);
+    `phase` times a block on its own (lifespan steps), so the time the
+    server spends between importing the app and starting it is left out.
+    """
+
+    def __init__(self) -> None:
+        self.phases: List[Tuple[str, float]] = []
+        self._last = time.perf_counter()
+
+    def mark(self, name: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        self._last = time.perf_counter()
+        yield
+        self.mark(name)
+
+    @property
+    def total(self) -> float:
+        return sum(duration for _, duration in self.phases)
+
+    def log(self, budget_ms: int) -> None:
+        total_ms = self.total * 1000
+        summary = ", ".join(f"{name} {duration * 1000:.0f} ms" for name, duration in self.phases)
+        if budget_ms and total_ms > budget_ms:
+            logger.warning("Startup took %.0f ms, over the %d ms budget: %s", total_ms, budget_ms, summary)
+        else:
+            logger.info("Startup took %.0f ms: %s", total_ms, summary)
+
+
+# Created when app.main starts importing, which is the origin of the first phase
+startup_report = StartupReport()
@@ -0,0 +1,158 @@
+import functools
+import inspect
+from typing import Any, Callable, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+trace = None
+# The SDK and exporter are slow to import, so only when tracing is asked for
+if settings.TRACING_ENABLED:
+    try:
+        from opentelemetry import propagate, trace
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+        from opentelemetry.trace import SpanKind, Status, StatusCode
+    except ImportError:  # OpenTelemetry is optional, tracing stays off without it
+        trace = None
+
+# Decided at import so that with tracing off nothing is wrapped or hooked
+TRACING_ENABLED = settings.TRACING_ENABLED and trace is not None
+MAX_STATEMENT_LENGTH = 2000
+
+_tracer = trace.get_tracer("app") if TRACING_ENABLED else None
+
+T = TypeVar("T")
+
+
+def setup_tracing(engine: AsyncEngine) -> None:
+    """
+    Install the tracer provider: head-based sampling of TRACING_SAMPLE_RATE
+    of new traces (incoming sampled traces are followed) and batched OTLP
+    export to OTLP_ENDPOINT. Adds a span per SQL statement on `engine`.
+    """
+    if not TRACING_ENABLED:
+        return
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.TRACING_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATE)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=settings.OTLP_ENDPOINT)))
+    trace.set_tracer_provider(provider)
+    _instrument_engine(engine)
+
+
+def shutdown_tracing() -> None:
+    """Flush spans still queued for export."""
+    if TRACING_ENABLED:
+        trace.get_tracer_provider().shutdown()
+
+
+def _instrument_engine(engine: AsyncEngine) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        context._span = _tracer.start_span(
+            operation,
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "postgresql",
+                "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            },
+        )
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        span = getattr(context, "_span", None)
+        if span is not None:
+            span.end()
+            context._span = None
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        context = exception_context.execution_context
+        span = getattr(context, "_span", None) if context is not None else None
+        if span is not None:
+            span.record_exception(exception_context.original_exception)
+            span.set_status(Status(StatusCode.ERROR))
+            span.end()
+            context._span = None
+
+
+def traced(cls: T) -> T:
+    """
+    Class decorator giving every public async method of a service a span
+    named `Class.method`. Returns the class untouched when tracing is off.
+    """
+    if not TRACING_ENABLED:
+        return cls
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(member):
+            continue
+        setattr(cls, name, _wrap(f"{cls.__name__}.{name}", member))
+    return cls
+
+
+def traced_function(name: str) -> Callable[[T], T]:
+    """Span around an async function, e.g. a dependency; a no-op when tracing is off."""
+
+    def decorator(func: T) -> T:
+        return _wrap(name, func) if TRACING_ENABLED else func
+
+    return decorator
+
+
+def _wrap(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with _tracer.start_as_current_span(name):
+            return await func(*args, **kwargs)
+
+    return wrapper
+
+
+class TracingMiddleware:
+    """
+    Server span per request, continuing the caller's trace from the
+    `traceparent` header. The span is renamed to the route template once
+    the router has matched.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]}
+        with _tracer.start_as_current_span(
+            scope["method"],
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": scope["method"], "url.path": scope["path"]},
+        ) as span:
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.response.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.set_status(Status(StatusCode.ERROR))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.set_attribute("http.route", route)
+                    span.update_name(f"{scope['method']} {route}")
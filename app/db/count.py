@@ -0,0 +1,49 @@
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.sql import Select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+
+
+async def explain(session: AsyncSession, stmt: Select, *options: str) -> Any:
+    """Run EXPLAIN (FORMAT JSON) for a statement and return the top plan node."""
+    dialect = session.bind.dialect
+    compiled = stmt.compile(dialect=dialect)
+    params = compiled.params
+    if compiled.positiontup:
+        params = tuple(params[name] for name in compiled.positiontup)
+    explain_options = ", ".join(("FORMAT JSON",) + options)
+    connection = await session.connection()
+    result = await connection.exec_driver_sql(f"EXPLAIN ({explain_options}) {compiled}", params)
+    plan = result.scalar_one()
+    return plan[0]["Plan"]
+
+
+async def count_rows(
+    session: AsyncSession, stmt: Select, exact_threshold: Optional[int] = None
+) -> Tuple[int, bool]:
+    """
+    Count the rows a list statement would return without running an unbounded
+    COUNT(*). Rows are counted exactly up to `exact_threshold`; above that the
+    planner's row estimate is returned instead.
+
+    Returns (count, is_estimate).
+    """
+    if exact_threshold is None:
+        exact_threshold = settings.PAGINATION_EXACT_COUNT_THRESHOLD
+
+    base = stmt.order_by(None).limit(None).offset(None)
+    bounded = (
+        base.with_only_columns(literal(1), maintain_column_froms=True)
+        .limit(exact_threshold + 1)
+        .subquery()
+    )
+    result = await session.execute(select(func.count()).select_from(bounded))
+    exact = result.scalar_one()
+    if exact <= exact_threshold:
+        return exact, False
+
+    plan = await explain(session, base)
+    return max(int(plan["Plan Rows"]), exact), True
@@ -0,0 +1,25 @@
+import argparse
+import asyncio
+
+from app.core.config import settings
+from app.db.session import async_session
+from app import models  # noqa: F401 (registers every model)
+from app.services.import_service import ImportService
+
+async def import_rows(entity_type, path, fmt=None, chunk_size=settings.IMPORT_CHUNK_SIZE):
+    """Import members or companies from a CSV or NDJSON file, printing progress as NDJSON."""
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "ndjson")
+    with open(path, "rb") as stream:
+        async with async_session() as session:
+            async for progress in ImportService(session).run(entity_type, fmt, stream, chunk_size):
+                print(progress.model_dump_json(), flush=True)
+
+if __name__ == "__main__":
+    # python -m app.db.import_rows member members.csv [--format csv] [--chunk-size 1000]
+    parser = argparse.ArgumentParser(description=import_rows.__doc__)
+    parser.add_argument("entity", choices=["member", "company"])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=["csv", "ndjson"], default=None)
+    parser.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    args = parser.parse_args()
+    asyncio.run(import_rows(args.entity, args.path, args.format, args.chunk_size))
@@ -1,15 +1,17 @@
-# Import all your models here to ensure they are registered in metadata
-from app.models.company import Company
-from app.models.event import Event
-from app.models.member import Member
-from app.models.image import Image
-from app.models.social_link import SocialLink
-from app.models.external_link import ExternalLink
-from app.models.follower import Follower
+from app import models  # noqa: F401 (registers every model)
 from sqlmodel import SQLModel
-from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 from app.db.session import engine
 
+# Extensions the models depend on (pg_trgm backs the fuzzy member search indexes)
+EXTENSIONS = ["pg_trgm"]
+
+async def create_extensions(conn: AsyncConnection) -> None:
+    """Create required Postgres extensions; must run before create_all."""
+    for extension in EXTENSIONS:
+        await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
+
 async def drop_db() -> None:
     """WARNING: This will drop all tables. Use only in development."""
     async with engine.begin() as conn:
@@ -18,5 +20,11 @@ async def drop_db() -> None:
 async def init_db() -> None:
     """Initialize database tables if they don't exist."""
     async with engine.begin() as conn:
+        await create_extensions(conn)
         # Create tables without dropping existing ones
-        await conn.run_sync(SQLModel.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+if __name__ == "__main__":
+    # python -m app.db.init_db (with DB_CREATE_ALL_ON_STARTUP off)
+    import asyncio
+    asyncio.run(init_db())
@@ -0,0 +1,15 @@
+import asyncio
+import sys
+from app.db.session import async_session
+from app import models  # noqa: F401 (registers every model)
+from app.services.search_service import SearchIndexService
+
+async def reindex_search(entity_types=None):
+    """Rebuild search_documents from the member, company and event tables."""
+    async with async_session() as session:
+        await SearchIndexService(session).reindex(entity_types)
+        await session.commit()
+
+if __name__ == "__main__":
+    # python -m app.db.reindex_search [member] [company] [event]
+    asyncio.run(reindex_search(sys.argv[1:] or None))
@@ -1,5 +1,6 @@
 import asyncio
 from app.db.session import engine
+from app.db.init_db import create_extensions
 from sqlmodel import SQLModel
 
 async def reset_db():
@@ -7,6 +8,7 @@ async def reset_db():
         # Drop all tables
         await conn.run_sync(SQLModel.metadata.drop_all)
         # Recreate all tables
+        await create_extensions(conn)
         await conn.run_sync(SQLModel.metadata.create_all)
 
 if __name__ == "__main__":
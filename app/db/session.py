@@ -1,22 +1,61 @@
+import time
+from typing import Optional
 from sqlmodel import SQLModel
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from urllib.parse import urlparse, parse_qs
 
 from app.core.config import settings
+from app.core.metrics import registry
+from app.core.query_stats import instrument_engine
 
 # Parse the DATABASE_URI to extract SSL mode
 url = urlparse(str(settings.DATABASE_URI))
 query_params = parse_qs(url.query)
 ssl_required = 'sslmode' in query_params and query_params['sslmode'][0] == 'require'
 
+pool_wait = registry.histogram(
+    "db_pool_wait_seconds", "Time to check out a pooled connection, including opening new ones",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited and how many are waiting."""
+
+    waiting = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            return super()._do_get()
+        finally:
+            self.waiting -= 1
+            pool_wait.observe(time.perf_counter() - started)
+
+    def capacity(self) -> Optional[int]:
+        """Connections the pool may hold at once, overflow included; None when unbounded."""
+        return self.size() + self._max_overflow if self._max_overflow >= 0 else None
+
 # Create the async engine with SSL configuration if needed
 engine = create_async_engine(
     str(settings.DATABASE_URI).split('?')[0],  # Base URL without query parameters
     echo=False,
     future=True,
+    poolclass=TimedQueuePool,
     connect_args={"ssl": ssl_required} if ssl_required else {}
 )
+instrument_engine(
+    engine,
+    slow_query_ms=settings.SLOW_QUERY_MS,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+)
+
+registry.gauge("db_pool_size", "Configured pool size", lambda: engine.pool.size())
+registry.gauge("db_pool_checked_out", "Connections in use", lambda: engine.pool.checkedout())
+registry.gauge("db_pool_overflow", "Connections opened beyond the pool size", lambda: engine.pool.overflow())
+registry.gauge("db_pool_waiting", "Checkouts waiting for a connection", lambda: engine.pool.waiting)
 
 # Create async session factory
 async_session = sessionmaker(
@@ -0,0 +1,14 @@
+import asyncio
+from app.db.session import async_session
+from app import models  # noqa: F401 (registers every model)
+from app.services.badge_validity_service import BadgeValidityService
+
+async def sync_badges():
+    """Activate and expire badges whose validity window boundaries have passed."""
+    async with async_session() as session:
+        counts = await BadgeValidityService(session).sync()
+    print(counts)
+
+if __name__ == "__main__":
+    # python -m app.db.sync_badges (for deployments running with BADGE_SCHEDULER_ENABLED=false)
+    asyncio.run(sync_badges())
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+import uuid
+from contextlib import AsyncExitStack
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlalchemy.orm import configure_mappers
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.db.session import async_session
+from app.services.badge_service import BadgeService
+from app.services.event_service import EventService
+from app.services.member_service import MemberService
+from app.services.notification_service import NotificationService
+from app.services.user_service import UserService
+
+logger = logging.getLogger(__name__)
+
+
+async def _prime(conn: AsyncConnection) -> None:
+    """
+    Run the hottest read paths once on `conn`: asyncpg keeps prepared
+    statements per connection, SQLAlchemy caches the compiled SQL per engine.
+    """
+    async with AsyncSession(bind=conn) as session:
+        missing = uuid.uuid4()
+        # Every authenticated request loads its user
+        await UserService(session).get(missing)
+        members = await MemberService(session).get_all(limit=20)
+        member_id = members[0].id if members else missing
+        await MemberService(session).get(member_id)
+        if members:
+            await MemberService(session).get_followers(member_id, limit=20)
+        await NotificationService(session).get_active_notifications(limit=20)
+        await BadgeService(session).get_leaderboard()
+        await EventService(session).get_all(limit=20)
+
+
+async def warm_up(engine: AsyncEngine, connections: int, caches: bool) -> None:
+    """
+    Get a worker ready for its first requests: configure the ORM mappers,
+    open up to `connections` pool connections (TCP/TLS, asyncpg type
+    introspection) and prepare the hot queries on each, then fill caches.
+    """
+    configure_mappers()
+
+    count = max(0, min(connections, engine.pool.size()))
+    async with AsyncExitStack() as stack:
+        # All open at once so they are distinct; closing returns them to the pool
+        opened = await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(count)))
+        await asyncio.gather(*(_prime(conn) for conn in opened))
+
+    if caches:
+        async with async_session() as session:
+            await MemberService(session).prepare_autocomplete()
+    logger.info("Warm-up done: %d connections primed, caches %s", count, "filled" if caches else "skipped")
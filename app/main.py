@@ -1,36 +1,116 @@
+from app.core.startup import startup_report  # first, so the phases below are timed from here
+
+import asyncio
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from sqlmodel import SQLModel
+startup_report.mark("framework")
 
 from app.core.config import settings
-from app.api.v1.routes import auth, user, company, event, member, notification, badge  # Import notification and badge routes
+startup_report.mark("config")
+
 from app.db.session import engine
-# Import models for table creation
-from app.models.user import User
-from app.models.member import Member
-from app.models.company import Company
-from app.models.follower import Follower
-from app.models.social_link import SocialLink
-from app.models.external_link import ExternalLink
-from app.models.image import Image
-from app.models.notification import Notification  # Import notification model
-from app.models.badge import Badge, MemberBadge  # Import badge models
+from app.db.init_db import create_extensions
+from app import models  # noqa: F401 (registers every model for create_all)
+startup_report.mark("engine and models")
+
+from app.core.compression import CompressionMiddleware
+from app.core.health import liveness_endpoint, loop_lag, pool_saturated, readiness_endpoint, set_ready
+from app.core.load_shedding import LoadSheddingMiddleware
+from app.core.metrics import MetricsMiddleware, metrics_endpoint
+from app.core.profiling import ProfilingMiddleware, install_signal_handler, remove_signal_handler
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.tracing import TRACING_ENABLED, TracingMiddleware, setup_tracing, shutdown_tracing
+from app.core.responses import FastJSONResponse
+from app.api.v1.routes import auth, user, company, event, member, notification, badge, search, imports, exports, profiling  # Import notification and badge routes
+from app.services.badge_validity_service import BadgeScheduler
+from app.db.warmup import warm_up
+startup_report.mark("routes and services")
+
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Create database tables
-    async with engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.create_all)
+    if settings.DB_CREATE_ALL_ON_STARTUP:
+        with startup_report.phase("create tables"):
+            async with engine.begin() as conn:
+                await create_extensions(conn)
+                await conn.run_sync(SQLModel.metadata.create_all)
+    if settings.WARMUP_ENABLED:
+        with startup_report.phase("warm-up"):
+            try:
+                await asyncio.wait_for(
+                    warm_up(engine, settings.WARMUP_CONNECTIONS, settings.WARMUP_CACHES),
+                    timeout=settings.WARMUP_TIMEOUT_SECONDS,
+                )
+            except Exception:
+                # Only an optimization: serve cold rather than not at all
+                logger.exception("Warm-up failed")
+    badge_scheduler = BadgeScheduler()
+    if settings.BADGE_SCHEDULER_ENABLED:
+        badge_scheduler.start()
+    if settings.PROFILING_ENABLED:
+        install_signal_handler()
+    loop_lag.start()
+    startup_report.log(settings.STARTUP_BUDGET_MS)
+    set_ready(True)
     yield
+    set_ready(False)
+    await loop_lag.stop()
+    if settings.PROFILING_ENABLED:
+        remove_signal_handler()
+    await badge_scheduler.stop()
+    shutdown_tracing()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="v1",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
+)
+
+# Compress large responses (gzip, or brotli when available)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+    brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    cache_bytes=settings.COMPRESSION_CACHE_BYTES,
 )
 
-# Set all CORS enabled origins
+# Admin requests with an X-Profile header are answered with their CPU profile
+if settings.PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
+
+# Count SQL statements and DB time per request (every query runs further in,
+# inside profiling and compression; metrics, tracing and load shedding wrap it)
+app.add_middleware(QueryStatsMiddleware, emit_headers=settings.DEBUG)
+
+# Per-route latency histograms and in-flight requests
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+
+# Request, service and SQL spans; nothing is installed when tracing is off
+if TRACING_ENABLED:
+    setup_tracing(engine)
+    app.add_middleware(TracingMiddleware)
+
+# Reject requests beyond the adaptive concurrency limit with 503
+if settings.LOAD_SHEDDING_ENABLED:
+    app.add_middleware(
+        LoadSheddingMiddleware,
+        priority_paths=settings.LOAD_SHEDDING_PRIORITY_PATHS,
+        reserve=settings.CONCURRENCY_PRIORITY_RESERVE,
+        pool_saturated=pool_saturated,
+    )
+
+# Set all CORS enabled origins (outermost, so 503s from load shedding carry
+# CORS headers and preflight requests are never shed)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
@@ -39,6 +119,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_route("/health/live", liveness_endpoint, include_in_schema=False)
+app.add_route("/health/ready", readiness_endpoint, include_in_schema=False)
+
 # API routes
 api_v1_prefix = f"{settings.API_V1_STR}"
 app.include_router(auth.router, prefix=f"{api_v1_prefix}/auth", tags=["auth"])
@@ -47,4 +130,10 @@ app.include_router(company.router, prefix=f"{api_v1_prefix}/companies", tags=["c
 app.include_router(event.router, prefix=f"{api_v1_prefix}/events", tags=["events"])
 app.include_router(member.router, prefix=f"{api_v1_prefix}/members", tags=["members"])
 app.include_router(notification.router, prefix=f"{api_v1_prefix}/notifications", tags=["notifications"])
-app.include_router(badge.router, prefix=f"{api_v1_prefix}/badges", tags=["badges"])
\ No newline at end of file
+app.include_router(badge.router, prefix=f"{api_v1_prefix}/badges", tags=["badges"])
+app.include_router(search.router, prefix=f"{api_v1_prefix}/search", tags=["search"])
+app.include_router(imports.router, prefix=f"{api_v1_prefix}/imports", tags=["imports"])
+app.include_router(exports.router, prefix=f"{api_v1_prefix}/exports", tags=["exports"])
+if settings.PROFILING_ENABLED:
+    app.include_router(profiling.router, prefix=f"{api_v1_prefix}/profiling", tags=["profiling"])
+startup_report.mark("app and router setup")
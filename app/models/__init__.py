@@ -5,6 +5,11 @@ from .follower import Follower
 from .social_link import SocialLink
 from .external_link import ExternalLink
 from .image import Image
+from .notification import Notification
+from .badge import Badge, MemberBadge
+from .search_document import SearchDocument
+from .event_registration import EventRegistration
+from .event import Event, EventOccurrenceOverride
 
 __all__ = [
     "User",
@@ -13,5 +18,12 @@ __all__ = [
     "Follower",
     "SocialLink",
     "ExternalLink",
-    "Image"
+    "Image",
+    "Notification",
+    "Badge",
+    "MemberBadge",
+    "SearchDocument",
+    "EventRegistration",
+    "Event",
+    "EventOccurrenceOverride",
 ]
@@ -2,12 +2,18 @@ import uuid
 from datetime import datetime
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint, text
 import sqlalchemy.dialects.postgresql as pg
 
 
 class Badge(SQLModel, table=True):
     __tablename__ = "badges"
+    __table_args__ = (
+        Index("ix_badges_active", "is_active", "created_at"),
+        # Validity boundaries the scheduler looks for
+        Index("ix_badges_pending_valid_from", "valid_from", postgresql_where=text("activation_pending")),
+        Index("ix_badges_active_valid_until", "valid_until", postgresql_where=text("is_active")),
+    )
 
     # Primary Key
     id: uuid.UUID = Field(
@@ -21,6 +27,10 @@ class Badge(SQLModel, table=True):
     
     # Status and Dates
     is_active: bool = Field(sa_column=Column(pg.BOOLEAN, nullable=False, default=True))
+    # Requested active but valid_from is still ahead; the scheduler activates it then
+    activation_pending: bool = Field(
+        default=False, sa_column=Column(pg.BOOLEAN, nullable=False, default=False, server_default="false")
+    )
     created_at: datetime = Field(
         sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow)
     )
@@ -30,12 +40,13 @@ class Badge(SQLModel, table=True):
     valid_from: datetime = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False))
     valid_until: Optional[datetime] = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True))
 
-    # Relationships
+    # Relationship to holders (not loaded with the badge; query or count them instead)
     members: List["MemberBadge"] = Relationship(
         back_populates="badge",
         sa_relationship_kwargs={
-            "lazy": "selectin",
-            "cascade": "all, delete-orphan"
+            "lazy": "select",
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True
         }
     )
 
@@ -46,6 +57,13 @@ class Badge(SQLModel, table=True):
 class MemberBadge(SQLModel, table=True):
     """Association table for many-to-many relationship between Members and Badges"""
     __tablename__ = "member_badges"
+    __table_args__ = (
+        # A badge is held once per member; bulk assignment skips existing holders
+        UniqueConstraint("member_id", "badge_id", name="uq_member_badges_member_badge"),
+        # active_only listings of a member's badges and of a badge's holders
+        Index("ix_member_badges_member_active", "member_id", "is_active"),
+        Index("ix_member_badges_badge_active", "badge_id", "is_active"),
+    )
 
     # Primary Key (composite)
     id: uuid.UUID = Field(
@@ -71,5 +89,14 @@ class MemberBadge(SQLModel, table=True):
 
     # Relationships
     member: "Member" = Relationship(back_populates="badges")
-    badge: Badge = Relationship(back_populates="members")
-    issued_by: "User" = Relationship() 
\ No newline at end of file
+    # Joined so member responses can show badge names and icons without extra queries
+    badge: Badge = Relationship(back_populates="members", sa_relationship_kwargs={"lazy": "joined"})
+    issued_by: "User" = Relationship()
+
+    @property
+    def badge_name(self) -> str:
+        return self.badge.name
+
+    @property
+    def badge_icon(self) -> str:
+        return self.badge.icon
@@ -26,16 +26,16 @@ class Company(SQLModel, table=True):
         sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
     )
 
-    # Relationship to events
+    # Relationship to events (not loaded with the company; query or count them instead)
     events: List["Event"] = Relationship(
         back_populates="organizing_company",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"lazy": "select", "cascade": "all, delete-orphan"}
     )
 
-    # Relationship to members
+    # Relationship to members (not loaded with the company; query or count them instead)
     members: List["Member"] = Relationship(
         back_populates="company",
-        sa_relationship_kwargs={"lazy": "selectin", "cascade": "all, delete-orphan"}
+        sa_relationship_kwargs={"lazy": "select", "cascade": "all, delete-orphan"}
     )
 
     def __repr__(self):
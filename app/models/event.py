@@ -2,12 +2,24 @@ import uuid
 from datetime import datetime
 from typing import Optional
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column,ForeignKey
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint, text
 import sqlalchemy.dialects.postgresql as pg
 
 
 class Event(SQLModel, table=True):
     __tablename__ = "events"
+    __table_args__ = (
+        # Time-window listings and keyset cursors, overall and per organizer
+        Index("ix_events_start_time_id", "start_time", "id"),
+        Index("ix_events_company_id_start_time", "company_id", "start_time"),
+        # Series overlapping a window: started before its end, not ended before its start
+        Index(
+            "ix_events_recurring",
+            "start_time",
+            "recurrence_end",
+            postgresql_where=text("recurrence_freq IS NOT NULL"),
+        ),
+    )
 
     id: uuid.UUID = Field(
         sa_column=Column(pg.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
@@ -23,6 +35,24 @@ class Event(SQLModel, table=True):
     is_virtual: bool = Field(default=False, sa_column=Column(pg.BOOLEAN, nullable=False, default=False))
     registration_link: Optional[str] = Field(sa_column=Column(pg.TEXT, nullable=True))
     capacity: Optional[int] = Field(sa_column=Column(pg.INTEGER, nullable=True))
+    # Recurrence: the row describes the first occurrence of a series repeating
+    # every `recurrence_interval` days/weeks/months (see app.core.recurrence)
+    recurrence_freq: Optional[str] = Field(default=None, sa_column=Column(pg.VARCHAR(10), nullable=True))
+    recurrence_interval: int = Field(
+        default=1, sa_column=Column(pg.INTEGER, nullable=False, default=1, server_default="1")
+    )
+    recurrence_until: Optional[datetime] = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True))
+    recurrence_count: Optional[int] = Field(default=None, sa_column=Column(pg.INTEGER, nullable=True))
+    recurrence_timezone: str = Field(
+        default="UTC", sa_column=Column(pg.VARCHAR(64), nullable=False, default="UTC", server_default="UTC")
+    )
+    # Start of the last occurrence (NULL for open-ended series), maintained by EventService
+    recurrence_end: Optional[datetime] = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True))
+
+    # Seats taken; only changed through RegistrationService's conditional updates
+    registered_count: int = Field(
+        default=0, sa_column=Column(pg.INTEGER, nullable=False, default=0, server_default="0")
+    )
     
     created_at: datetime = Field(
         sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow)
@@ -47,3 +77,40 @@ class Event(SQLModel, table=True):
 
     def __repr__(self):
         return f"<Event {self.title}>"
+
+
+class EventOccurrenceOverride(SQLModel, table=True):
+    """Changes to, or the cancellation of, a single occurrence of a recurring event"""
+    __tablename__ = "event_occurrence_overrides"
+    __table_args__ = (
+        UniqueConstraint("event_id", "occurrence_start", name="uq_event_occurrence_overrides_occurrence"),
+        # Occurrences moved into a window from outside it
+        Index("ix_event_occurrence_overrides_start_time", "start_time"),
+    )
+
+    id: uuid.UUID = Field(
+        sa_column=Column(pg.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    )
+    event_id: uuid.UUID = Field(
+        sa_column=Column(pg.UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    )
+    # Start of the occurrence as generated by the rule; identifies the occurrence
+    occurrence_start: datetime = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False))
+
+    is_cancelled: bool = Field(default=False, sa_column=Column(pg.BOOLEAN, nullable=False, default=False))
+    # Replacement values; NULL keeps the series value
+    title: Optional[str] = Field(default=None, sa_column=Column(pg.VARCHAR(255), nullable=True))
+    description: Optional[str] = Field(default=None, sa_column=Column(pg.TEXT, nullable=True))
+    location: Optional[str] = Field(default=None, sa_column=Column(pg.VARCHAR(255), nullable=True))
+    start_time: Optional[datetime] = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True))
+    end_time: Optional[datetime] = Field(default=None, sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=True))
+
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow)
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    )
+
+    def __repr__(self):
+        return f"<EventOccurrenceOverride {self.event_id}@{self.occurrence_start}>"
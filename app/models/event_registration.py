@@ -0,0 +1,46 @@
+import uuid
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, ForeignKey, Index, UniqueConstraint
+import sqlalchemy.dialects.postgresql as pg
+
+REGISTERED = "registered"
+WAITLISTED = "waitlisted"
+CANCELLED = "cancelled"
+
+
+class EventRegistration(SQLModel, table=True):
+    """A member's seat (or waitlist spot) for an event"""
+    __tablename__ = "event_registrations"
+    __table_args__ = (
+        # One registration per member and event; makes retries idempotent
+        UniqueConstraint("event_id", "member_id", name="uq_event_registrations_event_member"),
+        # Waitlist promotion picks the oldest waitlisted registration
+        Index("ix_event_registrations_event_status_created", "event_id", "status", "created_at"),
+    )
+
+    # Primary Key
+    id: uuid.UUID = Field(
+        sa_column=Column(pg.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
+    )
+
+    # Foreign Keys
+    event_id: uuid.UUID = Field(
+        sa_column=Column(pg.UUID(as_uuid=True), ForeignKey("events.id", ondelete="CASCADE"), nullable=False)
+    )
+    member_id: uuid.UUID = Field(
+        sa_column=Column(pg.UUID(as_uuid=True), ForeignKey("members.id", ondelete="CASCADE"), nullable=False)
+    )
+
+    # registered, waitlisted or cancelled
+    status: str = Field(sa_column=Column(pg.VARCHAR(20), nullable=False))
+
+    created_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow)
+    )
+    updated_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    )
+
+    def __repr__(self):
+        return f"<EventRegistration {self.event_id}:{self.member_id} {self.status}>"
@@ -1,12 +1,18 @@
 import uuid
 from datetime import datetime
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, ForeignKey, Index
 import sqlalchemy.dialects.postgresql as pg
 
 
 class Follower(SQLModel, table=True):
     __tablename__ = "followers"
+    __table_args__ = (
+        # A member's followers and the members they follow (also the selectin
+        # loads of Member.followers_list / following_list)
+        Index("ix_followers_followed_id_follower_id", "followed_id", "follower_id"),
+        Index("ix_followers_follower_id_followed_id", "follower_id", "followed_id"),
+    )
 
     id: uuid.UUID = Field(
         sa_column=Column(pg.UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, nullable=False)
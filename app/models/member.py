@@ -2,13 +2,39 @@ import uuid
 from datetime import datetime
 from typing import Optional, List
 from sqlmodel import SQLModel, Field, Relationship
-from sqlalchemy import Column, ForeignKey
+from sqlalchemy import Column, Computed, ForeignKey, Index, text
 import sqlalchemy.dialects.postgresql as pg
 from .image import Image
 
 
 class Member(SQLModel, table=True):
     __tablename__ = "members"
+    __table_args__ = (
+        Index("ix_members_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_members_user_name_trgm",
+            "user_name",
+            postgresql_using="gin",
+            postgresql_ops={"user_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_members_full_name_trgm",
+            text("(first_name || ' ' || last_name) gin_trgm_ops"),
+            postgresql_using="gin",
+        ),
+        # Prefix (LIKE 'abc%') scans for autocomplete when the in-memory index is off
+        Index("ix_members_user_name_prefix", text("lower(user_name) text_pattern_ops")),
+        Index("ix_members_slug_prefix", text("lower(slug) text_pattern_ops")),
+        # Company member counts and most recent members
+        Index("ix_members_company_id_joined_at", "company_id", "joined_at"),
+        # Member listing, newest first
+        Index("ix_members_created_at", "created_at"),
+        # Badge leaderboard
+        Index("ix_members_badge_count", text("badge_count DESC"), "id"),
+    )
+    # The search vector is maintained by Postgres and only used in WHERE/ORDER BY,
+    # so keep it out of the mapped attributes to avoid loading it with every member
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
 
     # Primary Key
     id: uuid.UUID = Field(
@@ -29,6 +55,25 @@ class Member(SQLModel, table=True):
     is_active: bool = Field(sa_column=Column(pg.BOOLEAN, nullable=False, default=True))
     following: Optional[str] = Field(sa_column=Column(pg.TEXT, nullable=True))
     followers: Optional[str] = Field(sa_column=Column(pg.TEXT, nullable=True))
+    # Active badge assignments; only changed by BadgeService in the assigning transaction
+    badge_count: int = Field(
+        default=0, sa_column=Column(pg.INTEGER, nullable=False, default=0, server_default="0")
+    )
+    
+    # Full-text search (generated column, names weigh more than position and bio)
+    search_vector: Optional[str] = Field(
+        default=None,
+        sa_column=Column(
+            pg.TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('simple', coalesce(first_name, '') || ' ' || "
+                "coalesce(last_name, '') || ' ' || coalesce(user_name, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(position, '')), 'B') || "
+                "setweight(to_tsvector('simple', coalesce(bio, '')), 'C')",
+                persisted=True,
+            ),
+        ),
+    )
     
     # Timestamps
     joined_at: datetime = Field(sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False))
@@ -0,0 +1,63 @@
+import uuid
+from datetime import datetime
+from typing import Optional, Dict
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Column, Computed, Index, PrimaryKeyConstraint
+import sqlalchemy.dialects.postgresql as pg
+
+
+class SearchDocument(SQLModel, table=True):
+    """
+    One row per searchable entity (member, company, event), kept in sync by the
+    services' write paths so a single index serves cross-entity search.
+    """
+    __tablename__ = "search_documents"
+    __table_args__ = (
+        PrimaryKeyConstraint("entity_type", "entity_id"),
+        Index("ix_search_documents_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_search_documents_facets",
+            "facets",
+            postgresql_using="gin",
+            postgresql_ops={"facets": "jsonb_path_ops"},
+        ),
+    )
+    # Only used in WHERE/ORDER BY, never loaded
+    __mapper_args__ = {"exclude_properties": ["search_vector"]}
+
+    entity_type: str = Field(sa_column=Column(pg.VARCHAR(20), nullable=False))
+    entity_id: uuid.UUID = Field(sa_column=Column(pg.UUID(as_uuid=True), nullable=False))
+
+    # Display fields returned with hits
+    title: str = Field(sa_column=Column(pg.VARCHAR(255), nullable=False))
+    subtitle: Optional[str] = Field(sa_column=Column(pg.VARCHAR(255), nullable=True))
+
+    # Weighted text: primary (A) > secondary (B) > body (C)
+    primary_text: str = Field(sa_column=Column(pg.TEXT, nullable=False))
+    secondary_text: Optional[str] = Field(sa_column=Column(pg.TEXT, nullable=True))
+    body_text: Optional[str] = Field(sa_column=Column(pg.TEXT, nullable=True))
+    search_vector: Optional[str] = Field(
+        default=None,
+        sa_column=Column(
+            pg.TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('simple', primary_text), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(secondary_text, '')), 'B') || "
+                "setweight(to_tsvector('simple', coalesce(body_text, '')), 'C')",
+                persisted=True,
+            ),
+        ),
+    )
+
+    # Facet values as strings, e.g. {"industry": "Fintech", "is_virtual": "true"}
+    facets: Dict[str, str] = Field(
+        default_factory=dict,
+        sa_column=Column(pg.JSONB, nullable=False, server_default="{}"),
+    )
+
+    updated_at: datetime = Field(
+        sa_column=Column(pg.TIMESTAMP(timezone=True), nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow)
+    )
+
+    def __repr__(self):
+        return f"<SearchDocument {self.entity_type}:{self.entity_id}>"
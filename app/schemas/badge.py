@@ -1,7 +1,7 @@
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
 
 class BadgeBase(BaseModel):
@@ -36,6 +36,8 @@ class BadgeUpdate(BaseModel):
 
 class BadgeRead(BadgeBase):
     id: UUID
+    # Waiting for valid_from before it becomes active
+    activation_pending: bool = False
     created_at: datetime
     updated_at: datetime
 
@@ -62,7 +64,49 @@ class MemberBadgeUpdate(BaseModel):
     }
 
 
+class MemberBadgeSummary(BaseModel):
+    """
+    Badge as shown on a member profile: the assignment with the badge's
+    name and icon, so no per-badge lookups are needed.
+    """
+    badge_id: UUID
+    badge_name: str
+    badge_icon: str
+    issued_at: datetime
+    is_active: bool
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
 class MemberBadgeRead(MemberBadgeBase):
     id: UUID
     issued_at: datetime
-    issued_by_id: UUID 
\ No newline at end of file
+    issued_by_id: UUID 
+
+
+class BadgeBatchAssign(BaseModel):
+    """
+    Members to award a badge to: explicit IDs, every member of a company or
+    every registered attendee of an event. Exactly one selector is allowed.
+    """
+    member_ids: Optional[List[UUID]] = Field(default=None, max_length=10000)
+    company_id: Optional[UUID] = None
+    event_id: Optional[UUID] = None
+
+    @model_validator(mode="after")
+    def check_one_selector(self) -> "BadgeBatchAssign":
+        selectors = [self.member_ids is not None, self.company_id is not None, self.event_id is not None]
+        if sum(selectors) != 1:
+            raise ValueError("Provide exactly one of member_ids, company_id or event_id")
+        return self
+
+
+class BadgeBatchAssignResult(BaseModel):
+    matched: int
+    inserted: int
+    # Matched members who already held the badge
+    skipped: int
+    # Requested member IDs that do not exist
+    missing_member_ids: List[UUID] = []
@@ -1,8 +1,10 @@
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, HttpUrl
 
+from .member import MemberSummary
+
 
 class CompanyBase(BaseModel):
     name: str
@@ -44,3 +46,13 @@ class CompanyRead(CompanyBase):
     model_config = {
         "from_attributes": True
     }
+
+
+class CompanyDetailRead(CompanyRead):
+    """
+    Company card: aggregate counts and a few recent members instead of the
+    full member and event collections.
+    """
+    member_count: int
+    upcoming_event_count: int
+    recent_members: List[MemberSummary]
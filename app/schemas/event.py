@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import List, Literal, Optional
 from uuid import UUID
-from datetime import datetime
-from pydantic import BaseModel, HttpUrl
+from datetime import date, datetime
+from pydantic import BaseModel, Field, HttpUrl
+
+RecurrenceFrequency = Literal["daily", "weekly", "monthly"]
 
 
 class EventBase(BaseModel):
@@ -15,6 +17,13 @@ class EventBase(BaseModel):
     registration_link: Optional[HttpUrl] = None
     capacity: Optional[int] = None
     company_id: UUID
+    # Repeat every `recurrence_interval` days/weeks/months until `recurrence_until`
+    # and/or for `recurrence_count` occurrences, in `recurrence_timezone` wall time
+    recurrence_freq: Optional[RecurrenceFrequency] = None
+    recurrence_interval: int = Field(default=1, ge=1)
+    recurrence_until: Optional[datetime] = None
+    recurrence_count: Optional[int] = Field(default=None, ge=1)
+    recurrence_timezone: str = "UTC"
 
     model_config = {
         "from_attributes": True
@@ -36,6 +45,11 @@ class EventUpdate(BaseModel):
     registration_link: Optional[HttpUrl] = None
     capacity: Optional[int] = None
     company_id: Optional[UUID] = None
+    recurrence_freq: Optional[RecurrenceFrequency] = None
+    recurrence_interval: Optional[int] = Field(default=None, ge=1)
+    recurrence_until: Optional[datetime] = None
+    recurrence_count: Optional[int] = Field(default=None, ge=1)
+    recurrence_timezone: Optional[str] = None
 
     model_config = {
         "from_attributes": True
@@ -44,9 +58,62 @@ class EventUpdate(BaseModel):
 
 class EventRead(EventBase):
     id: UUID
+    registered_count: int = 0
     created_at: datetime
     updated_at: datetime
 
     model_config = {
         "from_attributes": True
     }
+
+
+class EventDayCount(BaseModel):
+    day: date
+    count: int
+
+
+class EventCalendar(BaseModel):
+    year: int
+    month: int
+    timezone: str
+    days: List[EventDayCount]
+
+
+class EventRegistrationRead(BaseModel):
+    id: UUID
+    event_id: UUID
+    member_id: UUID
+    status: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class EventOccurrenceRead(BaseModel):
+    """
+    One occurrence of an event in a time window; single events have exactly one.
+    """
+    event_id: UUID
+    # Start generated by the recurrence rule, identifies the occurrence
+    occurrence_start: datetime
+    title: str
+    description: Optional[str] = None
+    location: Optional[str] = None
+    start_time: datetime
+    end_time: datetime
+    is_virtual: bool
+    company_id: UUID
+    is_recurring: bool
+    is_modified: bool = False
+
+
+class EventOccurrenceUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    location: Optional[str] = None
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    is_cancelled: bool = False
@@ -0,0 +1,4 @@
+from typing import Literal
+
+ExportEntityType = Literal["members", "followers", "badges"]
+ExportFormat = Literal["csv", "ndjson", "parquet"]
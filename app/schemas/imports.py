@@ -0,0 +1,21 @@
+from typing import List, Literal
+from pydantic import BaseModel
+
+ImportEntityType = Literal["member", "company"]
+ImportFormat = Literal["csv", "ndjson"]
+
+
+class ImportRowError(BaseModel):
+    # 1-based data row (CSV rows after the header, NDJSON lines)
+    row: int
+    errors: List[str]
+
+
+class ImportProgress(BaseModel):
+    """One line of the NDJSON import report, sent after every chunk and at the end."""
+    rows: int
+    inserted: int
+    failed: int
+    # Errors of the chunk just processed; the totals above are cumulative
+    errors: List[ImportRowError] = []
+    done: bool = False
@@ -3,6 +3,7 @@ from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, HttpUrl
 
+from .badge import MemberBadgeSummary
 from .image import ImageRead
 from .social_link import SocialLinkRead
 from .external_link import ExternalLinkRead
@@ -61,6 +62,8 @@ class MemberRead(MemberBase):
     cover_image: Optional[ImageRead] = None
     socials: List[SocialLinkRead] = []
     links: List[ExternalLinkRead] = []
+    badge_count: int = 0
+    badges: List[MemberBadgeSummary] = []
 
     model_config = {
         "from_attributes": True
@@ -85,7 +88,54 @@ class MemberPublicRead(BaseModel):
     cover_image_id: Optional[UUID] = None
     socials: Optional[List[SocialLinkRead]] = None
     links: Optional[List[ExternalLinkRead]] = None
+    badge_count: int = 0
+    badges: Optional[List[MemberBadgeSummary]] = None
 
     model_config = {
         "from_attributes": True
-    }
\ No newline at end of file
+    }
+
+
+class MemberSummary(BaseModel):
+    """
+    Compact member card - used where only name, handle and avatar are shown.
+    """
+    id: UUID
+    first_name: str
+    last_name: str
+    user_name: str
+    slug: str
+    position: Optional[str] = None
+    avatar: Optional[ImageRead] = None
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class MemberBadgeRanking(MemberSummary):
+    badge_count: int
+
+
+class MemberSearchHit(MemberSummary):
+    rank: float
+
+
+class MemberSearchResults(BaseModel):
+    items: List[MemberSearchHit]
+    next_cursor: Optional[str] = None
+
+
+class MemberSuggestion(BaseModel):
+    """
+    Autocomplete entry for mention and follow pickers.
+    """
+    id: UUID
+    user_name: str
+    slug: str
+    first_name: str
+    last_name: str
+
+    model_config = {
+        "from_attributes": True
+    }
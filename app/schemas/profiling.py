@@ -0,0 +1,3 @@
+from typing import Literal
+
+ProfileFormat = Literal["speedscope", "collapsed"]
@@ -0,0 +1,24 @@
+from typing import Dict, List, Literal, Optional
+from uuid import UUID
+from pydantic import BaseModel
+
+EntityType = Literal["member", "company", "event"]
+
+
+class SearchHit(BaseModel):
+    entity_type: EntityType
+    entity_id: UUID
+    title: str
+    subtitle: Optional[str] = None
+    rank: float
+
+    model_config = {
+        "from_attributes": True
+    }
+
+
+class SearchResults(BaseModel):
+    items: List[SearchHit]
+    total: int
+    # facet name -> value -> number of matching documents, e.g. {"type": {"event": 3}}
+    facets: Dict[str, Dict[str, int]]
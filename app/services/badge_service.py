@@ -1,23 +1,77 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from datetime import datetime
-import pytz
-from sqlmodel import select
+from datetime import datetime, timezone
+from sqlalchemy import func, literal, true, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import joinedload, load_only, noload
+from sqlmodel import desc, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException
 
+from app.core.clock import Clock, system_clock
+from app.core.fields import FieldSelection
+from app.core.tracing import traced
+from app.db.count import count_rows
 from app.models.badge import Badge, MemberBadge
+from app.models.company import Company
+from app.models.event import Event
+from app.models.event_registration import REGISTERED, EventRegistration
 from app.models.member import Member
-from app.schemas.badge import BadgeCreate, BadgeUpdate, MemberBadgeCreate, MemberBadgeUpdate
+from app.schemas.badge import (
+    BadgeBatchAssign,
+    BadgeBatchAssignResult,
+    BadgeCreate,
+    BadgeUpdate,
+    MemberBadgeCreate,
+    MemberBadgeUpdate,
+)
 
 
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    # Timestamps sent without an offset are stored as UTC
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def apply_validity_window(badge: Badge, now: datetime) -> None:
+    """
+    Reconcile a badge that was requested active with its validity window:
+    expired badges are inactive, badges whose window has not started wait
+    for the scheduler (activation_pending), the rest are active.
+    """
+    if not (badge.is_active or badge.activation_pending):
+        return
+    valid_until = _as_utc(badge.valid_until)
+    expired = valid_until is not None and valid_until <= now
+    pending = not expired and _as_utc(badge.valid_from) > now
+    badge.is_active = not expired and not pending
+    badge.activation_pending = pending
+
+
+def badge_count_update(where, delta):
+    """
+    UPDATE adding `delta` (a number or a column expression) to the badge
+    count of the members matching `where`.
+    """
+    return (
+        update(Member)
+        .where(where)
+        # Badge counts are not edits of the member, keep updated_at as is
+        .values(badge_count=Member.badge_count + delta, updated_at=Member.updated_at)
+    )
+
+
+@traced
 class BadgeService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, clock: Clock = system_clock):
         self.session = session
+        self.clock = clock
 
     async def create(self, badge_in: BadgeCreate) -> Badge:
         """Create a new badge."""
         badge = Badge(**badge_in.model_dump())
+        apply_validity_window(badge, self.clock.now())
         self.session.add(badge)
         await self.session.commit()
         await self.session.refresh(badge)
@@ -34,30 +88,54 @@ class BadgeService:
         self,
         skip: int = 0,
         limit: int = 100,
-        active_only: bool = False
+        active_only: bool = False,
+        fields: Optional[FieldSelection] = None
     ) -> List[Badge]:
         """Get all badges with optional filtering."""
+        query = self._list_query(active_only=active_only)
+        if fields:
+            query = query.options(*fields.loader_options())
+        query = query.order_by(desc(Badge.created_at)).offset(skip).limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def count_all(self, active_only: bool = False) -> Tuple[int, bool]:
+        """Count badges matching the list filters."""
+        return await count_rows(self.session, self._list_query(active_only=active_only))
+
+    def _list_query(self, active_only: bool = False):
         query = select(Badge)
         if active_only:
             query = query.where(Badge.is_active == True)
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return query
 
     async def update(self, badge: Badge, badge_in: BadgeUpdate) -> Badge:
         """Update a badge."""
         update_data = badge_in.model_dump(exclude_unset=True)
+        if "is_active" in update_data:
+            # An explicit (de)activation replaces any scheduled activation
+            badge.activation_pending = False
         for field, value in update_data.items():
             setattr(badge, field, value)
         
-        badge.updated_at = datetime.now(pytz.UTC)
+        now = self.clock.now()
+        apply_validity_window(badge, now)
+        badge.updated_at = now
         self.session.add(badge)
         await self.session.commit()
         await self.session.refresh(badge)
         return badge
 
     async def delete(self, badge: Badge) -> None:
-        """Delete a badge."""
+        """Delete a badge, and with it every assignment."""
+        await self._adjust_badge_counts(
+            Member.id.in_(
+                select(MemberBadge.member_id).where(
+                    MemberBadge.badge_id == badge.id, MemberBadge.is_active == True
+                )
+            ),
+            -1,
+        )
         await self.session.delete(badge)
         await self.session.commit()
 
@@ -68,45 +146,127 @@ class BadgeService:
     ) -> MemberBadge:
         """Assign a badge to a member."""
         # Check if member exists
-        stmt = select(Member).where(Member.id == member_badge_in.member_id)
+        stmt = select(Member.id).where(Member.id == member_badge_in.member_id)
         result = await self.session.execute(stmt)
-        member = result.scalar_one_or_none()
-        if not member:
+        if result.scalar_one_or_none() is None:
             raise HTTPException(status_code=404, detail="Member not found")
 
-        # Check if badge is active
-        badge = await self.get(member_badge_in.badge_id)
+        now = self.clock.now()
+        await self._check_assignable(member_badge_in.badge_id, now)
+
+        # Create member badge; the unique (member_id, badge_id) constraint
+        # decides between concurrent assignments of the same badge
+        stmt = (
+            insert(MemberBadge)
+            .values(
+                **member_badge_in.model_dump(),
+                issued_by_id=issued_by_id,
+                issued_at=now  # Use UTC time for issued_at
+            )
+            .on_conflict_do_nothing(constraint="uq_member_badges_member_badge")
+            .returning(MemberBadge)
+        )
+        member_badge = (await self.session.execute(stmt)).scalar_one_or_none()
+        if member_badge is None:
+            raise HTTPException(status_code=400, detail="Member already has this badge")
+        if member_badge.is_active:
+            await self._adjust_badge_counts(Member.id == member_badge.member_id, 1)
+        await self.session.commit()
+        await self.session.refresh(member_badge)
+        return member_badge
+
+    async def assign_badge_batch(
+        self,
+        badge_id: UUID,
+        selection: BadgeBatchAssign,
+        issued_by_id: UUID
+    ) -> BadgeBatchAssignResult:
+        """
+        Assign a badge to many members in one INSERT ... SELECT.
+
+        The badge is checked once, the selected members are resolved in SQL
+        and members who already hold the badge are skipped through
+        ON CONFLICT (member_id, badge_id) DO NOTHING. Badge counts of the
+        members actually awarded are incremented by the same statement.
+        """
+        now = self.clock.now()
+        await self._check_assignable(badge_id, now)
+
+        if selection.member_ids is not None:
+            member_ids = select(Member.id).where(Member.id.in_(set(selection.member_ids)))
+        elif selection.company_id is not None:
+            await self._check_exists(Company, selection.company_id, "Company not found")
+            member_ids = select(Member.id).where(Member.company_id == selection.company_id)
+        else:
+            await self._check_exists(Event, selection.event_id, "Event not found")
+            member_ids = select(EventRegistration.member_id).where(
+                EventRegistration.event_id == selection.event_id,
+                EventRegistration.status == REGISTERED,
+            )
+        source = member_ids.cte("source")
+        table = MemberBadge.__table__
+        inserted = (
+            insert(table)
+            .from_select(
+                ["id", "member_id", "badge_id", "issued_at", "issued_by_id", "is_active"],
+                select(
+                    func.gen_random_uuid(),
+                    source.c[0],
+                    literal(badge_id, table.c.badge_id.type),
+                    literal(now, table.c.issued_at.type),
+                    literal(issued_by_id, table.c.issued_by_id.type),
+                    true(),
+                ),
+            )
+            .on_conflict_do_nothing(constraint="uq_member_badges_member_badge")
+            .returning(table.c.member_id)
+            .cte("inserted")
+        )
+        # Counted in the same statement, once per newly inserted assignment
+        counted = (
+            badge_count_update(Member.id.in_(select(inserted.c.member_id)), 1)
+            .returning(Member.id)
+            .cte("counted")
+        )
+        stmt = select(
+            select(func.array_agg(source.c[0])).scalar_subquery(),
+            select(func.count()).select_from(counted).scalar_subquery(),
+        )
+        matched_ids, inserted_count = (await self.session.execute(stmt)).one()
+        await self.session.commit()
+
+        matched_ids = matched_ids or []
+        missing: List[UUID] = []
+        if selection.member_ids is not None:
+            found = set(matched_ids)
+            missing = [member_id for member_id in dict.fromkeys(selection.member_ids) if member_id not in found]
+        return BadgeBatchAssignResult(
+            matched=len(matched_ids),
+            inserted=inserted_count,
+            skipped=len(matched_ids) - inserted_count,
+            missing_member_ids=missing,
+        )
+
+    async def _check_assignable(self, badge_id: UUID, now: datetime) -> None:
+        """Raise unless the badge exists, is active and within its validity window."""
+        # Columns only: loading the Badge would pull in every holder
+        stmt = select(Badge.is_active, Badge.valid_from, Badge.valid_until).where(Badge.id == badge_id)
+        badge = (await self.session.execute(stmt)).first()
         if not badge:
             raise HTTPException(status_code=404, detail="Badge not found")
         if not badge.is_active:
             raise HTTPException(status_code=400, detail="Badge is not active")
-        
+
         # Check if badge is valid (within valid_from and valid_until dates)
-        now = datetime.now(pytz.UTC)
         if badge.valid_from > now:
             raise HTTPException(status_code=400, detail="Badge is not yet valid")
         if badge.valid_until and badge.valid_until < now:
             raise HTTPException(status_code=400, detail="Badge has expired")
 
-        # Check if member already has this badge
-        stmt = select(MemberBadge).where(
-            MemberBadge.member_id == member_badge_in.member_id,
-            MemberBadge.badge_id == member_badge_in.badge_id
-        )
-        result = await self.session.execute(stmt)
-        if result.first():
-            raise HTTPException(status_code=400, detail="Member already has this badge")
-
-        # Create member badge
-        member_badge = MemberBadge(
-            **member_badge_in.model_dump(),
-            issued_by_id=issued_by_id,
-            issued_at=now  # Use UTC time for issued_at
-        )
-        self.session.add(member_badge)
-        await self.session.commit()
-        await self.session.refresh(member_badge)
-        return member_badge
+    async def _check_exists(self, model: type, entity_id: UUID, detail: str) -> None:
+        result = await self.session.execute(select(model.id).where(model.id == entity_id))
+        if result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail=detail)
 
     async def update_member_badge(
         self,
@@ -114,15 +274,50 @@ class BadgeService:
         member_badge_in: MemberBadgeUpdate
     ) -> MemberBadge:
         """Update a member's badge (e.g., deactivate it)."""
+        was_active = member_badge.is_active
         update_data = member_badge_in.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(member_badge, field, value)
         
         self.session.add(member_badge)
+        if member_badge.is_active != was_active:
+            await self._adjust_badge_counts(
+                Member.id == member_badge.member_id, 1 if member_badge.is_active else -1
+            )
         await self.session.commit()
         await self.session.refresh(member_badge)
         return member_badge
 
+    async def remove_member_badge(self, member_badge: MemberBadge) -> None:
+        """Remove a badge assignment."""
+        if member_badge.is_active:
+            await self._adjust_badge_counts(Member.id == member_badge.member_id, -1)
+        await self.session.delete(member_badge)
+        await self.session.commit()
+
+    async def get_leaderboard(self, limit: int = 10) -> List[Member]:
+        """Active members holding the most active badges, read from the maintained counts."""
+        stmt = (
+            select(Member)
+            .where(Member.is_active == True, Member.badge_count > 0)
+            .order_by(desc(Member.badge_count), Member.id)
+            .limit(limit)
+            .options(
+                load_only(
+                    Member.first_name, Member.last_name, Member.user_name,
+                    Member.slug, Member.position, Member.badge_count,
+                ),
+                joinedload(Member.avatar),
+                noload("*"),
+            )
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def _adjust_badge_counts(self, where, delta: int) -> None:
+        """Change the badge count of the members matching `where`, in the caller's transaction."""
+        await self.session.execute(badge_count_update(where, delta))
+
     async def get_member_badges(
         self,
         member_id: UUID,
@@ -131,9 +326,7 @@ class BadgeService:
         active_only: bool = False
     ) -> List[MemberBadge]:
         """Get all badges for a specific member."""
-        query = select(MemberBadge).where(MemberBadge.member_id == member_id)
-        if active_only:
-            query = query.where(MemberBadge.is_active == True)
+        query = self._member_badges_query(member_id, active_only=active_only)
         query = query.offset(skip).limit(limit)
         result = await self.session.execute(query)
         return list(result.scalars().all())
@@ -146,9 +339,27 @@ class BadgeService:
         active_only: bool = False
     ) -> List[MemberBadge]:
         """Get all members who have a specific badge."""
+        query = self._badge_holders_query(badge_id, active_only=active_only)
+        query = query.offset(skip).limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def count_member_badges(self, member_id: UUID, active_only: bool = False) -> Tuple[int, bool]:
+        query = self._member_badges_query(member_id, active_only=active_only)
+        return await count_rows(self.session, query)
+
+    async def count_badge_holders(self, badge_id: UUID, active_only: bool = False) -> Tuple[int, bool]:
+        query = self._badge_holders_query(badge_id, active_only=active_only)
+        return await count_rows(self.session, query)
+
+    def _member_badges_query(self, member_id: UUID, active_only: bool = False):
+        query = select(MemberBadge).where(MemberBadge.member_id == member_id)
+        if active_only:
+            query = query.where(MemberBadge.is_active == True)
+        return query
+
+    def _badge_holders_query(self, badge_id: UUID, active_only: bool = False):
         query = select(MemberBadge).where(MemberBadge.badge_id == badge_id)
         if active_only:
             query = query.where(MemberBadge.is_active == True)
-        query = query.offset(skip).limit(limit)
-        result = await self.session.execute(query)
-        return list(result.scalars().all()) 
\ No newline at end of file
+        return query 
\ No newline at end of file
@@ -0,0 +1,183 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from sqlalchemy import func, or_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.clock import Clock, system_clock
+from app.core.config import settings
+from app.core.tracing import traced
+from app.db.session import async_session
+from app.models.badge import Badge, MemberBadge
+from app.models.member import Member
+from app.services.badge_service import badge_count_update
+
+logger = logging.getLogger(__name__)
+
+
+@traced
+class BadgeValidityService:
+    """
+    Applies badge validity windows to the stored is_active flags.
+
+    Badges waiting for valid_from are activated, badges past valid_until are
+    deactivated along with their assignments, and the badge counts of the
+    affected members are decremented. Assignments are deactivated in batches
+    of `batch_size`, one short transaction each, skipping rows locked by
+    other writers (a later run picks them up). Every update is conditional,
+    so concurrent runs from several workers do not double count.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        clock: Clock = system_clock,
+        batch_size: int = settings.BADGE_SYNC_BATCH_SIZE,
+    ):
+        self.session = session
+        self.clock = clock
+        self.batch_size = batch_size
+
+    async def sync(self) -> Dict[str, int]:
+        """Apply every boundary passed by now; returns how many rows changed."""
+        now = self.clock.now()
+        activated = await self.session.execute(
+            update(Badge)
+            .where(
+                Badge.activation_pending == True,
+                Badge.valid_from <= now,
+                or_(Badge.valid_until == None, Badge.valid_until > now),
+            )
+            .values(is_active=True, activation_pending=False, updated_at=now)
+            .returning(Badge.id)
+            .execution_options(synchronize_session=False)
+        )
+        expired = await self.session.execute(
+            update(Badge)
+            .where(
+                or_(Badge.is_active == True, Badge.activation_pending == True),
+                Badge.valid_until <= now,
+            )
+            .values(is_active=False, activation_pending=False, updated_at=now)
+            .returning(Badge.id)
+            .execution_options(synchronize_session=False)
+        )
+        counts = {
+            "badges_activated": len(activated.all()),
+            "badges_expired": len(expired.all()),
+            "assignments_expired": 0,
+        }
+        await self.session.commit()
+
+        while True:
+            deactivated = await self._expire_assignments(now)
+            await self.session.commit()
+            counts["assignments_expired"] += deactivated
+            if deactivated < self.batch_size:
+                break
+        return counts
+
+    async def next_boundary(self) -> Optional[datetime]:
+        """Earliest pending activation or expiry, or None when nothing is scheduled."""
+        next_activation = (
+            select(func.min(Badge.valid_from)).where(Badge.activation_pending == True).scalar_subquery()
+        )
+        next_expiry = (
+            select(func.min(Badge.valid_until)).where(Badge.is_active == True).scalar_subquery()
+        )
+        result = await self.session.execute(select(func.least(next_activation, next_expiry)))
+        return result.scalar_one_or_none()
+
+    async def _expire_assignments(self, now: datetime) -> int:
+        """Deactivate one batch of active assignments of expired badges."""
+        batch = (
+            select(MemberBadge.id)
+            .where(
+                MemberBadge.is_active == True,
+                MemberBadge.badge_id.in_(select(Badge.id).where(Badge.valid_until <= now)),
+            )
+            .limit(self.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        deactivated = (
+            update(MemberBadge)
+            .where(MemberBadge.id.in_(batch))
+            .values(is_active=False)
+            .returning(MemberBadge.member_id)
+            .cte("deactivated")
+        )
+        per_member = (
+            select(deactivated.c.member_id, func.count().label("expired"))
+            .group_by(deactivated.c.member_id)
+            .subquery()
+        )
+        counted = (
+            badge_count_update(Member.id == per_member.c.member_id, -per_member.c.expired)
+            .returning(Member.id)
+            .cte("counted")
+        )
+        stmt = select(
+            select(func.count()).select_from(deactivated).scalar_subquery(),
+            select(func.count()).select_from(counted).scalar_subquery(),
+        )
+        deactivated_count, _ = (await self.session.execute(stmt)).one()
+        return deactivated_count
+
+
+class BadgeScheduler:
+    """
+    Background loop running BadgeValidityService.sync. It sleeps until the
+    next stored boundary, but at most `max_sleep` seconds so badges created
+    or edited by other workers are picked up.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        clock: Clock = system_clock,
+        max_sleep: float = settings.BADGE_SCHEDULER_MAX_SLEEP_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.clock = clock
+        self.max_sleep = max_sleep
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> float:
+        """Apply due boundaries; returns the number of seconds to wait before the next run."""
+        async with self.session_factory() as session:
+            service = BadgeValidityService(session, clock=self.clock)
+            counts = await service.sync()
+            if any(counts.values()):
+                logger.info("Badge validity sync: %s", counts)
+            boundary = await service.next_boundary()
+        if boundary is None:
+            return self.max_sleep
+        delay = (boundary - self.clock.now()).total_seconds()
+        # Never busy-loop on a boundary that is due but not yet visible
+        return min(self.max_sleep, max(delay, 1.0))
+
+    async def run(self) -> None:
+        while True:
+            try:
+                delay = await self.run_once()
+            except Exception:
+                logger.exception("Badge validity sync failed")
+                delay = self.max_sleep
+            await self.clock.sleep(delay)
+
+    def start(self) -> asyncio.Task:
+        self._task = asyncio.create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
@@ -1,14 +1,26 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 
+from sqlalchemy import func, or_
+from sqlalchemy.orm import joinedload, load_only, noload
 from sqlmodel import select, desc
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.fields import FieldSelection
+from app.core.tracing import traced
+from app.db.count import count_rows
 from app.models.company import Company
+from app.models.event import Event
+from app.models.member import Member
+from app.services.event_service import invalidate_event_caches
+from app.services.member_service import member_prefix_index
+from app.services.registration_service import RegistrationService
+from app.services.search_service import SearchIndexService
 from app.schemas.company import CompanyCreate, CompanyUpdate
 
 
+@traced
 class CompanyService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -20,18 +32,79 @@ class CompanyService:
         return company_row[0] if company_row else None
     
 
-    async def get_all(self) -> List[Company]:
-        stmt = select(Company).order_by(desc(Company.created_at))
+    async def get_detail(
+        self, company_id: UUID, recent_members: int = 5
+    ) -> Optional[Tuple[Company, int, int, List[Member]]]:
+        """
+        Company with its member count, upcoming event count (single events
+        not yet started plus series still running) and most recently joined
+        members. Counts come from one query; the collections are not loaded.
+        """
+        now = datetime.now(timezone.utc)
+        member_count = (
+            select(func.count())
+            .select_from(Member)
+            .where(Member.company_id == Company.id)
+            .scalar_subquery()
+        )
+        upcoming_event_count = (
+            select(func.count())
+            .select_from(Event)
+            .where(
+                Event.company_id == Company.id,
+                or_(
+                    Event.start_time >= now,
+                    (Event.recurrence_freq != None)
+                    & or_(Event.recurrence_end == None, Event.recurrence_end >= now),
+                ),
+            )
+            .scalar_subquery()
+        )
+        stmt = select(Company, member_count, upcoming_event_count).where(Company.id == company_id)
+        row = (await self.session.execute(stmt)).first()
+        if not row:
+            return None
+
+        members: List[Member] = []
+        if recent_members:
+            stmt = (
+                select(Member)
+                .where(Member.company_id == company_id)
+                .order_by(desc(Member.joined_at), Member.id)
+                .limit(recent_members)
+                .options(
+                    load_only(
+                        Member.first_name, Member.last_name, Member.user_name,
+                        Member.slug, Member.position,
+                    ),
+                    joinedload(Member.avatar),
+                    noload("*"),
+                )
+            )
+            members = list((await self.session.execute(stmt)).scalars().all())
+        return row[0], row[1], row[2], members
+
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, fields: Optional[FieldSelection] = None
+    ) -> List[Company]:
+        stmt = select(Company).order_by(desc(Company.created_at)).offset(skip).limit(limit)
+        if fields:
+            stmt = stmt.options(*fields.loader_options())
         result = await self.session.execute(stmt)
         companies = result.scalars().all()
         return companies
 
+    async def count_all(self) -> Tuple[int, bool]:
+        return await count_rows(self.session, select(Company))
+
     async def create(self, company_in: CompanyCreate) -> Company:
         data = company_in.model_dump()
         if data.get("website"):
             data["website"] = str(data["website"])  # Convert HttpUrl to string
         company = Company(**data)
         self.session.add(company)
+        await self.session.flush()
+        await SearchIndexService(self.session).index("company", [company.id])
         await self.session.commit()
         await self.session.refresh(company)
         return company
@@ -43,10 +116,21 @@ class CompanyService:
             setattr(company, key, value)
         company.updated_at = datetime.utcnow()
         self.session.add(company)
+        await self.session.flush()
+        await SearchIndexService(self.session).index("company", [company.id])
         await self.session.commit()
         await self.session.refresh(company)
         return company
 
     async def delete(self, company: Company) -> None:
+        result = await self.session.execute(select(Member.id).where(Member.company_id == company.id))
+        member_ids = list(result.scalars().all())
+        await SearchIndexService(self.session).remove_company(company.id)
+        # Registrations cascade with the members; free their seats first
+        await RegistrationService(self.session).release_members(member_ids)
         await self.session.delete(company)
         await self.session.commit()
+        # Members and events are deleted with the company
+        for member_id in member_ids:
+            member_prefix_index.discard(member_id)
+        invalidate_event_caches()
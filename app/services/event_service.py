@@ -1,14 +1,46 @@
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from uuid import UUID
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+import base64
 
+from fastapi import HTTPException
+from sqlalchemy import func, or_, tuple_
+from sqlalchemy.orm import noload
 from sqlmodel import select, desc
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.models.event import Event
-from app.schemas.event import EventCreate, EventUpdate
+from app.core.cache import create_cache
+from app.core.config import settings
+from app.core.fields import FieldSelection
+from app.core.recurrence import RecurrenceRule, as_utc
+from app.core.tracing import traced
+from app.models.event import Event, EventOccurrenceOverride
+from app.services.registration_service import RegistrationService
+from app.services.search_service import SearchIndexService
+from app.schemas.event import EventCreate, EventOccurrenceRead, EventOccurrenceUpdate, EventUpdate
 
+# Rendered listings and calendars for the windows most people look at (this
+# week, next month, ...). Cleared on every event write; the TTL bounds how
+# long other processes serve results from before a write.
+event_list_cache = create_cache("events.list", maxsize=256, ttl=settings.EVENT_CACHE_TTL)
+event_calendar_cache = create_cache("events.calendar", maxsize=64, ttl=settings.EVENT_CACHE_TTL)
 
+
+def invalidate_event_caches() -> None:
+    event_list_cache.clear()
+    event_calendar_cache.clear()
+
+
+def is_hot_window(start: Optional[datetime]) -> bool:
+    """Whether a window starting at `start` is near enough to today to be cached."""
+    if start is None:
+        return False
+    horizon = timedelta(days=settings.EVENT_CACHE_HORIZON_DAYS)
+    return abs(as_utc(start) - datetime.now(timezone.utc)) <= horizon
+
+
+@traced
 class EventService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -19,12 +51,280 @@ class EventService:
         event_row = result.first()
         return event_row[0] if event_row else None
 
-    async def get_all(self) -> List[Event]:
-        stmt = select(Event).order_by(desc(Event.start_time))
+    async def get_all(
+        self,
+        fields: Optional[FieldSelection] = None,
+        start_from: Optional[datetime] = None,
+        start_to: Optional[datetime] = None,
+        company_id: Optional[UUID] = None,
+        is_virtual: Optional[bool] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Event]:
+        """
+        List events, newest first. When a time window is given (`start_from`
+        and/or `start_to`, on start time) events are returned in chronological
+        order instead. Pages continue from `cursor` (see `next_cursor`).
+        """
+        windowed = start_from is not None or start_to is not None
+        start_from, start_to = as_utc(start_from), as_utc(start_to)
+        stmt = select(Event).where(*self._filters(company_id, is_virtual))
+        if start_from is not None:
+            stmt = stmt.where(Event.start_time >= start_from)
+        if start_to is not None:
+            stmt = stmt.where(Event.start_time < start_to)
+
+        position = tuple_(Event.start_time, Event.id)
+        if cursor:
+            after = tuple_(*self._decode_cursor(cursor))
+            stmt = stmt.where(position > after if windowed else position < after)
+        if windowed:
+            stmt = stmt.order_by(Event.start_time, Event.id)
+        else:
+            stmt = stmt.order_by(desc(Event.start_time), desc(Event.id))
+        if limit:
+            stmt = stmt.limit(limit)
+        if fields:
+            stmt = stmt.options(*fields.loader_options("start_time", "id"))
         result = await self.session.execute(stmt)
         events = result.scalars().all()
         return events
 
+    async def calendar(
+        self,
+        year: int,
+        month: int,
+        tz: str = "UTC",
+        company_id: Optional[UUID] = None,
+        is_virtual: Optional[bool] = None,
+    ) -> List[Tuple[date, int]]:
+        """
+        Number of events starting on each day of a month (in `tz`), days without
+        events omitted. Single events are counted in SQL; recurring series are
+        expanded for the month only.
+        """
+        zone = ZoneInfo(tz)
+        month_start = datetime(year, month, 1, tzinfo=zone)
+        month_end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=zone)
+        days = (
+            select(func.date(func.timezone(tz, Event.start_time)).label("day"))
+            .where(
+                Event.recurrence_freq == None,
+                Event.start_time >= month_start,
+                Event.start_time < month_end,
+                *self._filters(company_id, is_virtual),
+            )
+            .subquery()
+        )
+        stmt = (
+            select(days.c.day, func.count())
+            .group_by(days.c.day)
+            .order_by(days.c.day)
+        )
+        result = await self.session.execute(stmt)
+        counts: Dict[date, int] = {row[0]: row[1] for row in result.all()}
+
+        occurrences = await self.get_occurrences(
+            month_start, month_end, company_id=company_id, is_virtual=is_virtual, include_single=False
+        )
+        for occurrence in occurrences:
+            day = occurrence.start_time.astimezone(zone).date()
+            counts[day] = counts.get(day, 0) + 1
+        return sorted(counts.items())
+
+    async def get_occurrences(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        company_id: Optional[UUID] = None,
+        is_virtual: Optional[bool] = None,
+        include_single: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[EventOccurrenceRead]:
+        """
+        Occurrences starting in [window_start, window_end), in start order.
+
+        Recurring series are expanded lazily inside the window only, with
+        per-occurrence overrides applied and cancelled occurrences dropped;
+        single events contribute their one occurrence.
+        """
+        window_start, window_end = as_utc(window_start), as_utc(window_end)
+        filters = self._filters(company_id, is_virtual)
+        stmt = (
+            select(Event)
+            .where(
+                Event.recurrence_freq != None,
+                Event.start_time < window_end,
+                or_(Event.recurrence_end == None, Event.recurrence_end >= window_start),
+                *filters,
+            )
+            .options(noload("*"))
+        )
+        series = {event.id: event for event in (await self.session.execute(stmt)).scalars().all()}
+
+        # Overrides of occurrences generated in the window, and of occurrences
+        # from elsewhere in a series that were moved into it
+        stmt = select(EventOccurrenceOverride).where(
+            or_(
+                (EventOccurrenceOverride.event_id.in_(list(series)))
+                & (EventOccurrenceOverride.occurrence_start >= window_start)
+                & (EventOccurrenceOverride.occurrence_start < window_end),
+                (EventOccurrenceOverride.start_time >= window_start)
+                & (EventOccurrenceOverride.start_time < window_end),
+            )
+        )
+        overrides = {
+            (override.event_id, override.occurrence_start): override
+            for override in (await self.session.execute(stmt)).scalars().all()
+        }
+        missing = {event_id for event_id, _ in overrides} - set(series)
+        if missing:
+            stmt = (
+                select(Event)
+                .where(Event.id.in_(missing), Event.recurrence_freq != None, *filters)
+                .options(noload("*"))
+            )
+            series.update({event.id: event for event in (await self.session.execute(stmt)).scalars().all()})
+
+        occurrences: List[EventOccurrenceRead] = []
+        for event in series.values():
+            rule = self._rule(event)
+            for start in rule.between(window_start, window_end):
+                occurrence = self._occurrence(event, start, overrides.pop((event.id, start), None))
+                if occurrence and window_start <= occurrence.start_time < window_end:
+                    occurrences.append(occurrence)
+        for (event_id, start), override in overrides.items():
+            event = series.get(event_id)
+            if event is None or not self._rule(event).contains(start):
+                continue
+            occurrence = self._occurrence(event, start, override)
+            if occurrence and window_start <= occurrence.start_time < window_end:
+                occurrences.append(occurrence)
+
+        if include_single:
+            stmt = (
+                select(Event)
+                .where(
+                    Event.recurrence_freq == None,
+                    Event.start_time >= window_start,
+                    Event.start_time < window_end,
+                    *filters,
+                )
+                .options(noload("*"))
+            )
+            for event in (await self.session.execute(stmt)).scalars().all():
+                occurrences.append(self._occurrence(event, event.start_time, None))
+
+        occurrences.sort(key=lambda occurrence: (occurrence.start_time, str(occurrence.event_id)))
+        return occurrences[:limit] if limit else occurrences
+
+    async def update_occurrence(
+        self,
+        event: Event,
+        occurrence_start: datetime,
+        occurrence_in: EventOccurrenceUpdate,
+    ) -> Optional[EventOccurrenceRead]:
+        """
+        Change or cancel one occurrence of a recurring event. Returns the
+        resulting occurrence, or None when it is cancelled.
+        """
+        occurrence_start = as_utc(occurrence_start)
+        if not event.recurrence_freq or not self._rule(event).contains(occurrence_start):
+            raise HTTPException(status_code=404, detail="Occurrence not found")
+
+        stmt = select(EventOccurrenceOverride).where(
+            EventOccurrenceOverride.event_id == event.id,
+            EventOccurrenceOverride.occurrence_start == occurrence_start,
+        )
+        override_row = (await self.session.execute(stmt)).first()
+        override = override_row[0] if override_row else EventOccurrenceOverride(
+            event_id=event.id, occurrence_start=occurrence_start
+        )
+        for key, value in occurrence_in.model_dump(exclude_unset=True).items():
+            setattr(override, key, value)
+        override.updated_at = datetime.utcnow()
+        self.session.add(override)
+        await self.session.commit()
+        invalidate_event_caches()
+        await self.session.refresh(override)
+        return self._occurrence(event, occurrence_start, override)
+
+    @staticmethod
+    def _rule(event: Event) -> RecurrenceRule:
+        return RecurrenceRule(
+            event.start_time,
+            event.recurrence_freq,
+            interval=event.recurrence_interval,
+            until=event.recurrence_until,
+            count=event.recurrence_count,
+            tz=event.recurrence_timezone,
+        )
+
+    @staticmethod
+    def _occurrence(
+        event: Event, start: datetime, override: Optional[EventOccurrenceOverride]
+    ) -> Optional[EventOccurrenceRead]:
+        if override and override.is_cancelled:
+            return None
+        occurrence = EventOccurrenceRead(
+            event_id=event.id,
+            occurrence_start=start,
+            title=event.title,
+            description=event.description,
+            location=event.location,
+            start_time=start,
+            end_time=start + (event.end_time - event.start_time),
+            is_virtual=event.is_virtual,
+            company_id=event.company_id,
+            is_recurring=event.recurrence_freq is not None,
+        )
+        if override:
+            for key in ("title", "description", "location", "start_time", "end_time"):
+                value = getattr(override, key)
+                if value is not None:
+                    setattr(occurrence, key, value)
+            occurrence.is_modified = True
+        return occurrence
+
+    @staticmethod
+    def _apply_recurrence(event: Event) -> None:
+        """Validate the recurrence rule and store where the series ends."""
+        if not event.recurrence_freq:
+            event.recurrence_end = None
+            return
+        if event.recurrence_until is not None and event.recurrence_until < event.start_time:
+            raise HTTPException(status_code=400, detail="recurrence_until is before start_time")
+        try:
+            event.recurrence_end = EventService._rule(event).last()
+        except (ValueError, ZoneInfoNotFoundError):
+            raise HTTPException(status_code=400, detail="Invalid recurrence rule or time zone")
+
+    @staticmethod
+    def next_cursor(events: List[Event], limit: Optional[int]) -> Optional[str]:
+        """Cursor for the page after `events`, or None when it was the last page."""
+        if not limit or len(events) < limit:
+            return None
+        last = events[-1]
+        raw = f"{last.start_time.isoformat()}|{last.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+        try:
+            start_time, event_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+            return datetime.fromisoformat(start_time), UUID(event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    @staticmethod
+    def _filters(company_id: Optional[UUID], is_virtual: Optional[bool]) -> list:
+        filters = []
+        if company_id is not None:
+            filters.append(Event.company_id == company_id)
+        if is_virtual is not None:
+            filters.append(Event.is_virtual == is_virtual)
+        return filters
+
     async def create(self, event_in: EventCreate) -> Event:
         data = event_in.model_dump()
         if data.get("cover_image_url"):
@@ -32,8 +332,14 @@ class EventService:
         if data.get("registration_link"):
             data["registration_link"] = str(data["registration_link"])
         event = Event(**data)
+        event.start_time, event.end_time = as_utc(event.start_time), as_utc(event.end_time)
+        event.recurrence_until = as_utc(event.recurrence_until)
+        self._apply_recurrence(event)
         self.session.add(event)
+        await self.session.flush()
+        await SearchIndexService(self.session).index("event", [event.id])
         await self.session.commit()
+        invalidate_event_caches()
         await self.session.refresh(event)
         return event
 
@@ -47,12 +353,23 @@ class EventService:
         
         for key, value in event_data.items():
             setattr(event, key, value)
+        event.start_time, event.end_time = as_utc(event.start_time), as_utc(event.end_time)
+        event.recurrence_until = as_utc(event.recurrence_until)
+        self._apply_recurrence(event)
         event.updated_at = datetime.utcnow()
         self.session.add(event)
+        await self.session.flush()
+        await SearchIndexService(self.session).index("event", [event.id])
+        if "capacity" in event_data:
+            # Extra seats go to the waitlist first
+            await RegistrationService(self.session).promote_waitlisted(event.id)
         await self.session.commit()
+        invalidate_event_caches()
         await self.session.refresh(event)
         return event
 
     async def delete(self, event: Event) -> None:
+        await SearchIndexService(self.session).remove("event", [event.id])
         await self.session.delete(event)
         await self.session.commit()
+        invalidate_event_caches()
@@ -0,0 +1,68 @@
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy.sql import ColumnElement
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.tracing import traced
+from app.models.badge import Badge, MemberBadge
+from app.models.follower import Follower
+from app.models.member import Member
+from app.schemas.exports import ExportEntityType
+
+
+def _table_columns(model: type) -> List[ColumnElement]:
+    return [column for column in model.__table__.columns if column.computed is None]
+
+
+# entity -> (resume key, exported columns, FROM clause joins)
+EXPORTS: Dict[str, Tuple[ColumnElement, List[ColumnElement], list]] = {
+    "members": (Member.id, _table_columns(Member), []),
+    "followers": (Follower.id, _table_columns(Follower), []),
+    "badges": (
+        MemberBadge.id,
+        _table_columns(MemberBadge) + [Badge.name.label("badge_name")],
+        [(Badge, Badge.id == MemberBadge.badge_id)],
+    ),
+}
+
+
+@traced
+class ExportService:
+    """
+    Streams whole tables for bulk exports.
+
+    Rows are read as plain tuples through a server-side cursor in key order,
+    so memory stays constant whatever the table size. The export runs in a
+    read-only REPEATABLE READ transaction and sees a single snapshot; an
+    interrupted export resumes after the last key received (in a new snapshot).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def columns(entity_type: ExportEntityType) -> Tuple[List[str], List[type]]:
+        """Names and Python types of the exported columns."""
+        _, columns, _ = EXPORTS[entity_type]
+        return [column.key for column in columns], [column.type.python_type for column in columns]
+
+    async def stream(
+        self, entity_type: ExportEntityType, after: Optional[UUID] = None, batch_size: int = 2000
+    ) -> AsyncIterator[Sequence[tuple]]:
+        """Yield batches of rows ordered by key, starting after `after`."""
+        key, columns, joins = EXPORTS[entity_type]
+        # Must be the first statement of the transaction to take effect
+        await self.session.connection(
+            execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+        )
+        stmt = select(*columns).order_by(key)
+        for target, onclause in joins:
+            stmt = stmt.join(target, onclause)
+        if after is not None:
+            stmt = stmt.where(key > after)
+
+        result = await self.session.stream(stmt.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield [tuple(row) for row in partition]
@@ -0,0 +1,275 @@
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from typing import AsyncIterator, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+
+import asyncpg
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import or_, text
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.tracing import traced
+from app.models.company import Company
+from app.models.image import Image
+from app.models.member import Member
+from app.schemas.company import CompanyCreate
+from app.schemas.imports import ImportEntityType, ImportFormat, ImportProgress, ImportRowError
+from app.schemas.member import MemberCreate
+from app.services.member_service import MemberService
+from app.services.search_service import SearchIndexService
+
+# entity type -> (model, schema rows are validated with)
+ENTITIES = {
+    "member": (Member, MemberCreate),
+    "company": (Company, CompanyCreate),
+}
+# Unique columns checked set-wise per chunk, with the message of the single-row endpoints
+UNIQUE_FIELDS = {
+    "member": {
+        "user_name": "Username already taken",
+        "slug": "Slug already exists",
+        "wallet_key": "Wallet key already registered",
+    },
+    "company": {"name": "Company name already exists"},
+}
+# Foreign keys checked set-wise per chunk: field -> (referenced model, message)
+REFERENCES = {
+    "member": {
+        "company_id": (Company, "Company not found"),
+        "avatar_id": (Image, "Avatar image not found"),
+        "cover_image_id": (Image, "Cover image not found"),
+    },
+    "company": {},
+}
+
+# (data row number, parsed fields, parse error)
+_Row = Tuple[int, Optional[dict], Optional[str]]
+
+
+def read_rows(fmt: ImportFormat, stream: BinaryIO) -> Iterator[_Row]:
+    """
+    Parse a CSV (with a header row) or NDJSON upload one row at a time.
+    Empty CSV cells are left out so schema defaults apply.
+    """
+    text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        for number, row in enumerate(csv.DictReader(text_stream), 1):
+            if None in row:
+                yield number, None, "More values than header columns"
+                continue
+            yield number, {key: value for key, value in row.items() if value not in ("", None)}, None
+        return
+
+    for number, line in enumerate(text_stream, 1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield number, None, "Invalid JSON"
+            continue
+        if not isinstance(data, dict):
+            yield number, None, "Expected a JSON object"
+            continue
+        yield number, data, None
+
+
+def _validation_messages(exc: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+@traced
+class ImportService:
+    """
+    Bulk member and company imports.
+
+    Rows are read in chunks. Each chunk is validated with the create schema,
+    checked against the unique columns and foreign keys with one query per
+    column set, copied into a temporary staging table with COPY and moved
+    over with a single INSERT ... SELECT. Every chunk is its own transaction,
+    so rows of earlier chunks stay imported when a later chunk fails.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def run(
+        self, entity_type: ImportEntityType, fmt: ImportFormat, stream: BinaryIO, chunk_size: int
+    ) -> AsyncIterator[ImportProgress]:
+        """Import every row of `stream`, yielding progress after each chunk and at the end."""
+        rows = inserted = failed = 0
+        seen: Dict[str, Set[object]] = {field: set() for field in UNIQUE_FIELDS[entity_type]}
+        parser = read_rows(fmt, stream)
+        finished = False
+        while not finished:
+            chunk: List[_Row] = []
+            parse_error: Optional[ImportRowError] = None
+            try:
+                for row in parser:
+                    chunk.append(row)
+                    if len(chunk) >= chunk_size:
+                        break
+                else:
+                    finished = True
+            except (UnicodeDecodeError, csv.Error) as exc:
+                # The rest of the upload cannot be read reliably
+                parse_error = ImportRowError(row=rows + len(chunk) + 1, errors=[f"Unreadable input: {exc}"])
+                finished = True
+            if not chunk and parse_error is None:
+                break
+
+            errors, chunk_inserted = await self._import_chunk(entity_type, chunk, seen)
+            if parse_error:
+                errors.append(parse_error)
+            rows += len(chunk)
+            inserted += chunk_inserted
+            failed += len(chunk) - chunk_inserted
+            yield ImportProgress(rows=rows, inserted=inserted, failed=failed, errors=errors)
+        yield ImportProgress(rows=rows, inserted=inserted, failed=failed, done=True)
+
+    async def _import_chunk(
+        self, entity_type: ImportEntityType, chunk: List[_Row], seen: Dict[str, Set[object]]
+    ) -> Tuple[List[ImportRowError], int]:
+        model, schema = ENTITIES[entity_type]
+        errors: Dict[int, List[str]] = {}
+        valid: List[Tuple[int, BaseModel]] = []
+        for number, data, parse_error in chunk:
+            if parse_error:
+                errors[number] = [parse_error]
+                continue
+            try:
+                obj = schema.model_validate(data)
+            except ValidationError as exc:
+                errors[number] = _validation_messages(exc)
+                continue
+            if entity_type == "member" and obj.email is None:
+                # Optional in the schema but required by the table
+                errors[number] = ["email: Field required"]
+                continue
+            valid.append((number, obj))
+
+        taken = await self._existing_values(model, UNIQUE_FIELDS[entity_type], [obj for _, obj in valid])
+        missing = await self._missing_references(REFERENCES[entity_type], [obj for _, obj in valid])
+        records: List[Tuple[int, SQLModel]] = []
+        for number, obj in valid:
+            row_errors = [
+                message
+                for field, message in UNIQUE_FIELDS[entity_type].items()
+                if getattr(obj, field) in taken[field] or getattr(obj, field) in seen[field]
+            ]
+            row_errors += [
+                message
+                for field, (_, message) in REFERENCES[entity_type].items()
+                if getattr(obj, field) in missing[field]
+            ]
+            if row_errors:
+                errors[number] = row_errors
+                continue
+            for field in seen:
+                seen[field].add(getattr(obj, field))
+            records.append((number, self._build(entity_type, obj)))
+
+        inserted: List[SQLModel] = []
+        if records:
+            try:
+                inserted_ids = await self._load(model, [record for _, record in records])
+                await SearchIndexService(self.session).index(entity_type, inserted_ids)
+                await self.session.commit()
+            except (DBAPIError, asyncpg.PostgresError) as exc:
+                await self.session.rollback()
+                message = f"Chunk rejected by the database: {getattr(exc, 'orig', exc)}"
+                for number, _ in records:
+                    errors[number] = [message]
+            else:
+                for number, record in records:
+                    if record.id in inserted_ids:
+                        inserted.append(record)
+                    else:
+                        # Taken by a concurrent write after the uniqueness check
+                        errors[number] = [f"Conflicts with an existing {entity_type}"]
+
+        if entity_type == "member":
+            for member in inserted:
+                MemberService._sync_prefix_index(member)
+        return [ImportRowError(row=number, errors=messages) for number, messages in sorted(errors.items())], len(inserted)
+
+    async def _existing_values(
+        self, model: type, fields: Dict[str, str], objs: List[BaseModel]
+    ) -> Dict[str, Set[object]]:
+        """Values of the unique `fields` among `objs` that are already stored."""
+        taken: Dict[str, Set[object]] = {field: set() for field in fields}
+        if not objs:
+            return taken
+        columns = [getattr(model, field) for field in fields]
+        stmt = select(*columns).where(
+            or_(*(column.in_(list({getattr(obj, field) for obj in objs})) for field, column in zip(fields, columns)))
+        )
+        for row in (await self.session.execute(stmt)).all():
+            for field, value in zip(fields, row):
+                taken[field].add(value)
+        return taken
+
+    async def _missing_references(
+        self, references: Dict[str, Tuple[type, str]], objs: List[BaseModel]
+    ) -> Dict[str, Set[UUID]]:
+        """Referenced ids among `objs` that do not exist."""
+        missing: Dict[str, Set[UUID]] = {}
+        for field, (model, _) in references.items():
+            ids = {getattr(obj, field) for obj in objs} - {None}
+            if ids:
+                result = await self.session.execute(select(model.id).where(model.id.in_(list(ids))))
+                ids -= set(result.scalars().all())
+            missing[field] = ids
+        return missing
+
+    @staticmethod
+    def _build(entity_type: ImportEntityType, obj: BaseModel) -> SQLModel:
+        now = datetime.now(timezone.utc)
+        if entity_type == "member":
+            record = Member(**obj.model_dump())
+            if not record.joined_at:
+                record.joined_at = now
+        else:
+            data = obj.model_dump()
+            if data.get("website"):
+                data["website"] = str(data["website"])  # Convert HttpUrl to string
+            record = Company(**data)
+        record.id = uuid4()
+        record.created_at = now
+        record.updated_at = now
+        return record
+
+    async def _load(self, model: type, records: List[SQLModel]) -> Set[UUID]:
+        """
+        COPY `records` into a staging table and insert them in one statement.
+        Returns the ids actually inserted; rows hitting a unique constraint
+        taken since the check are skipped.
+        """
+        table = model.__table__
+        columns = [column.name for column in table.columns if column.computed is None]
+        staging = f"import_{table.name}"
+        await self.session.execute(
+            text(f"CREATE TEMP TABLE {staging} (LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP")
+        )
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging,
+            records=[tuple(getattr(record, column) for column in columns) for record in records],
+            columns=columns,
+        )
+        column_list = ", ".join(columns)
+        result = await self.session.execute(
+            text(
+                f"INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {staging} "
+                "ON CONFLICT DO NOTHING RETURNING id"
+            )
+        )
+        return set(result.scalars().all())
@@ -1,18 +1,70 @@
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import or_
+import asyncio
+import base64
+import logging
+from sqlalchemy import and_, func, literal_column, or_
+from sqlalchemy.orm import joinedload, load_only, noload
 from sqlmodel import select, desc
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException
 
+from app.core.config import settings
+from app.core.fields import FieldSelection
+from app.core.prefix_index import PrefixIndex
+from app.core.tracing import traced
+from app.db.count import count_rows
+from app.db.session import async_session
 from app.models.member import Member
 from app.models.social_link import SocialLink
 from app.models.external_link import ExternalLink
 from app.models.follower import Follower
-from app.schemas.member import MemberCreate, MemberUpdate
+from app.schemas.member import MemberCreate, MemberUpdate, MemberSuggestion
+from app.services.registration_service import RegistrationService
+from app.services.search_service import SearchIndexService
+
+# Per-process autocomplete index over user names and slugs; payloads are
+# tuples in SUGGESTION_COLUMNS order to keep the footprint small
+SUGGESTION_COLUMNS = (Member.id, Member.user_name, Member.slug, Member.first_name, Member.last_name)
+member_prefix_index = PrefixIndex(
+    "members",
+    max_entries=settings.AUTOCOMPLETE_MAX_ENTRIES,
+    refresh_seconds=settings.AUTOCOMPLETE_REFRESH_SECONDS,
+)
+_prefix_index_lock = asyncio.Lock()
+# Background refreshes, referenced until done so they are not garbage collected
+_prefix_index_refreshes: Set[asyncio.Task] = set()
+
+logger = logging.getLogger(__name__)
+
+
+async def _load_prefix_index(session: AsyncSession) -> None:
+    async with _prefix_index_lock:
+        if not member_prefix_index.stale:
+            return
+        stmt = select(*SUGGESTION_COLUMNS).where(Member.is_active == True)
+        rows = (await session.execute(stmt)).all()
+        # Normalizing and sorting every key would stall the event loop
+        built = await asyncio.to_thread(
+            member_prefix_index.build, ((row[0], (row[1], row[2]), tuple(row)) for row in rows)
+        )
+        if not member_prefix_index.install(built):
+            logger.warning(
+                "Member autocomplete index disabled: over AUTOCOMPLETE_MAX_ENTRIES (%s)",
+                member_prefix_index.max_entries,
+            )
+
+
+async def _refresh_prefix_index() -> None:
+    try:
+        async with async_session() as session:
+            await _load_prefix_index(session)
+    except Exception:
+        logger.exception("Refreshing the member autocomplete index failed")
 
 
+@traced
 class MemberService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -23,12 +75,158 @@ class MemberService:
         member_row = result.first()
         return member_row[0] if member_row else None
 
-    async def get_all(self, skip: int = 0, limit: int = 100) -> List[Member]:
+    async def get_all(
+        self, skip: int = 0, limit: int = 100, fields: Optional[FieldSelection] = None
+    ) -> List[Member]:
         stmt = select(Member).order_by(desc(Member.created_at)).offset(skip).limit(limit)
+        if fields:
+            stmt = stmt.options(*fields.loader_options())
         result = await self.session.execute(stmt)
         members = result.scalars().all()
         return list(members)
 
+    async def count_all(self) -> Tuple[int, bool]:
+        return await count_rows(self.session, select(Member))
+
+    async def search(
+        self, query: str, limit: int = 20, cursor: Optional[str] = None
+    ) -> Tuple[List[Tuple[Member, float]], Optional[str]]:
+        """
+        Rank active members against a free text query.
+
+        Matches the weighted search_vector (names, user name, position, bio)
+        and, for typo tolerance, trigram similarity on user name and full name.
+        Results are ordered by rank and paged with an opaque keyset cursor.
+        At most the MEMBER_SEARCH_CANDIDATES best matches are ranked per query.
+        """
+        search_vector = Member.__table__.c.search_vector
+        # Must match the expression of ix_members_full_name_trgm
+        full_name = literal_column("(members.first_name || ' ' || members.last_name)")
+        ts_query = func.websearch_to_tsquery("simple", query)
+        similarity = func.greatest(func.similarity(Member.user_name, query), func.similarity(full_name, query))
+        rank = (func.ts_rank_cd(search_vector, ts_query) + similarity).label("rank")
+
+        # Very common terms match tens of thousands of rows; ranking all of
+        # them dominates latency, so only a bounded candidate set is ranked.
+        # The candidates are the best by a cheaper score (ts_rank skips the
+        # cover density pass) so every page of a query ranks the same set.
+        candidates = (
+            select(Member.id)
+            .where(
+                Member.is_active == True,
+                or_(
+                    search_vector.op("@@")(ts_query),
+                    Member.user_name.op("%")(query),
+                    full_name.op("%")(query),
+                ),
+            )
+            .order_by((func.ts_rank(search_vector, ts_query) + similarity).desc(), Member.id)
+            .limit(settings.MEMBER_SEARCH_CANDIDATES)
+            .scalar_subquery()
+        )
+
+        stmt = (
+            select(Member, rank)
+            .where(Member.id.in_(candidates))
+            .options(
+                load_only(
+                    Member.first_name, Member.last_name, Member.user_name,
+                    Member.slug, Member.position,
+                ),
+                joinedload(Member.avatar),
+                noload("*"),
+            )
+            .order_by(rank.desc(), Member.id)
+            .limit(limit + 1)
+        )
+        if cursor:
+            last_rank, last_id = self._decode_search_cursor(cursor)
+            stmt = stmt.where(
+                or_(rank < last_rank, and_(rank == last_rank, Member.id > last_id))
+            )
+
+        result = await self.session.execute(stmt)
+        rows = [(row[0], row[1]) for row in result.all()]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last_member, last_rank = rows[-1]
+            next_cursor = self._encode_search_cursor(last_rank, last_member.id)
+        return rows, next_cursor
+
+    async def autocomplete(self, prefix: str, limit: int = 10) -> List[MemberSuggestion]:
+        """
+        Active members whose user name or slug starts with `prefix`.
+
+        Served from the in-memory index when it is enabled and fits its budget,
+        otherwise from an indexed `lower(...) LIKE 'prefix%'` scan.
+        """
+        if settings.AUTOCOMPLETE_INDEX_ENABLED:
+            await self._ensure_prefix_index()
+            if member_prefix_index.ready:
+                rows = member_prefix_index.search(prefix, limit)
+                return [self._suggestion(row) for row in rows]
+
+        pattern = prefix.lower()
+        stmt = (
+            select(*SUGGESTION_COLUMNS)
+            .where(
+                Member.is_active == True,
+                or_(
+                    func.lower(Member.user_name).startswith(pattern, autoescape=True),
+                    func.lower(Member.slug).startswith(pattern, autoescape=True),
+                ),
+            )
+            .order_by(func.lower(Member.user_name))
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [self._suggestion(row) for row in result.all()]
+
+    async def prepare_autocomplete(self) -> None:
+        """Load the in-memory prefix index now instead of on the first autocomplete."""
+        if settings.AUTOCOMPLETE_INDEX_ENABLED:
+            await self._ensure_prefix_index()
+
+    async def _ensure_prefix_index(self) -> None:
+        if not member_prefix_index.stale or _prefix_index_lock.locked() or _prefix_index_refreshes:
+            # Fresh, disabled or being loaded: use the snapshot or fall back to SQL
+            return
+        if member_prefix_index.ready:
+            # Refresh in the background and keep serving the previous snapshot
+            task = asyncio.create_task(_refresh_prefix_index())
+            _prefix_index_refreshes.add(task)
+            task.add_done_callback(_prefix_index_refreshes.discard)
+            return
+        await _load_prefix_index(self.session)
+
+    @staticmethod
+    def _sync_prefix_index(member: Member) -> None:
+        if member.is_active:
+            member_prefix_index.upsert(
+                member.id,
+                (member.user_name, member.slug),
+                tuple(getattr(member, column.key) for column in SUGGESTION_COLUMNS),
+            )
+        else:
+            member_prefix_index.discard(member.id)
+
+    @staticmethod
+    def _suggestion(row: tuple) -> MemberSuggestion:
+        return MemberSuggestion(**dict(zip([column.key for column in SUGGESTION_COLUMNS], row)))
+
+    @staticmethod
+    def _encode_search_cursor(rank: float, member_id: UUID) -> str:
+        return base64.urlsafe_b64encode(f"{rank!r}:{member_id}".encode()).decode()
+
+    @staticmethod
+    def _decode_search_cursor(cursor: str) -> Tuple[float, UUID]:
+        try:
+            rank, member_id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+            return float(rank), UUID(member_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     async def get_by_email(self, email: str) -> Optional[Member]:
         stmt = select(Member).where(Member.email == email)
         result = await self.session.execute(stmt)
@@ -68,8 +266,11 @@ class MemberService:
             member.joined_at = datetime.utcnow()
 
         self.session.add(member)
+        await self.session.flush()
+        await SearchIndexService(self.session).index("member", [member.id])
         await self.session.commit()
         await self.session.refresh(member)
+        self._sync_prefix_index(member)
         return member
 
     async def update(self, member: Member, member_in: MemberUpdate) -> Member:
@@ -89,13 +290,21 @@ class MemberService:
         
         member.updated_at = datetime.utcnow()
         self.session.add(member)
+        await self.session.flush()
+        await SearchIndexService(self.session).index("member", [member.id])
         await self.session.commit()
         await self.session.refresh(member)
+        self._sync_prefix_index(member)
         return member
 
     async def delete(self, member: Member) -> None:
+        member_id = member.id
+        await SearchIndexService(self.session).remove("member", [member_id])
+        # Registrations cascade with the member; free their seats first
+        await RegistrationService(self.session).release_members([member_id])
         await self.session.delete(member)
         await self.session.commit()
+        member_prefix_index.discard(member_id)
 
     async def get_by_company(self, company_id: UUID, skip: int = 0, limit: int = 100) -> List[Member]:
         stmt = select(Member).where(Member.company_id == company_id).offset(skip).limit(limit)
@@ -103,6 +312,10 @@ class MemberService:
         members = result.scalars().all()
         return list(members)
 
+    async def count_by_company(self, company_id: UUID) -> Tuple[int, bool]:
+        stmt = select(Member).where(Member.company_id == company_id)
+        return await count_rows(self.session, stmt)
+
     async def add_social_link(self, member_id: UUID, title: str, link: str, icon: str) -> SocialLink:
         member = await self.get(member_id)
         if not member:
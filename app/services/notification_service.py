@@ -1,13 +1,17 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 from sqlmodel import select, desc
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException
 
+from app.core.fields import FieldSelection
+from app.core.tracing import traced
+from app.db.count import count_rows
 from app.models.notification import Notification
 from app.schemas.notification import NotificationCreate, NotificationUpdate
 
+@traced
 class NotificationService:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -24,17 +28,12 @@ class NotificationService:
         limit: int = 100,
         active_only: bool = False,
         type: Optional[str] = None,
-        priority: Optional[str] = None
+        priority: Optional[str] = None,
+        fields: Optional[FieldSelection] = None
     ) -> List[Notification]:
-        query = select(Notification).order_by(desc(Notification.created_at))
-        
-        # Apply filters
-        if active_only:
-            query = query.where(Notification.is_active == True)
-        if type:
-            query = query.where(Notification.type == type)
-        if priority:
-            query = query.where(Notification.priority == priority)
+        query = self._list_query(active_only=active_only, type=type, priority=priority)
+        if fields:
+            query = query.options(*fields.loader_options())
         
         # Apply pagination
         query = query.offset(skip).limit(limit)
@@ -80,9 +79,56 @@ class NotificationService:
         skip: int = 0,
         limit: int = 100,
         type: Optional[str] = None,
-        priority: Optional[str] = None
+        priority: Optional[str] = None,
+        fields: Optional[FieldSelection] = None
     ) -> List[Notification]:
         """Get active notifications that haven't expired."""
+        query = self._active_query(type=type, priority=priority)
+        if fields:
+            query = query.options(*fields.loader_options())
+        
+        # Apply pagination
+        query = query.offset(skip).limit(limit)
+        
+        result = await self.session.execute(query)
+        notifications = result.scalars().all()
+        return list(notifications)
+
+    async def count_all(
+        self,
+        active_only: bool = False,
+        type: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> Tuple[int, bool]:
+        query = self._list_query(active_only=active_only, type=type, priority=priority)
+        return await count_rows(self.session, query)
+
+    async def count_active_notifications(
+        self,
+        type: Optional[str] = None,
+        priority: Optional[str] = None
+    ) -> Tuple[int, bool]:
+        query = self._active_query(type=type, priority=priority)
+        return await count_rows(self.session, query)
+
+    def _list_query(
+        self,
+        active_only: bool = False,
+        type: Optional[str] = None,
+        priority: Optional[str] = None
+    ):
+        query = select(Notification).order_by(desc(Notification.created_at))
+        
+        # Apply filters
+        if active_only:
+            query = query.where(Notification.is_active == True)
+        if type:
+            query = query.where(Notification.type == type)
+        if priority:
+            query = query.where(Notification.priority == priority)
+        return query
+
+    def _active_query(self, type: Optional[str] = None, priority: Optional[str] = None):
         query = select(Notification).where(
             Notification.is_active == True,
             (Notification.expires_at.is_(None) | (Notification.expires_at > datetime.utcnow()))
@@ -93,10 +139,4 @@ class NotificationService:
             query = query.where(Notification.type == type)
         if priority:
             query = query.where(Notification.priority == priority)
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        result = await self.session.execute(query)
-        notifications = result.scalars().all()
-        return list(notifications) 
\ No newline at end of file
+        return query
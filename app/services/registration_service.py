@@ -0,0 +1,243 @@
+from typing import Optional, List, Sequence, Tuple
+from uuid import UUID, uuid4
+from datetime import datetime, timezone
+
+from fastapi import HTTPException
+from sqlalchemy import case, exists, func, or_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.tracing import traced
+from app.db.count import count_rows
+from app.models.event import Event
+from app.models.event_registration import CANCELLED, REGISTERED, WAITLISTED, EventRegistration
+
+
+@traced
+class RegistrationService:
+    """
+    Event registrations with capacity enforcement.
+
+    Seats are taken with a conditional `UPDATE events SET registered_count =
+    registered_count + 1 WHERE registered_count < capacity`, so concurrent
+    registrations queue on the event row instead of reading a count and
+    racing to insert. The unique (event_id, member_id) constraint makes
+    retries return the existing registration.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def register(self, event_id: UUID, member_id: Optional[UUID]) -> Tuple[EventRegistration, bool]:
+        """
+        Register a member, or put them on the waitlist when the event is full.
+        Returns (registration, created); created is False for a repeated request.
+        """
+        if member_id is None:
+            raise HTTPException(status_code=403, detail="Only members can register for events")
+        stmt = select(
+            Event.start_time, Event.end_time, Event.recurrence_freq, Event.recurrence_end
+        ).where(Event.id == event_id)
+        event = (await self.session.execute(stmt)).first()
+        if event is None:
+            raise HTTPException(status_code=404, detail="Event not found")
+        now = datetime.now(timezone.utc)
+        ends_at = self._ends_at(*event)
+        if ends_at is not None and ends_at < now:
+            raise HTTPException(status_code=400, detail="Event has ended")
+
+        # Claim the (event, member) pair first: a retry, or a duplicate request
+        # racing this one, waits on the unique index and then finds it taken
+        claim = (
+            insert(EventRegistration.__table__)
+            .values(
+                id=uuid4(), event_id=event_id, member_id=member_id,
+                status=WAITLISTED, created_at=now, updated_at=now,
+            )
+            .on_conflict_do_nothing(constraint="uq_event_registrations_event_member")
+            .returning(EventRegistration.__table__.c.id)
+        )
+        registration_id = (await self.session.execute(claim)).scalar_one_or_none()
+        values = {}
+        if registration_id is None:
+            existing = await self._get(event_id, member_id, for_update=True)
+            if existing.status != CANCELLED:
+                await self.session.commit()
+                return existing, False
+            # Registering again after cancelling joins the back of the queue
+            registration_id = existing.id
+            values["created_at"] = now
+
+        # Take a seat and record the outcome in one statement, so the event row
+        # stays locked only until the commit that follows
+        seat = self._take_seat(event_id).cte("seat")
+        stmt = (
+            update(EventRegistration)
+            .where(EventRegistration.id == registration_id)
+            .values(
+                status=case((exists(select(seat.c.id)), REGISTERED), else_=WAITLISTED),
+                updated_at=now,
+                **values,
+            )
+            .add_cte(seat)
+            .returning(EventRegistration)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        registration = (await self.session.execute(stmt)).scalar_one()
+        await self.session.commit()
+        return registration, True
+
+    async def cancel(self, event_id: UUID, member_id: UUID) -> None:
+        """Cancel a registration; a freed seat goes to the oldest waitlisted member."""
+        registration = await self._get(event_id, member_id, for_update=True)
+        if not registration or registration.status == CANCELLED:
+            raise HTTPException(status_code=404, detail="Registration not found")
+
+        was_registered = registration.status == REGISTERED
+        registration.status = CANCELLED
+        registration.updated_at = datetime.now(timezone.utc)
+        self.session.add(registration)
+        await self.session.flush()
+        if was_registered:
+            await self.session.execute(
+                update(Event)
+                .where(Event.id == event_id)
+                .values(
+                    registered_count=Event.registered_count - 1,
+                    updated_at=Event.updated_at,
+                )
+            )
+            await self.promote_waitlisted(event_id, limit=1)
+        await self.session.commit()
+
+    async def release_members(self, member_ids: Sequence[UUID]) -> None:
+        """
+        Give up the seats of members that are about to be deleted, and offer
+        them to the waitlists. Runs inside the caller's transaction; the
+        registrations themselves go with the members (ON DELETE CASCADE).
+        """
+        if not member_ids:
+            return
+        released = (
+            update(EventRegistration)
+            .where(EventRegistration.member_id.in_(member_ids), EventRegistration.status == REGISTERED)
+            .values(status=CANCELLED, updated_at=datetime.now(timezone.utc))
+            .returning(EventRegistration.event_id)
+            .cte("released")
+        )
+        per_event = (
+            select(released.c.event_id, func.count().label("seats"))
+            .group_by(released.c.event_id)
+            .subquery()
+        )
+        counted = (
+            update(Event)
+            .where(Event.id == per_event.c.event_id)
+            .values(registered_count=Event.registered_count - per_event.c.seats, updated_at=Event.updated_at)
+            .returning(Event.id, per_event.c.seats)
+            .cte("counted")
+        )
+        result = await self.session.execute(select(counted.c.id, counted.c.seats).order_by(counted.c.id))
+        for event_id, seats in result.all():
+            await self.promote_waitlisted(event_id, limit=seats)
+
+    async def promote_waitlisted(self, event_id: UUID, limit: Optional[int] = None) -> int:
+        """
+        Move waitlisted members into free seats, oldest first. Runs inside the
+        caller's transaction (cancellations, capacity increases); returns the
+        number of members promoted.
+        """
+        promoted = 0
+        while limit is None or promoted < limit:
+            candidate = (
+                select(EventRegistration.id)
+                .where(
+                    EventRegistration.event_id == event_id,
+                    EventRegistration.status == WAITLISTED,
+                )
+                .order_by(EventRegistration.created_at, EventRegistration.id)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            registration_id = (await self.session.execute(candidate)).scalar_one_or_none()
+            if registration_id is None:
+                break
+            seat = await self.session.execute(self._take_seat(event_id))
+            if seat.first() is None:
+                break
+            await self.session.execute(
+                update(EventRegistration)
+                .where(EventRegistration.id == registration_id)
+                .values(status=REGISTERED, updated_at=datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
+            promoted += 1
+        return promoted
+
+    async def get_registrations(
+        self,
+        event_id: UUID,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[EventRegistration]:
+        """Registrations of an event in queue order."""
+        query = self._registrations_query(event_id, status=status)
+        query = query.order_by(EventRegistration.created_at, EventRegistration.id)
+        result = await self.session.execute(query.offset(skip).limit(limit))
+        return list(result.scalars().all())
+
+    async def count_registrations(self, event_id: UUID, status: Optional[str] = None) -> Tuple[int, bool]:
+        return await count_rows(self.session, self._registrations_query(event_id, status=status))
+
+    @staticmethod
+    def _ends_at(
+        start_time: datetime,
+        end_time: datetime,
+        recurrence_freq: Optional[str],
+        recurrence_end: Optional[datetime],
+    ) -> Optional[datetime]:
+        """
+        End of an event's last occurrence; None for a series without end.
+        Registrations apply to the whole series, so a recurring event stays
+        open until its final occurrence is over.
+        """
+        if not recurrence_freq:
+            return end_time
+        if recurrence_end is None:
+            return None
+        return recurrence_end + (end_time - start_time)
+
+    @staticmethod
+    def _take_seat(event_id: UUID):
+        """Conditional increment of the seat count, RETURNING the event id when a seat was free."""
+        return (
+            update(Event)
+            .where(
+                Event.id == event_id,
+                or_(Event.capacity == None, Event.registered_count < Event.capacity),
+            )
+            # Seat counts are not edits of the event, keep updated_at as is
+            .values(registered_count=Event.registered_count + 1, updated_at=Event.updated_at)
+            .returning(Event.id)
+        )
+
+    def _registrations_query(self, event_id: UUID, status: Optional[str] = None):
+        query = select(EventRegistration).where(EventRegistration.event_id == event_id)
+        if status:
+            query = query.where(EventRegistration.status == status)
+        return query
+
+    async def _get(
+        self, event_id: UUID, member_id: UUID, for_update: bool = False
+    ) -> Optional[EventRegistration]:
+        stmt = select(EventRegistration).where(
+            EventRegistration.event_id == event_id,
+            EventRegistration.member_id == member_id,
+        )
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self.session.execute(stmt)
+        registration_row = result.first()
+        return registration_row[0] if registration_row else None
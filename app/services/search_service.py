@@ -0,0 +1,234 @@
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import String, and_, cast, delete, func, insert, literal_column, or_, true
+from sqlalchemy.sql import Select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.tracing import traced
+from app.models.company import Company
+from app.models.event import Event
+from app.models.member import Member
+from app.models.search_document import SearchDocument
+
+# Facets that can be filtered on; counts are returned for all but company_id
+FACETS = ("industry", "position", "is_virtual", "company_id")
+COUNTED_FACETS = ("type", "industry", "position", "is_virtual")
+MAX_FACET_VALUES = 20
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _facets(**values) -> object:
+    """jsonb object of the non-null facet values, all stored as text."""
+    args = []
+    for key, value in values.items():
+        args.extend([literal_column(f"'{key}'"), cast(value, String)])
+    return func.jsonb_strip_nulls(func.jsonb_build_object(*args))
+
+
+def _member_documents() -> Select:
+    full_name = func.concat_ws(" ", Member.first_name, Member.last_name)
+    return select(
+        literal_column("'member'"),
+        Member.id,
+        full_name,
+        Member.position,
+        func.concat_ws(" ", full_name, Member.user_name),
+        Member.position,
+        Member.bio,
+        _facets(position=Member.position, company_id=Member.company_id),
+    ).where(Member.is_active == True)
+
+
+def _company_documents() -> Select:
+    return select(
+        literal_column("'company'"),
+        Company.id,
+        Company.name,
+        Company.industry,
+        Company.name,
+        Company.industry,
+        Company.description,
+        _facets(industry=Company.industry),
+    )
+
+
+def _event_documents() -> Select:
+    return select(
+        literal_column("'event'"),
+        Event.id,
+        Event.title,
+        Event.location,
+        Event.title,
+        Event.location,
+        Event.description,
+        _facets(is_virtual=Event.is_virtual, company_id=Event.company_id),
+    )
+
+
+# entity type -> (model, SELECT producing its search documents)
+SOURCES = {
+    "member": (Member, _member_documents),
+    "company": (Company, _company_documents),
+    "event": (Event, _event_documents),
+}
+_DOCUMENT_COLUMNS = [
+    "entity_type", "entity_id", "title", "subtitle",
+    "primary_text", "secondary_text", "body_text", "facets",
+]
+
+
+def build_tsquery(text: str, prefix: bool = True) -> Optional[str]:
+    """
+    Turn free text into a to_tsquery() expression matching every word. With
+    `prefix` the last word is matched as a prefix for typeahead ("fin tec"
+    finds "Fintech"). Returns None when the text has no searchable words.
+    """
+    words = _TOKEN.findall(text.lower())
+    if not words:
+        return None
+    terms = [f"'{word}'" for word in words]
+    if prefix:
+        terms[-1] += ":*"
+    return " & ".join(terms)
+
+
+@traced
+class SearchIndexService:
+    """
+    Maintains the shared search_documents index and queries it.
+
+    Documents are built in SQL from the source tables, so callers flush their
+    changes and index within the same transaction before committing.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def index(self, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        """(Re)build the documents of the given entities, dropping ones no longer searchable."""
+        entity_ids = list(entity_ids)
+        if not entity_ids:
+            return
+        model, documents = SOURCES[entity_type]
+        await self.remove(entity_type, entity_ids)
+        await self.session.execute(
+            insert(SearchDocument.__table__).from_select(
+                _DOCUMENT_COLUMNS, documents().where(model.id.in_(entity_ids))
+            )
+        )
+
+    async def remove(self, entity_type: str, entity_ids: Iterable[UUID]) -> None:
+        await self.session.execute(
+            delete(SearchDocument.__table__).where(
+                SearchDocument.entity_type == entity_type,
+                SearchDocument.entity_id.in_(list(entity_ids)),
+            )
+        )
+
+    async def remove_company(self, company_id: UUID) -> None:
+        """Remove a company's document and those of the members and events deleted with it."""
+        await self.remove("company", [company_id])
+        await self.session.execute(
+            delete(SearchDocument.__table__).where(
+                or_(
+                    and_(
+                        SearchDocument.entity_type == "member",
+                        SearchDocument.entity_id.in_(
+                            select(Member.id).where(Member.company_id == company_id)
+                        ),
+                    ),
+                    and_(
+                        SearchDocument.entity_type == "event",
+                        SearchDocument.entity_id.in_(
+                            select(Event.id).where(Event.company_id == company_id)
+                        ),
+                    ),
+                )
+            )
+        )
+
+    async def reindex(self, entity_types: Optional[Sequence[str]] = None) -> None:
+        """Rebuild the index from the source tables (backfill, bulk imports)."""
+        for entity_type in entity_types or SOURCES:
+            _, documents = SOURCES[entity_type]
+            await self.session.execute(
+                delete(SearchDocument.__table__).where(SearchDocument.entity_type == entity_type)
+            )
+            await self.session.execute(
+                insert(SearchDocument.__table__).from_select(_DOCUMENT_COLUMNS, documents())
+            )
+
+    async def search(
+        self,
+        query: str,
+        entity_types: Optional[Sequence[str]] = None,
+        facets: Optional[Dict[str, str]] = None,
+        prefix: bool = True,
+        skip: int = 0,
+        limit: int = 20,
+    ) -> Tuple[List[dict], int, Dict[str, Dict[str, int]]]:
+        """
+        Rank documents matching `query`, optionally restricted to entity types
+        and facet values. Returns (hits, total, facet counts), where the facet
+        counts describe the whole filtered result set.
+        """
+        ts_text = build_tsquery(query, prefix=prefix)
+        if ts_text is None:
+            return [], 0, {}
+
+        search_vector = SearchDocument.__table__.c.search_vector
+        ts_query = func.to_tsquery("simple", ts_text)
+        conditions = [search_vector.op("@@")(ts_query)]
+        if entity_types:
+            conditions.append(SearchDocument.entity_type.in_(list(entity_types)))
+        if facets:
+            conditions.append(SearchDocument.facets.contains(facets))
+
+        rank = func.ts_rank_cd(search_vector, ts_query).label("rank")
+        stmt = (
+            select(
+                SearchDocument.entity_type,
+                SearchDocument.entity_id,
+                SearchDocument.title,
+                SearchDocument.subtitle,
+                rank,
+            )
+            .where(*conditions)
+            .order_by(rank.desc(), SearchDocument.entity_type, SearchDocument.entity_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        hits = [dict(row) for row in result.mappings().all()]
+
+        facet_counts = await self._facet_counts(conditions)
+        total = sum(facet_counts.get("type", {}).values())
+        return hits, total, facet_counts
+
+    async def _facet_counts(self, conditions: list) -> Dict[str, Dict[str, int]]:
+        # One aggregate over (key, value) pairs, with the entity type as an extra facet
+        pairs = func.jsonb_each_text(
+            SearchDocument.facets.op("||")(
+                func.jsonb_build_object(literal_column("'type'"), SearchDocument.entity_type)
+            )
+        ).table_valued("key", "value").render_derived(name="facet")
+        count = func.count().label("count")
+        stmt = (
+            select(pairs.c.key, pairs.c.value, count)
+            .select_from(SearchDocument.__table__)
+            .join(pairs, true())
+            .where(*conditions, pairs.c.key.in_(COUNTED_FACETS))
+            .group_by(pairs.c.key, pairs.c.value)
+            .order_by(pairs.c.key, count.desc(), pairs.c.value)
+        )
+        result = await self.session.execute(stmt)
+        counts: Dict[str, Dict[str, int]] = {}
+        for key, value, number in result.all():
+            values = counts.setdefault(key, {})
+            if len(values) < MAX_FACET_VALUES:
+                values[value] = number
+        return counts
@@ -1,28 +1,29 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from uuid import UUID
 from datetime import datetime
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi import HTTPException
-from passlib.context import CryptContext
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
 
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.config import settings
+from app.core import passwords
+from app.core.tracing import traced
+from app.db.count import count_rows
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
+@traced
 class UserService:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await passwords.verify_password(plain_password, hashed_password)
 
-    def get_password_hash(self, password: str) -> str:
-        return pwd_context.hash(password)
+    async def get_password_hash(self, password: str) -> str:
+        return await passwords.hash_password(password)
 
     def create_access_token(self, user_id: UUID, member_id: UUID) -> str:
         to_encode = {
@@ -48,7 +49,7 @@ class UserService:
         user = await self.get_by_email(email)
         if not user:
             return None
-        if not self.verify_password(password, user.password_hash):
+        if not await self.verify_password(password, user.password_hash):
             return None
         return user
 
@@ -60,7 +61,7 @@ class UserService:
             raise HTTPException(status_code=400, detail=existing)
 
         # Hash the password
-        hashed_password = self.get_password_hash(user_in.password)
+        hashed_password = await self.get_password_hash(user_in.password)
         
         # Create user object
         user_data = user_in.model_dump()
@@ -87,7 +88,7 @@ class UserService:
 
         # Hash new password if provided
         if "password" in update_data:
-            update_data["password_hash"] = self.get_password_hash(update_data.pop("password"))
+            update_data["password_hash"] = await self.get_password_hash(update_data.pop("password"))
 
         # Update user attributes
         for field, value in update_data.items():
@@ -129,6 +130,10 @@ class UserService:
         users = result.scalars().all()
         return list(users)
 
+    async def count_all(self) -> Tuple[int, bool]:
+        """Count users without an unbounded COUNT(*) on large tables."""
+        return await count_rows(self.session, select(User))
+
     async def _check_unique_constraints(self, email: Optional[str] = None) -> Optional[str]:
         """Check unique constraints and return error message if violated."""
         if email:
@@ -0,0 +1,246 @@
+"""
+HTTP load test against a running server seeded with benchmarks.seed_data.
+
+Runs each scenario (login, /auth/me, the member list, a member's followers,
+active notifications) with `--concurrency` clients until `--requests`
+responses are in, after a short warm-up, and reports p50/p95/p99 latency,
+throughput and errors. Logins are bcrypt-bound, so they get their own,
+smaller request count.
+
+Results are compared against a stored baseline (JSON, one entry per
+scenario, checked in so changes show up in a diff): a p95 more than
+`--tolerance` above it, or a throughput more than `--tolerance` below it,
+is a regression and the run exits non-zero, as does a run without a
+baseline. `--save-baseline` writes the current results instead, along with
+the machine and the seed command (`--seed-command`) under "_meta". Compare
+only runs made on the same machine with the same seed data.
+
+    python -m benchmarks.seed_data --members 10000 --users 1000 --seed 42
+    uvicorn app.main:app --workers 4 &
+    python -m benchmarks.http_load [--base-url http://localhost:8000] \\
+        [--concurrency 32] [--requests 2000] [--scenarios me,members] \\
+        [--baseline benchmarks/baselines/http_load.json] [--save-baseline]
+
+The committed baseline was recorded on a single-CPU machine (see its
+"_meta") with one worker and `--users 20 --concurrency 8 --requests 1000`;
+at higher concurrency that machine sheds most requests with 503.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+import httpx
+
+API = "/api/v1"
+# benchmarks.seed_data.PASSWORD; not imported, as that pulls in the whole app
+PASSWORD = "bench-password"
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "http_load.json"
+DEFAULT_SEED_COMMAND = "python -m benchmarks.seed_data --members 10000 --users 1000 --seed 42"
+
+# A scenario sends one request with a client authenticated as some seeded user
+Scenario = Callable[[httpx.AsyncClient, random.Random], Awaitable[httpx.Response]]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Fixtures:
+    """Tokens and ids fetched once before the timed runs."""
+
+    def __init__(self, users: int):
+        self.emails = [f"seed_user_{n}@example.com" for n in range(users)]
+        self.tokens: List[str] = []
+        self.member_ids: List[str] = []
+
+    async def load(self, client: httpx.AsyncClient) -> None:
+        for email in self.emails:
+            response = await login(client, email)
+            response.raise_for_status()
+            self.tokens.append(response.json()["access_token"])
+        response = await client.get(
+            f"{API}/members/", params={"limit": 100}, headers=self.headers(random.Random(0))
+        )
+        response.raise_for_status()
+        self.member_ids = [member["id"] for member in response.json()]
+        if not self.member_ids:
+            raise SystemExit("no members found, run benchmarks.seed_data first")
+
+    def headers(self, rng: random.Random) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {rng.choice(self.tokens)}"}
+
+
+async def login(client: httpx.AsyncClient, email: str) -> httpx.Response:
+    return await client.post(f"{API}/auth/login", data={"username": email, "password": PASSWORD})
+
+
+def scenarios(fixtures: Fixtures) -> Dict[str, Scenario]:
+    async def login_scenario(client, rng):
+        return await login(client, rng.choice(fixtures.emails))
+
+    async def me(client, rng):
+        return await client.get(f"{API}/auth/me", headers=fixtures.headers(rng))
+
+    async def members(client, rng):
+        return await client.get(
+            f"{API}/members/",
+            params={"skip": rng.randrange(0, 1000), "limit": 20},
+            headers=fixtures.headers(rng),
+        )
+
+    async def followers(client, rng):
+        member_id = rng.choice(fixtures.member_ids)
+        return await client.get(
+            f"{API}/members/{member_id}/followers", params={"limit": 20}, headers=fixtures.headers(rng)
+        )
+
+    async def notifications_active(client, rng):
+        return await client.get(f"{API}/notifications/active", headers=fixtures.headers(rng))
+
+    return {
+        "login": login_scenario,
+        "me": me,
+        "members": members,
+        "followers": followers,
+        "notifications_active": notifications_active,
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient, scenario: Scenario, requests: int, concurrency: int, seed: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    issued = itertools.count()
+
+    async def worker(worker_id: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed * 1000 + worker_id)
+        while next(issued) < requests:
+            started = time.perf_counter()
+            try:
+                response = await scenario(client, rng)
+                failed = response.status_code >= 400
+            except httpx.HTTPError:
+                failed = True
+            latencies.append(time.perf_counter() - started)
+            errors += failed
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(n) for n in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "qps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> bool:
+    """Print the change against the baseline; False when any scenario regressed."""
+    ok = True
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<22} no baseline")
+            continue
+        p95_change = result["p95_ms"] / previous["p95_ms"] - 1 if previous["p95_ms"] else 0.0
+        qps_change = result["qps"] / previous["qps"] - 1 if previous["qps"] else 0.0
+        regressed = p95_change > tolerance or qps_change < -tolerance
+        ok = ok and not regressed
+        print(
+            f"{name:<22} p95 {p95_change:+7.1%}   qps {qps_change:+7.1%}"
+            f"{'   REGRESSION' if regressed else ''}"
+        )
+    return ok
+
+
+async def run(args: argparse.Namespace) -> bool:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        fixtures = Fixtures(args.users)
+        await fixtures.load(client)
+        available = scenarios(fixtures)
+        selected = args.scenarios.split(",") if args.scenarios else list(available)
+        unknown = set(selected) - set(available)
+        if unknown:
+            raise SystemExit(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+        results: Dict[str, Dict[str, float]] = {}
+        print(f"{'scenario':<22} {'requests':>8} {'errors':>6} {'qps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+        for seed, name in enumerate(selected):
+            requests = args.login_requests if name == "login" else args.requests
+            await run_scenario(client, available[name], args.warmup, args.concurrency, seed)
+            result = results[name] = await run_scenario(
+                client, available[name], requests, args.concurrency, seed
+            )
+            print(
+                f"{name:<22} {result['requests']:>8} {result['errors']:>6} {result['qps']:>8.1f} "
+                f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} {result['p99_ms']:>8.2f}"
+            )
+
+    baseline_path: Path = args.baseline
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        stored = json.loads(baseline_path.read_text()) if baseline_path.exists() else {}
+        stored.update(results)
+        stored["_meta"] = {
+            "machine": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+            "seed_command": args.seed_command,
+            "users": args.users,
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+        }
+        baseline_path.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {baseline_path}")
+        return True
+    if not baseline_path.exists():
+        print(f"no baseline at {baseline_path}, run with --save-baseline to create it")
+        return False
+    baseline = json.loads(baseline_path.read_text())
+    meta = baseline.get("_meta", {})
+    print(f"\nagainst {baseline_path} (tolerance {args.tolerance:.0%}):")
+    if meta:
+        print(f"recorded on {meta.get('machine')}, {meta.get('cpus')} cpus, after `{meta.get('seed_command')}`")
+        for option in ("users", "concurrency", "requests"):
+            if meta.get(option) not in (None, getattr(args, option)):
+                print(f"note: the baseline was recorded with --{option} {meta[option]}, this run used {getattr(args, option)}")
+    return compare(results, baseline, args.tolerance)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--users", type=int, default=50, help="seeded users to log in as")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000, help="timed requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=50, help="untimed requests per scenario")
+    parser.add_argument("--scenarios", help="comma separated, default all")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--seed-command", default=DEFAULT_SEED_COMMAND, help="how the data was seeded, stored with the baseline"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95/qps change")
+    ok = asyncio.run(run(parser.parse_args()))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
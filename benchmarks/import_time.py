@@ -0,0 +1,90 @@
+"""
+Import-time audit of the application, from `python -X importtime`.
+
+Imports `--module` (default app.main) in a fresh interpreter, several times
+to smooth out disk cache effects, and reports the total and the slowest
+modules by cumulative and by self time, plus the total per top-level
+package. With `--budget-ms` the run exits non-zero when the median total
+exceeds it. Needs the environment variables the app needs at import
+(DATABASE_URI, ...); nothing connects to the database.
+
+    DATABASE_URI=postgresql+asyncpg://... python -m benchmarks.import_time \\
+        [--module app.main] [--runs 5] [--top 25] [--budget-ms 1500]
+"""
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+# import time:       self [us] |  cumulative | imported package
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s*(\S+)")
+
+
+class ImportTime(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure(module: str) -> List[ImportTime]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"importing {module} failed:\n{result.stderr[-2000:]}")
+    times = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, name = match.groups()
+            times.append(ImportTime(name, int(self_us), int(cumulative_us)))
+    return times
+
+
+def report(module: str, runs: int, top: int) -> float:
+    """Print the audit; returns the median total in ms."""
+    samples = [measure(module) for _ in range(runs)]
+    totals = [sum(entry.self_us for entry in times) / 1000 for times in samples]
+    # Detailed numbers from the run closest to the median
+    median = statistics.median(totals)
+    times = samples[min(range(runs), key=lambda n: abs(totals[n] - median))]
+
+    print(f"import {module}: median {median:.0f} ms over {runs} runs (min {min(totals):.0f}, max {max(totals):.0f})")
+
+    print("\nslowest by cumulative time (ms)")
+    for entry in sorted(times, key=lambda entry: entry.cumulative_us, reverse=True)[:top]:
+        print(f"  {entry.cumulative_us / 1000:8.1f}  {entry.module}")
+
+    print("\nslowest by self time (ms)")
+    for entry in sorted(times, key=lambda entry: entry.self_us, reverse=True)[:top]:
+        print(f"  {entry.self_us / 1000:8.1f}  {entry.module}")
+
+    packages: Dict[str, int] = defaultdict(int)
+    for entry in times:
+        packages[entry.module.split(".", 1)[0]] += entry.self_us
+    print("\nby top-level package (ms)")
+    for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"  {self_us / 1000:8.1f}  {package}")
+    return median
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--budget-ms", type=float, help="fail when the median total is above this")
+    args = parser.parse_args()
+    median = report(args.module, args.runs, args.top)
+    if args.budget_ms is not None and median > args.budget_ms:
+        print(f"\nover budget: {median:.0f} ms > {args.budget_ms:.0f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
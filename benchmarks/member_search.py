@@ -0,0 +1,136 @@
+"""
+Latency benchmark for MemberService.search against a local Postgres.
+
+Seeds synthetic members with INSERT ... SELECT generate_series (skipped when
+the table already holds enough rows), then runs a mix of exact, partial and
+misspelled queries and reports p50/p95/p99. Target: p95 < 20 ms at 1M members.
+
+    DATABASE_URI=postgresql+asyncpg://... python -m benchmarks.member_search \
+        [--members 1000000] [--queries 500]
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from sqlalchemy import text
+
+from app.db.init_db import init_db
+from app.db.session import async_session, engine
+from app import models  # noqa: F401 (registers every model)
+from app.services.member_service import MemberService
+
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "William", "Elizabeth", "David", "Barbara", "Richard", "Susan", "Joseph", "Jessica",
+    "Thomas", "Sarah", "Charles", "Karen", "Nimal", "Kavindu", "Sanduni", "Tharindu",
+    "Dilini", "Kasun", "Ishara", "Chamara", "Nadeesha", "Ruwan",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+    "Rodriguez", "Martinez", "Perera", "Fernando", "Silva", "Jayasinghe", "Bandara",
+    "Wickramasinghe", "Gunawardena", "Dissanayake", "Rathnayake", "Herath",
+]
+POSITIONS = [
+    "Engineer", "Designer", "Product Manager", "Founder", "Developer", "Analyst",
+    "Researcher", "Consultant", "Architect", "Blockchain Developer",
+]
+SEED_BATCH = 100_000
+
+
+def _sql_array(values: List[str]) -> str:
+    return "ARRAY[" + ", ".join(f"'{v}'" for v in values) + "]"
+
+
+async def seed(count: int) -> None:
+    async with engine.begin() as conn:
+        existing = (await conn.execute(text("SELECT count(*) FROM members"))).scalar_one()
+    if existing >= count:
+        print(f"members table already has {existing} rows, skipping seed")
+        return
+
+    insert = text(f"""
+        INSERT INTO members (
+            id, first_name, last_name, user_name, slug, wallet_key, email,
+            position, bio, is_active, joined_at, created_at, updated_at
+        )
+        SELECT
+            gen_random_uuid(),
+            ({_sql_array(FIRST_NAMES)})[1 + i % {len(FIRST_NAMES)}],
+            ({_sql_array(LAST_NAMES)})[1 + (i / {len(FIRST_NAMES)}) % {len(LAST_NAMES)}],
+            'bench_user_' || i,
+            'bench-user-' || i,
+            'bench-wallet-' || i,
+            'bench_user_' || i || '@example.com',
+            ({_sql_array(POSITIONS)})[1 + i % {len(POSITIONS)}],
+            'Member ' || i || ' working on ' || md5(i::text),
+            true, now(), now(), now()
+        FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS i
+    """)
+    for start in range(existing, count, SEED_BATCH):
+        stop = min(start + SEED_BATCH, count) - 1
+        async with engine.begin() as conn:
+            await conn.execute(insert, {"start": start, "stop": stop})
+        print(f"seeded {stop + 1}/{count}")
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE members"))
+
+
+def random_query(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.3:
+        return rng.choice(FIRST_NAMES)
+    if kind < 0.5:
+        return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    if kind < 0.7:
+        # Misspelling: drop one character
+        name = rng.choice(LAST_NAMES)
+        index = rng.randrange(1, len(name))
+        return name[:index] + name[index + 1:]
+    if kind < 0.85:
+        return rng.choice(POSITIONS)
+    return f"bench_user_{rng.randrange(1000)}"
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(members: int, queries: int, limit: int) -> None:
+    await init_db()
+    await seed(members)
+
+    rng = random.Random(42)
+    timings = []
+    async with async_session() as session:
+        service = MemberService(session)
+        for _ in range(20):  # warm caches and the connection
+            await service.search(random_query(rng), limit=limit)
+        for _ in range(queries):
+            start = time.perf_counter()
+            await service.search(random_query(rng), limit=limit)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    p95 = percentile(timings, 95)
+    print(f"{queries} queries over {members} members (limit {limit})")
+    print(
+        f"  p50 {percentile(timings, 50):.2f} ms  p95 {p95:.2f} ms  "
+        f"p99 {percentile(timings, 99):.2f} ms  max {max(timings):.2f} ms"
+    )
+    print(f"  target p95 < 20 ms: {'PASS' if p95 < 20 else 'FAIL'}")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.members, args.queries, args.limit))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Registration rush: many members register for one event at the same moment.
+
+Creates an event with `--capacity` seats and `--members` members, fires one
+registration per member concurrently (plus `--retries` duplicate requests
+replaying a random subset), then cancels some seats and checks that:
+
+  * no more than `capacity` registrations are confirmed,
+  * events.registered_count matches the confirmed registrations,
+  * every member has exactly one registration,
+  * cancelled seats are handed to the waitlist in order.
+
+Exits non-zero when any invariant is broken. Everything it creates is
+removed afterwards.
+
+    DATABASE_URI=postgresql+asyncpg://... python -m benchmarks.registration_rush \\
+        [--members 1000] [--capacity 100] [--retries 0.1] [--cancel 10]
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.db.init_db import init_db
+from app.db.session import async_session, engine
+from app import models  # noqa: F401 (registers every model)
+from app.services.registration_service import RegistrationService
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def setup(run_id: str, members: int, capacity: int) -> UUID:
+    company_id, event_id = uuid.uuid4(), uuid.uuid4()
+    start = datetime.now(timezone.utc) + timedelta(days=7)
+    async with engine.begin() as conn:
+        await conn.execute(
+            text("INSERT INTO companies (id, name, created_at, updated_at) VALUES (:id, :name, now(), now())"),
+            {"id": company_id, "name": f"rush {run_id}"},
+        )
+        await conn.execute(
+            text("""
+                INSERT INTO events (id, title, start_time, end_time, is_virtual, capacity,
+                                    registered_count, company_id, created_at, updated_at)
+                VALUES (:id, :title, :start, :end, false, :capacity, 0, :company_id, now(), now())
+            """),
+            {
+                "id": event_id, "title": f"rush {run_id}", "start": start,
+                "end": start + timedelta(hours=2), "capacity": capacity, "company_id": company_id,
+            },
+        )
+        await conn.execute(
+            text("""
+                INSERT INTO members (id, first_name, last_name, user_name, slug, wallet_key, email,
+                                     is_active, company_id, joined_at, created_at, updated_at)
+                SELECT gen_random_uuid(), 'Rush', 'Member ' || i, :prefix || i, :prefix || i,
+                       :prefix || i, :prefix || i || '@example.com', true, :company_id, now(), now(), now()
+                FROM generate_series(1, CAST(:count AS integer)) AS i
+            """),
+            {"prefix": f"rush_{run_id}_", "count": members, "company_id": company_id},
+        )
+    return event_id
+
+
+async def teardown(event_id: UUID) -> None:
+    async with engine.begin() as conn:
+        company_id = (
+            await conn.execute(text("SELECT company_id FROM events WHERE id = :id"), {"id": event_id})
+        ).scalar_one()
+        await conn.execute(text("DELETE FROM event_registrations WHERE event_id = :id"), {"id": event_id})
+        await conn.execute(text("DELETE FROM events WHERE id = :id"), {"id": event_id})
+        await conn.execute(text("DELETE FROM members WHERE company_id = :id"), {"id": company_id})
+        await conn.execute(text("DELETE FROM companies WHERE id = :id"), {"id": company_id})
+
+
+async def register(event_id: UUID, member_id: UUID, timings: List[float]) -> None:
+    start = time.perf_counter()
+    async with async_session() as session:
+        await RegistrationService(session).register(event_id, member_id)
+    timings.append((time.perf_counter() - start) * 1000)
+
+
+async def cancel(event_id: UUID, member_id: UUID) -> None:
+    async with async_session() as session:
+        await RegistrationService(session).cancel(event_id, member_id)
+
+
+async def check(event_id: UUID, capacity: int, members: int) -> List[str]:
+    async with engine.connect() as conn:
+        registered_count = (
+            await conn.execute(text("SELECT registered_count FROM events WHERE id = :id"), {"id": event_id})
+        ).scalar_one()
+        rows = (
+            await conn.execute(
+                text("SELECT status, count(*), count(DISTINCT member_id) FROM event_registrations "
+                     "WHERE event_id = :id GROUP BY status"),
+                {"id": event_id},
+            )
+        ).all()
+    by_status = {status: (count, distinct) for status, count, distinct in rows}
+    registered = by_status.get("registered", (0, 0))[0]
+    total = sum(count for count, _ in by_status.values())
+    print(f"  registered_count={registered_count} statuses={ {s: c for s, (c, _) in by_status.items()} }")
+
+    errors = []
+    if registered > capacity:
+        errors.append(f"overbooked: {registered} registered for {capacity} seats")
+    if registered != registered_count:
+        errors.append(f"registered_count {registered_count} != {registered} registered rows")
+    if total != members:
+        errors.append(f"{total} registrations for {members} members")
+    if registered < min(capacity, members) and by_status.get("waitlisted", (0, 0))[0]:
+        errors.append("free seats left while members are waitlisted")
+    return errors
+
+
+async def run(members: int, capacity: int, retries: float, cancellations: int) -> bool:
+    await init_db()
+    run_id = uuid.uuid4().hex[:8]
+    event_id = await setup(run_id, members, capacity)
+    try:
+        async with engine.connect() as conn:
+            member_ids = list(
+                (await conn.execute(
+                    text("SELECT id FROM members WHERE user_name LIKE :pattern"),
+                    {"pattern": f"rush_{run_id}_%"},
+                )).scalars()
+            )
+        rng = random.Random(42)
+        requests = member_ids + rng.sample(member_ids, int(len(member_ids) * retries))
+        rng.shuffle(requests)
+
+        timings: List[float] = []
+        start = time.perf_counter()
+        await asyncio.gather(*(register(event_id, member_id, timings) for member_id in requests))
+        elapsed = time.perf_counter() - start
+        print(f"{len(requests)} concurrent registrations ({len(member_ids)} members, {capacity} seats)")
+        print(
+            f"  {len(requests) / elapsed:.0f} req/s  p50 {percentile(timings, 50):.1f} ms  "
+            f"p95 {percentile(timings, 95):.1f} ms  p99 {percentile(timings, 99):.1f} ms"
+        )
+        errors = await check(event_id, capacity, members)
+
+        async with engine.connect() as conn:
+            registered = list(
+                (await conn.execute(
+                    text("SELECT member_id FROM event_registrations "
+                         "WHERE event_id = :id AND status = 'registered' LIMIT :n"),
+                    {"id": event_id, "n": cancellations},
+                )).scalars()
+            )
+        await asyncio.gather(*(cancel(event_id, member_id) for member_id in registered))
+        print(f"after {len(registered)} concurrent cancellations")
+        errors += await check(event_id, capacity, members)
+
+        for error in errors:
+            print(f"  FAIL: {error}")
+        print("  PASS" if not errors else "  FAIL")
+        return not errors
+    finally:
+        await teardown(event_id)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--capacity", type=int, default=100)
+    parser.add_argument("--retries", type=float, default=0.1, help="Fraction of requests sent twice")
+    parser.add_argument("--cancel", type=int, default=10, help="Registrations cancelled afterwards")
+    args = parser.parse_args()
+    ok = asyncio.run(run(args.members, args.capacity, args.retries, args.cancel))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
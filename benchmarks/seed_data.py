@@ -0,0 +1,271 @@
+"""
+Synthetic data generator for benchmarks and load tests.
+
+Creates companies, members (a login user for the first `--users` of them),
+follower edges with a power-law in-degree (a few members are followed by
+many, most by few), badges and their assignments, events and notifications.
+Rows are generated from `--seed`, so two runs with the same arguments
+produce the same data, and are loaded with COPY in batches.
+
+Seeded members are `seed_user_<n>`; the first `--users` can log in as
+`seed_user_<n>@example.com` with password `bench-password`. The run is
+skipped when seed_user_0 already exists (use --reset to replace the data).
+
+    DATABASE_URI=postgresql+asyncpg://... python -m benchmarks.seed_data \\
+        [--companies 100] [--members 10000] [--users 1000] [--follows 20] \\
+        [--badges 50] [--badges-per-member 3] [--events 500] \\
+        [--notifications 200] [--seed 42] [--reset]
+"""
+import argparse
+import asyncio
+import itertools
+import random
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Sequence
+
+from sqlalchemy import text
+
+from app.core.passwords import pwd_context
+from app.db.init_db import init_db
+from app.db.session import async_session, engine
+from app import models  # noqa: F401 (registers every model)
+from app.services.search_service import SearchIndexService
+
+PASSWORD = "bench-password"
+BATCH = 50_000
+INDUSTRIES = ["Fintech", "Blockchain", "Healthcare", "Education", "Retail", "Logistics", "Media"]
+FIRST_NAMES = [
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda",
+    "Nimal", "Kavindu", "Sanduni", "Tharindu", "Dilini", "Kasun", "Ishara", "Chamara",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Brown", "Garcia", "Perera", "Fernando", "Silva",
+    "Jayasinghe", "Bandara", "Wickramasinghe", "Gunawardena", "Herath",
+]
+POSITIONS = ["Engineer", "Designer", "Product Manager", "Founder", "Developer", "Analyst"]
+NOTIFICATION_TYPES = ["info", "warning", "success"]
+# Cleared by --reset, children first
+SEEDED_TABLES = [
+    "search_documents", "event_registrations", "member_badges", "followers", "users",
+    "notifications", "badges", "events", "members", "companies",
+]
+
+
+def seeded_uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def power_law_targets(rng: random.Random, count: int, exponent: float = 1.1) -> List[float]:
+    """Cumulative weights giving member n a share proportional to 1 / (n + 1) ** exponent."""
+    ranks = list(range(count))
+    rng.shuffle(ranks)
+    return list(itertools.accumulate(1 / (rank + 1) ** exponent for rank in ranks))
+
+
+async def copy_rows(table: str, columns: Sequence[str], rows: Iterable[tuple]) -> int:
+    """COPY rows into `table` in batches, one transaction per batch."""
+    total = 0
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, BATCH))
+        if not batch:
+            return total
+        async with engine.begin() as conn:
+            raw_connection = await conn.get_raw_connection()
+            await raw_connection.driver_connection.copy_records_to_table(
+                table, records=batch, columns=list(columns)
+            )
+        total += len(batch)
+
+
+async def seed(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    companies = [seeded_uuid(rng) for _ in range(args.companies)]
+    await copy_rows(
+        "companies",
+        ["id", "name", "industry", "description", "created_at", "updated_at"],
+        (
+            (company_id, f"Seed Company {n}", rng.choice(INDUSTRIES), f"Synthetic company {n}", now, now)
+            for n, company_id in enumerate(companies)
+        ),
+    )
+
+    members = [seeded_uuid(rng) for _ in range(args.members)]
+    # Follower edges first, so the member rows carry their counts
+    cum_weights = power_law_targets(rng, args.members)
+    edges = set()
+    for follower in range(args.members):
+        # Out-degree is roughly exponential around the mean
+        for followed in rng.choices(
+            range(args.members), cum_weights=cum_weights, k=int(rng.expovariate(1 / args.follows))
+        ):
+            if followed != follower:
+                edges.add((follower, followed))
+    following = Counter(follower for follower, _ in edges)
+    followers = Counter(followed for _, followed in edges)
+
+    badges = [seeded_uuid(rng) for _ in range(args.badges)]
+    assignments = set()
+    for member in range(args.members):
+        held = min(args.badges, int(rng.expovariate(1 / args.badges_per_member))) if args.badges else 0
+        for badge in rng.sample(range(args.badges), held):
+            assignments.add((member, badge))
+    badge_counts = Counter(member for member, _ in assignments)
+
+    await copy_rows(
+        "members",
+        [
+            "id", "first_name", "last_name", "user_name", "slug", "wallet_key", "email",
+            "position", "bio", "is_active", "following", "followers", "badge_count",
+            "company_id", "joined_at", "created_at", "updated_at",
+        ],
+        (
+            (
+                member_id, rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+                f"seed_user_{n}", f"seed-user-{n}", f"seed-wallet-{n}", f"seed_user_{n}@example.com",
+                rng.choice(POSITIONS), f"Synthetic member {n}", True,
+                str(following[n]), str(followers[n]), badge_counts[n],
+                rng.choice(companies) if companies else None,
+                now - timedelta(days=rng.randrange(3650)), now, now,
+            )
+            for n, member_id in enumerate(members)
+        ),
+    )
+
+    # Hash once: every seeded user shares the password
+    password_hash = pwd_context.hash(PASSWORD)
+    users = min(args.users, args.members)
+    await copy_rows(
+        "users",
+        [
+            "id", "email", "password_hash", "role", "is_active", "email_verified",
+            "phone_verified", "two_factor_enabled", "member_id", "created_at", "updated_at",
+        ],
+        (
+            (
+                seeded_uuid(rng), f"seed_user_{n}@example.com", password_hash,
+                "admin" if n == 0 else "member", True, True, False, False, members[n], now, now,
+            )
+            for n in range(users)
+        ),
+    )
+
+    await copy_rows(
+        "followers",
+        ["id", "follower_id", "followed_id", "created_at"],
+        ((seeded_uuid(rng), members[a], members[b], now) for a, b in sorted(edges)),
+    )
+
+    await copy_rows(
+        "badges",
+        ["id", "name", "description", "icon", "is_active", "activation_pending",
+         "valid_from", "valid_until", "created_at", "updated_at"],
+        (
+            (badge_id, f"Seed Badge {n}", f"Synthetic badge {n}", f"badge-{n}.svg", True, False,
+             now - timedelta(days=365), None, now, now)
+            for n, badge_id in enumerate(badges)
+        ),
+    )
+    if assignments:
+        async with engine.begin() as conn:
+            admin_user = (
+                await conn.execute(text("SELECT id FROM users WHERE email = 'seed_user_0@example.com'"))
+            ).scalar_one_or_none()
+        if admin_user is None:
+            print("no seeded user to issue badges, skipping badge assignments")
+        else:
+            await copy_rows(
+                "member_badges",
+                ["id", "member_id", "badge_id", "issued_at", "issued_by_id", "is_active"],
+                (
+                    (seeded_uuid(rng), members[m], badges[b], now, admin_user, True)
+                    for m, b in sorted(assignments)
+                ),
+            )
+
+    def event_row(n: int) -> tuple:
+        # Spread over the past and next six months
+        start = now + timedelta(hours=rng.randrange(-24 * 180, 24 * 180))
+        return (
+            seeded_uuid(rng), f"Seed Event {n}", f"Synthetic event {n}", "Colombo",
+            start, start + timedelta(hours=2), rng.random() < 0.3,
+            rng.choice([None, 50, 100, 500]), 0, 1, "UTC",
+            rng.choice(companies), now, now,
+        )
+
+    # Every event needs an organizing company
+    events = args.events if companies else 0
+    await copy_rows(
+        "events",
+        ["id", "title", "description", "location", "start_time", "end_time", "is_virtual",
+         "capacity", "registered_count", "recurrence_interval", "recurrence_timezone",
+         "company_id", "created_at", "updated_at"],
+        (event_row(n) for n in range(events)),
+    )
+
+    await copy_rows(
+        "notifications",
+        ["id", "title", "message", "type", "priority", "is_active", "created_at", "updated_at", "expires_at"],
+        (
+            (
+                seeded_uuid(rng), f"Seed Notification {n}", f"Synthetic notification {n}",
+                rng.choice(NOTIFICATION_TYPES), "normal", rng.random() < 0.7, now, now,
+                now + timedelta(days=rng.randrange(-30, 90)),
+            )
+            for n in range(args.notifications)
+        ),
+    )
+
+    async with async_session() as session:
+        await SearchIndexService(session).reindex()
+        await session.commit()
+    async with engine.begin() as conn:
+        for table in SEEDED_TABLES:
+            await conn.execute(text(f"ANALYZE {table}"))
+
+    print(
+        f"seeded {len(companies)} companies, {len(members)} members ({users} users), "
+        f"{len(edges)} follower edges, {len(badges)} badges, {len(assignments)} assignments, "
+        f"{events} events, {args.notifications} notifications"
+    )
+
+
+async def run(args: argparse.Namespace) -> None:
+    await init_db()
+    async with engine.begin() as conn:
+        if args.reset:
+            await conn.execute(text(f"TRUNCATE {', '.join(SEEDED_TABLES)} CASCADE"))
+        exists = (
+            await conn.execute(text("SELECT 1 FROM members WHERE user_name = 'seed_user_0'"))
+        ).first()
+    if exists:
+        print("seed data already present (seed_user_0 exists), skipping; use --reset to replace it")
+    else:
+        started = time.perf_counter()
+        await seed(args)
+        print(f"  in {time.perf_counter() - started:.1f} s")
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--companies", type=int, default=100)
+    parser.add_argument("--members", type=int, default=10_000)
+    parser.add_argument("--users", type=int, default=1_000, help="members that get a login")
+    parser.add_argument("--follows", type=float, default=20, help="mean follows per member")
+    parser.add_argument("--badges", type=int, default=50)
+    parser.add_argument("--badges-per-member", type=float, default=3)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--notifications", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--reset", action="store_true", help="truncate the seeded tables first (destructive)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Micro-benchmark: FastAPI's response_model path vs ModelResponse for a page of
+100 members with avatar, cover image, socials and links.
+
+    python -m benchmarks.serialization [--members 100] [--rounds 200]
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime
+from statistics import median
+from typing import Callable, List
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import FastJSONResponse, ModelResponse
+from app.models.badge import Badge, MemberBadge  # noqa: F401 (mapper registry)
+from app.models.company import Company  # noqa: F401
+from app.models.event import Event  # noqa: F401
+from app.models.external_link import ExternalLink
+from app.models.follower import Follower  # noqa: F401
+from app.models.image import Image
+from app.models.member import Member
+from app.models.social_link import SocialLink
+from app.models.user import User  # noqa: F401
+from app.schemas.member import MemberRead
+from starlette.responses import JSONResponse
+
+
+def build_members(count: int) -> List[Member]:
+    now = datetime.utcnow()
+    members = []
+    for i in range(count):
+        member_id = uuid.uuid4()
+        member = Member(
+            id=member_id,
+            first_name=f"First{i}",
+            last_name=f"Last{i}",
+            user_name=f"user{i}",
+            bio="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 3,
+            position="Engineer",
+            slug=f"user-{i}",
+            wallet_key=f"0x{uuid.uuid4().hex}",
+            email=f"user{i}@example.com",
+            is_active=True,
+            following="12",
+            followers="34",
+            joined_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        member.avatar = Image(
+            id=uuid.uuid4(),
+            thumbnail=f"https://cdn.example.com/{i}/thumb.png",
+            original=f"https://cdn.example.com/{i}/original.png",
+        )
+        member.cover_image = Image(
+            id=uuid.uuid4(),
+            thumbnail=f"https://cdn.example.com/{i}/cover-thumb.png",
+            original=f"https://cdn.example.com/{i}/cover.png",
+        )
+        member.socials = [
+            SocialLink(
+                id=uuid.uuid4(),
+                title=title,
+                link=f"https://{title}.com/user{i}",
+                icon=title,
+                member_id=member_id,
+            )
+            for title in ("twitter", "github", "linkedin")
+        ]
+        member.links = [
+            ExternalLink(
+                id=uuid.uuid4(),
+                title="Blog",
+                link=f"https://blog.example.com/user{i}",
+                member_id=member_id,
+            )
+        ]
+        members.append(member)
+    return members
+
+
+def measure(fn: Callable[[], bytes], rounds: int) -> List[float]:
+    fn()  # warm up schema and adapter caches
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    members = build_members(args.members)
+    field = create_model_field(name="Response", type_=List[MemberRead], mode="serialization")
+    loop = asyncio.new_event_loop()
+
+    def fastapi_path(response_class=JSONResponse) -> bytes:
+        content = loop.run_until_complete(
+            serialize_response(field=field, response_content=members)
+        )
+        return response_class(content).body
+
+    def model_response_path() -> bytes:
+        return ModelResponse(List[MemberRead], members).body
+
+    paths = [
+        ("response_model + JSONResponse", fastapi_path),
+        ("response_model + FastJSONResponse", lambda: fastapi_path(FastJSONResponse)),
+        ("ModelResponse", model_response_path),
+    ]
+    baseline = None
+    print(f"{args.members} members, {args.rounds} rounds")
+    for name, fn in paths:
+        timings = measure(fn, args.rounds)
+        p50 = median(timings)
+        baseline = baseline or p50
+        print(f"  {name:<36} p50 {p50:7.3f} ms  speedup x{baseline / p50:.2f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Shared fixtures.
+
+Tests touching Postgres take the `session` (or `session_factory`) fixture
+and are skipped unless DATABASE_URI points at a database. Each such test
+runs inside one transaction that is rolled back at the end, schema
+included, so it can run against a development or seeded database;
+service commits only release savepoints.
+"""
+import os
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+import pytest
+
+DATABASE_URI = os.environ.get("DATABASE_URI")
+# The settings need a database URI at import, also for tests not using one
+os.environ.setdefault("DATABASE_URI", "postgresql+asyncpg://localhost/unused")
+
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.db.init_db import create_extensions  # noqa: E402
+from app.models import Badge, Company, Event, Member, User  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def connection():
+    if DATABASE_URI is None:
+        pytest.skip("DATABASE_URI is not set")
+    # Not the application engine: its pooled connections belong to another event loop
+    engine = create_async_engine(str(settings.DATABASE_URI).split("?")[0], poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            try:
+                yield conn
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+async def session_factory(connection) -> Callable[[], AsyncSession]:
+    """Sessions sharing the test transaction, for code that opens its own."""
+    await create_extensions(connection)
+    await connection.run_sync(SQLModel.metadata.create_all)
+
+    def factory() -> AsyncSession:
+        return AsyncSession(
+            bind=connection, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        )
+
+    return factory
+
+
+@pytest.fixture
+async def session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+def _unique() -> str:
+    return uuid4().hex[:12]
+
+
+@pytest.fixture
+def make_member(session) -> Callable[..., Awaitable[Member]]:
+    async def make(**values: Any) -> Member:
+        name = _unique()
+        member = Member(
+            **{
+                "first_name": "Test",
+                "last_name": name,
+                "user_name": f"user_{name}",
+                "slug": f"user-{name}",
+                "wallet_key": f"wallet-{name}",
+                "email": f"{name}@example.com",
+                "joined_at": datetime.now(timezone.utc),
+                **values,
+            }
+        )
+        session.add(member)
+        await session.flush()
+        return member
+
+    return make
+
+
+@pytest.fixture
+def make_user(session, make_member) -> Callable[..., Awaitable[User]]:
+    async def make(**values: Any) -> User:
+        member = await make_member()
+        user = User(
+            **{
+                "email": member.email,
+                "password_hash": "not-a-hash",
+                "role": "admin",
+                "member_id": member.id,
+                **values,
+            }
+        )
+        session.add(user)
+        await session.flush()
+        return user
+
+    return make
+
+
+@pytest.fixture
+def make_company(session) -> Callable[..., Awaitable[Company]]:
+    async def make(**values: Any) -> Company:
+        company = Company(**{"name": f"Company {_unique()}", **values})
+        session.add(company)
+        await session.flush()
+        return company
+
+    return make
+
+
+@pytest.fixture
+def make_badge(session) -> Callable[..., Awaitable[Badge]]:
+    async def make(**values: Any) -> Badge:
+        badge = Badge(
+            **{
+                "name": f"Badge {_unique()}",
+                "description": "Test badge",
+                "icon": "star",
+                "valid_from": datetime.now(timezone.utc),
+                **values,
+            }
+        )
+        session.add(badge)
+        await session.flush()
+        return badge
+
+    return make
+
+
+@pytest.fixture
+def make_event(session, make_company) -> Callable[..., Awaitable[Event]]:
+    async def make(**values: Any) -> Event:
+        if "company_id" not in values:
+            values["company_id"] = (await make_company()).id
+        event = Event(**{"title": f"Event {_unique()}", **values})
+        session.add(event)
+        await session.flush()
+        return event
+
+    return make
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.core.clock import FrozenClock
+from app.models.badge import MemberBadge
+from app.schemas.badge import BadgeCreate, MemberBadgeCreate
+from app.services.badge_service import BadgeService
+from app.services.badge_validity_service import BadgeScheduler, BadgeValidityService
+
+pytestmark = pytest.mark.anyio
+
+# Far before any seeded data, so only the rows of the test reach their boundaries
+T0 = datetime(2000, 1, 1, 12, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def clock() -> FrozenClock:
+    return FrozenClock(T0)
+
+
+def badge_in(valid_from: datetime, valid_until=None) -> BadgeCreate:
+    return BadgeCreate(
+        name=f"Badge {valid_from.isoformat()}", description="Test badge", icon="star",
+        valid_from=valid_from, valid_until=valid_until,
+    )
+
+
+async def test_pending_badge_is_activated_at_valid_from(session, clock):
+    badge = await BadgeService(session, clock=clock).create(badge_in(T0 + timedelta(hours=1)))
+    assert (badge.is_active, badge.activation_pending) == (False, True)
+    service = BadgeValidityService(session, clock=clock)
+
+    assert (await service.sync())["badges_activated"] == 0
+    clock.advance(timedelta(hours=1))
+    counts = await service.sync()
+
+    assert counts["badges_activated"] == 1
+    await session.refresh(badge)
+    assert (badge.is_active, badge.activation_pending) == (True, False)
+
+
+async def test_expired_badge_deactivates_assignments_and_counts(session, clock, make_member, make_user):
+    badges = BadgeService(session, clock=clock)
+    expiring = await badges.create(badge_in(T0 - timedelta(days=1), T0 + timedelta(hours=1)))
+    lasting = await badges.create(badge_in(T0 - timedelta(days=1)))
+    admin = await make_user()
+    first, second = await make_member(), await make_member()
+    for member, badge in ((first, expiring), (second, expiring), (first, lasting)):
+        await badges.assign_badge(MemberBadgeCreate(member_id=member.id, badge_id=badge.id), admin.id)
+    await session.refresh(first)
+    await session.refresh(second)
+    assert (first.badge_count, second.badge_count) == (2, 1)
+
+    clock.advance(timedelta(hours=1))
+    # One assignment per batch, to go through the batching loop
+    counts = await BadgeValidityService(session, clock=clock, batch_size=1).sync()
+
+    assert counts == {"badges_activated": 0, "badges_expired": 1, "assignments_expired": 2}
+    for row in (expiring, lasting, first, second):
+        await session.refresh(row)
+    assert (expiring.is_active, lasting.is_active) == (False, True)
+    assert (first.badge_count, second.badge_count) == (1, 0)
+    assignments = (await session.execute(
+        MemberBadge.__table__.select().where(MemberBadge.badge_id == expiring.id)
+    )).all()
+    assert [assignment.is_active for assignment in assignments] == [False, False]
+
+    # A second run finds nothing left to change
+    assert await BadgeValidityService(session, clock=clock).sync() == {
+        "badges_activated": 0, "badges_expired": 0, "assignments_expired": 0,
+    }
+
+
+async def test_scheduler_sleeps_until_the_next_boundary(session, session_factory, clock):
+    badge = await BadgeService(session, clock=clock).create(
+        badge_in(T0 + timedelta(minutes=10), T0 + timedelta(hours=1))
+    )
+    scheduler = BadgeScheduler(session_factory, clock=clock, max_sleep=7200)
+
+    assert await scheduler.run_once() == 600
+    await clock.sleep(600)
+    assert await scheduler.run_once() == 3000
+    await session.refresh(badge)
+    assert badge.is_active
+
+    await clock.sleep(3000)
+    await scheduler.run_once()
+    await session.refresh(badge)
+    assert not badge.is_active
+
+
+async def test_scheduler_waits_at_most_max_sleep(session_factory, clock):
+    scheduler = BadgeScheduler(session_factory, clock=clock, max_sleep=60)
+
+    assert await scheduler.run_once() <= 60
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from app.schemas.event import EventCreate, EventOccurrenceUpdate, EventUpdate
+from app.services.event_service import EventService
+
+pytestmark = pytest.mark.anyio
+
+START = datetime(2030, 1, 7, 18, tzinfo=timezone.utc)
+
+
+def weekly(company, **values) -> EventCreate:
+    return EventCreate(
+        **{
+            "title": "Weekly meetup",
+            "start_time": START,
+            "end_time": START + timedelta(hours=2),
+            "company_id": company.id,
+            "recurrence_freq": "weekly",
+            **values,
+        }
+    )
+
+
+async def test_create_rejects_a_series_ending_before_it_starts(session, make_company):
+    event_in = weekly(await make_company(), recurrence_until=START - timedelta(days=1))
+
+    with pytest.raises(HTTPException) as error:
+        await EventService(session).create(event_in)
+    assert error.value.status_code == 400
+
+
+async def test_update_rejects_a_series_ending_before_it_starts(session, make_company):
+    service = EventService(session)
+    event = await service.create(weekly(await make_company()))
+
+    with pytest.raises(HTTPException) as error:
+        await service.update(event, EventUpdate(recurrence_until=START - timedelta(weeks=1)))
+    assert error.value.status_code == 400
+
+
+async def test_cancel_and_restore_an_occurrence(session, make_company):
+    service = EventService(session)
+    event = await service.create(weekly(await make_company(), recurrence_count=4))
+    second = START + timedelta(weeks=1)
+
+    assert await service.update_occurrence(event, second, EventOccurrenceUpdate(is_cancelled=True)) is None
+    restored = await service.update_occurrence(event, second, EventOccurrenceUpdate(is_cancelled=False))
+    assert restored.start_time == second
+
+
+def test_occurrence_cancellation_cannot_be_null():
+    with pytest.raises(ValidationError):
+        EventOccurrenceUpdate(is_cancelled=None)
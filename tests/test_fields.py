@@ -0,0 +1,50 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.fields import parse_fields
+from app.models import Member
+from app.schemas.member import MemberRead
+
+
+def test_relation_sub_fields_follow_the_read_schema():
+    selection = parse_fields("id,avatar.thumbnail,badges", Member, MemberRead)
+
+    assert selection.columns == ["id"]
+    assert selection.relations == {
+        "avatar": ["thumbnail"],
+        "badges": ["badge_id", "issued_at", "is_active"],
+    }
+
+
+@pytest.mark.parametrize("raw", ["badges.issued_by_id", "badges.member_id", "company.name", "password"])
+def test_fields_hidden_by_the_read_schema_are_rejected(raw):
+    with pytest.raises(HTTPException) as exc:
+        parse_fields(raw, Member, MemberRead)
+    assert exc.value.status_code == 400
+
+
+def test_response_is_validated_into_the_selected_fields():
+    selection = parse_fields("id,joined_at,avatar.thumbnail,badges.badge_id", Member, MemberRead)
+    member = SimpleNamespace(
+        id=uuid4(),
+        joined_at=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        wallet_key="not selected",
+        avatar=SimpleNamespace(thumbnail="t.png", original="o.png"),
+        badges=[SimpleNamespace(badge_id=uuid4(), issued_by_id=uuid4())],
+    )
+
+    body = json.loads(selection.response([member]).body)
+
+    assert body == [
+        {
+            "id": str(member.id),
+            "joined_at": "2024-01-02T00:00:00Z",
+            "avatar": {"thumbnail": "t.png"},
+            "badges": [{"badge_id": str(member.badges[0].badge_id)}],
+        }
+    ]
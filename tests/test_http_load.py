@@ -0,0 +1,33 @@
+from benchmarks.http_load import compare, percentile
+
+BASELINE = {
+    "me": {"p95_ms": 10.0, "qps": 1000.0},
+    "_meta": {"machine": "test", "seed_command": "python -m benchmarks.seed_data"},
+}
+
+
+def test_percentile_picks_the_nearest_rank():
+    values = [float(n) for n in range(1, 101)]
+    assert percentile(values, 50) == 51.0
+    assert percentile(values, 99) == 100.0
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_compare_accepts_changes_within_tolerance():
+    results = {"me": {"p95_ms": 11.0, "qps": 900.0}}
+    assert compare(results, BASELINE, tolerance=0.2)
+
+
+def test_compare_flags_slower_p95():
+    results = {"me": {"p95_ms": 13.0, "qps": 1000.0}}
+    assert not compare(results, BASELINE, tolerance=0.2)
+
+
+def test_compare_flags_lower_throughput():
+    results = {"me": {"p95_ms": 10.0, "qps": 700.0}}
+    assert not compare(results, BASELINE, tolerance=0.2)
+
+
+def test_compare_skips_scenarios_without_baseline():
+    results = {"members": {"p95_ms": 50.0, "qps": 10.0}}
+    assert compare(results, BASELINE, tolerance=0.2)
@@ -0,0 +1,9 @@
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.main import app
+
+
+def test_cors_is_the_outermost_middleware():
+    # Responses from every other middleware, such as load shedding's 503s,
+    # must pass through CORS to be readable by browsers
+    assert app.user_middleware[0].cls is CORSMiddleware
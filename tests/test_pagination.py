@@ -0,0 +1,31 @@
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.pagination import CursorPage, Page, cursor_pagination, pagination
+
+app = FastAPI()
+
+
+@app.get("/offset")
+def offset_page(page: Page = Depends(pagination(max_limit=100))):
+    return {"skip": page.skip, "limit": page.limit}
+
+
+@app.get("/cursor")
+def cursor_page(page: CursorPage = Depends(cursor_pagination(max_limit=200))):
+    return {"cursor": page.cursor, "limit": page.limit}
+
+
+client = TestClient(app)
+
+
+def test_pages_default_to_the_default_limit():
+    assert client.get("/offset").json() == {"skip": 0, "limit": 100}
+    assert client.get("/cursor").json() == {"cursor": None, "limit": 100}
+
+
+def test_limits_above_the_cap_are_rejected():
+    assert client.get("/offset", params={"limit": 100}).status_code == 200
+    assert client.get("/offset", params={"limit": 101}).status_code == 422
+    assert client.get("/cursor", params={"limit": 200}).status_code == 200
+    assert client.get("/cursor", params={"limit": 201}).status_code == 422
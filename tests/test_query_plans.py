@@ -0,0 +1,200 @@
+"""
+Query-plan checks for the service read paths, against data seeded with
+benchmarks.seed_data (skipped when DATABASE_URI is unset or not seeded).
+
+Each case calls a service method while recording the SELECT statements it
+sends (the main query and its eager loads), then runs them again under
+EXPLAIN (ANALYZE, FORMAT JSON) and checks that
+  - no plan node is a sequential scan of a table in LARGE_TABLES,
+  - every index listed for the case is used by one of its statements,
+  - row estimates are within ESTIMATE_FACTOR of the actual rows for nodes
+    returning at least MIN_ROWS rows, leaving out nodes a Limit may have
+    stopped early and scans of tables outside LARGE_TABLES.
+The cases double as the reference for the expected access path of each
+query: update them together with index or loader changes.
+
+    python -m benchmarks.seed_data
+    DATABASE_URI=postgresql+asyncpg://... pytest tests/test_query_plans.py
+"""
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, NamedTuple, Sequence, Tuple, Union
+
+import pytest
+from sqlalchemy import event, text
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.services.badge_service import BadgeService
+from app.services.event_service import EventService
+from app.services.member_service import MemberService
+from app.services.notification_service import NotificationService
+
+pytestmark = pytest.mark.anyio
+
+# Tables that grow with the member base; a sequential scan of one is a failure.
+# Small reference tables (companies, badges, notifications) may be scanned.
+LARGE_TABLES = {"members", "followers", "member_badges", "users", "events", "search_documents"}
+# Allowed estimate/actual row ratio, and the node size below which it is not checked
+ESTIMATE_FACTOR = 10
+MIN_ROWS = 100
+
+
+class Seeded(NamedTuple):
+    """Ids picked from the seeded data, favouring the heaviest rows."""
+
+    member_id: Any
+    follower_id: Any
+    company_id: Any
+    badge_id: Any
+
+    @classmethod
+    async def load(cls, session: AsyncSession) -> "Seeded":
+        async def scalar(sql: str) -> Any:
+            value = (await session.execute(text(sql))).scalar()
+            if value is None:
+                pytest.skip("no seed data found, run benchmarks.seed_data first")
+            return value
+
+        return cls(
+            member_id=await scalar(
+                "SELECT followed_id FROM followers GROUP BY followed_id ORDER BY count(*) DESC LIMIT 1"
+            ),
+            follower_id=await scalar(
+                "SELECT follower_id FROM followers GROUP BY follower_id ORDER BY count(*) DESC LIMIT 1"
+            ),
+            company_id=await scalar(
+                "SELECT company_id FROM members WHERE company_id IS NOT NULL "
+                "GROUP BY company_id ORDER BY count(*) DESC LIMIT 1"
+            ),
+            badge_id=await scalar(
+                "SELECT badge_id FROM member_badges GROUP BY badge_id ORDER BY count(*) DESC LIMIT 1"
+            ),
+        )
+
+
+class Case(NamedTuple):
+    call: Callable[[AsyncSession, Seeded], Awaitable[Any]]
+    # Indexes the statements of the call are expected to use; a tuple lists
+    # alternatives the planner picks between depending on the data
+    indexes: Sequence[Union[str, Tuple[str, ...]]] = ()
+
+
+CASES: Dict[str, Case] = {
+    "members_list": Case(
+        lambda session, seeded: MemberService(session).get_all(limit=20),
+        ("ix_members_created_at",),
+    ),
+    "member_by_id": Case(
+        lambda session, seeded: MemberService(session).get(seeded.member_id),
+        ("members_pkey", "ix_followers_followed_id_follower_id", "ix_followers_follower_id_followed_id"),
+    ),
+    "company_members": Case(
+        lambda session, seeded: MemberService(session).get_by_company(seeded.company_id, limit=20),
+        ("ix_members_company_id_joined_at",),
+    ),
+    "followers": Case(
+        lambda session, seeded: MemberService(session).get_followers(seeded.member_id, limit=20),
+        ("ix_followers_followed_id_follower_id",),
+    ),
+    "following": Case(
+        lambda session, seeded: MemberService(session).get_following(seeded.follower_id, limit=20),
+        ("ix_followers_follower_id_followed_id",),
+    ),
+    "active_notifications": Case(
+        lambda session, seeded: NotificationService(session).get_active_notifications(limit=20),
+    ),
+    "badge_holders": Case(
+        lambda session, seeded: BadgeService(session).get_badge_holders(seeded.badge_id, limit=20, active_only=True),
+        ("ix_member_badges_badge_active",),
+    ),
+    "member_badges": Case(
+        lambda session, seeded: BadgeService(session).get_member_badges(seeded.member_id, active_only=True),
+        (("ix_member_badges_member_active", "uq_member_badges_member_badge"),),
+    ),
+    "leaderboard": Case(
+        lambda session, seeded: BadgeService(session).get_leaderboard(limit=10),
+        ("ix_members_badge_count",),
+    ),
+    "events_list": Case(
+        lambda session, seeded: EventService(session).get_all(limit=20),
+        ("ix_events_start_time_id",),
+    ),
+    "company_events": Case(
+        lambda session, seeded: EventService(session).get_all(company_id=seeded.company_id, limit=20),
+        ("ix_events_company_id_start_time",),
+    ),
+}
+
+
+def plan_nodes(node: Dict[str, Any], limited: bool = False) -> Iterator[Tuple[Dict[str, Any], bool]]:
+    """Every node, and whether a Limit above it may have stopped it early."""
+    yield node, limited
+    for child in node.get("Plans", ()):
+        yield from plan_nodes(child, limited or node["Node Type"] == "Limit")
+
+
+def describe(node: Dict[str, Any], depth: int = 0) -> List[str]:
+    """One line per plan node: type, relation, index, estimated and actual rows."""
+    target = " ".join(
+        part for part in (node.get("Relation Name"), node.get("Index Name") and f"using {node['Index Name']}") if part
+    )
+    lines = [
+        f"{'  ' * depth}{node['Node Type']} {target}".rstrip()
+        + f"  (rows est {node['Plan Rows']}, actual {node.get('Actual Rows', '-')})"
+    ]
+    for child in node.get("Plans", ()):
+        lines.extend(describe(child, depth + 1))
+    return lines
+
+
+async def capture(session: AsyncSession, case: Case, seeded: Seeded) -> List[Tuple[str, Any]]:
+    """The SELECT statements (with parameters) a call sends."""
+    statements: List[Tuple[str, Any]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().lower().startswith(("select", "with")):
+            statements.append((statement, parameters))
+
+    connection = (await session.connection()).sync_connection
+    event.listen(connection, "before_cursor_execute", record)
+    try:
+        await case.call(session, seeded)
+    finally:
+        event.remove(connection, "before_cursor_execute", record)
+    return statements
+
+
+@pytest.mark.parametrize("name", list(CASES))
+async def test_query_plan(session: AsyncSession, name: str):
+    seeded = await Seeded.load(session)
+    case = CASES[name]
+    failures: List[str] = []
+    plans: List[str] = []
+    used_indexes = set()
+    connection = await session.connection()
+    for statement, parameters in await capture(session, case, seeded):
+        result = await connection.exec_driver_sql(f"EXPLAIN (ANALYZE, FORMAT JSON) {statement}", parameters)
+        plan = result.scalar_one()[0]["Plan"]
+        plans.append(" ".join(statement.split())[:160])
+        plans.extend(f"  {line}" for line in describe(plan))
+
+        for node, limited in plan_nodes(plan):
+            relation = node.get("Relation Name")
+            if node.get("Index Name"):
+                used_indexes.add(node["Index Name"])
+            if node["Node Type"] == "Seq Scan" and relation in LARGE_TABLES:
+                failures.append(f"sequential scan on {relation}")
+            actual = node.get("Actual Rows", 0)
+            estimated = node["Plan Rows"]
+            # Under a Limit the actual rows are only those needed; small tables don't matter
+            if limited or (relation and relation not in LARGE_TABLES):
+                continue
+            if max(actual, estimated) >= MIN_ROWS:
+                ratio = max(actual, estimated) / max(min(actual, estimated), 1)
+                if ratio > ESTIMATE_FACTOR:
+                    target = f" on {relation}" if relation else ""
+                    failures.append(f"{node['Node Type']}{target} estimated {estimated} rows, got {actual}")
+
+    for index in case.indexes:
+        alternatives = (index,) if isinstance(index, str) else index
+        if not used_indexes.intersection(alternatives):
+            failures.append(f"expected index {' or '.join(alternatives)} not used")
+    assert not failures, "\n".join([*failures, "", *plans])
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models.event_registration import REGISTERED
+from app.schemas.event import EventCreate
+from app.services.company_service import CompanyService
+from app.services.event_service import EventService
+from app.services.member_service import MemberService
+from app.services.registration_service import RegistrationService
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_event(session, company, start: datetime, **recurrence):
+    event_in = EventCreate(
+        title="Weekly meetup",
+        start_time=start,
+        end_time=start + timedelta(hours=2),
+        company_id=company.id,
+        **recurrence,
+    )
+    return await EventService(session).create(event_in)
+
+
+async def test_register_for_a_running_series_after_its_first_occurrence(session, make_company, make_member):
+    start = datetime.now(timezone.utc) - timedelta(weeks=3)
+    event = await create_event(session, await make_company(), start, recurrence_freq="weekly")
+    member = await make_member()
+
+    registration, created = await RegistrationService(session).register(event.id, member.id)
+
+    assert created
+    assert registration.status == REGISTERED
+
+
+async def test_register_for_a_bounded_series_before_its_last_occurrence(session, make_company, make_member):
+    now = datetime.now(timezone.utc)
+    event = await create_event(
+        session, await make_company(), now - timedelta(weeks=3),
+        recurrence_freq="weekly", recurrence_until=now + timedelta(weeks=2),
+    )
+    member = await make_member()
+
+    registration, created = await RegistrationService(session).register(event.id, member.id)
+
+    assert created
+    assert registration.status == REGISTERED
+
+
+async def test_register_after_a_series_has_ended(session, make_company, make_member):
+    start = datetime.now(timezone.utc) - timedelta(weeks=5)
+    event = await create_event(session, await make_company(), start, recurrence_freq="weekly", recurrence_count=3)
+    member = await make_member()
+
+    with pytest.raises(HTTPException) as error:
+        await RegistrationService(session).register(event.id, member.id)
+    assert error.value.status_code == 400
+
+
+async def test_register_after_a_single_event_has_ended(session, make_company, make_member):
+    event = await create_event(session, await make_company(), datetime.now(timezone.utc) - timedelta(days=1))
+    member = await make_member()
+
+    with pytest.raises(HTTPException) as error:
+        await RegistrationService(session).register(event.id, member.id)
+    assert error.value.status_code == 400
+
+
+async def test_deleting_members_frees_their_seats(session, make_company, make_member):
+    event = await create_event(session, await make_company(), datetime.now(timezone.utc) + timedelta(days=7))
+    event.capacity = 3
+    await session.commit()
+    leaving_company = await make_company()
+    leaving = [await make_member(company_id=leaving_company.id) for _ in range(2)]
+    leaving_alone = await make_member()
+    waiting = [await make_member() for _ in range(3)]
+    service = RegistrationService(session)
+    for member in [*leaving, leaving_alone, *waiting]:
+        await service.register(event.id, member.id)
+
+    await MemberService(session).delete(leaving_alone)
+    await CompanyService(session).delete(leaving_company)
+
+    await session.refresh(event)
+    assert event.registered_count == 3
+    statuses = [(await service._get(event.id, member.id)).status for member in waiting]
+    assert statuses == [REGISTERED, REGISTERED, REGISTERED]